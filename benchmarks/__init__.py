@@ -0,0 +1,6 @@
+from .compare import find_regressions
+from .runner import MODES, PROVIDERS, run_isolated, run_scenario, run_suite
+from .workloads import Workload, build_workloads
+
+__all__ = ['MODES', 'PROVIDERS', 'Workload', 'build_workloads', 'find_regressions', 'run_isolated', 'run_scenario',
+           'run_suite']
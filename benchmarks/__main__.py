@@ -0,0 +1,59 @@
+import argparse
+import json
+import logging
+import sys
+from typing import List
+from .compare import find_regressions
+from .runner import MODES, PROVIDERS, run_suite
+from .workloads import build_workloads
+
+
+def main(argv: List[str] = None) -> int:
+    workload_names = sorted(build_workloads())
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark storage providers and transfer modes.")
+    parser.add_argument("--providers", nargs="+", choices=sorted(PROVIDERS), default=sorted(PROVIDERS))
+    parser.add_argument("--workloads", nargs="+", choices=workload_names, default=workload_names)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8])
+    parser.add_argument("--processes", type=int,
+                        help="run batches on a process pool of this size (local provider only)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplier applied to file counts and large file sizes")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report; exit non-zero on throughput regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed fractional throughput drop against --baseline")
+    parser.add_argument("--verbose", action="store_true", help="keep per-transfer log output")
+    args = parser.parse_args(argv)
+    if any(workers < 1 for workers in args.concurrency):
+        parser.error("--concurrency values must be at least 1")
+    if args.scale <= 0:
+        parser.error("--scale must be positive")
+    if args.processes is not None and (args.processes < 1 or set(args.providers) != {"local"}):
+        parser.error("--processes must be at least 1 and requires --providers local")
+
+    workloads = build_workloads(args.scale)
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    try:
+        report = run_suite(args.providers, [workloads[name] for name in args.workloads], args.modes,
+                           args.concurrency, args.processes)
+    finally:
+        logging.disable(logging.NOTSET)
+    report["parameters"] = {key: value for key, value in vars(args).items()
+                            if key not in ("output", "baseline", "verbose")}
+    if args.baseline:
+        with open(args.baseline) as source:
+            report["regressions"] = find_regressions(json.load(source), report, args.tolerance)
+    if args.output:
+        with open(args.output, "w") as target:
+            json.dump(report, target, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
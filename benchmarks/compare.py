@@ -0,0 +1,27 @@
+from typing import Dict, List, Tuple
+
+ScenarioKey = Tuple[str, str, str, int, int]
+
+
+def _key(scenario: dict) -> ScenarioKey:
+    return (scenario["provider"], scenario["workload"], scenario["mode"], scenario["concurrency"],
+            scenario.get("processes", 0))
+
+
+def find_regressions(baseline: dict, current: dict, tolerance: float = 0.10) -> List[dict]:
+    previous: Dict[ScenarioKey, dict] = {_key(scenario): scenario for scenario in baseline["scenarios"]}
+    regressions = []
+    for scenario in current["scenarios"]:
+        before = previous.get(_key(scenario))
+        if before is None or not before["throughput_mb_s"]:
+            continue
+        change = scenario["throughput_mb_s"] / before["throughput_mb_s"] - 1.0
+        if change < -tolerance:
+            provider, workload, mode, concurrency, processes = _key(scenario)
+            regressions.append({
+                "provider": provider, "workload": workload, "mode": mode, "concurrency": concurrency,
+                "processes": processes,
+                "baseline_mb_s": before["throughput_mb_s"], "current_mb_s": scenario["throughput_mb_s"],
+                "change": round(change, 4),
+            })
+    return regressions
@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Iterable, List
+
+DEFAULT_STATEMENT = "from src.factories import LocalDiskStorageFactory"
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 150.0
+HEAVY_MODULES = ("src.products.amazon", "src.products.google", "boto3", "botocore", "google.cloud")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+started = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - started
+json.dump({"seconds": elapsed, "modules": sorted(set(sys.modules) - before)}, sys.stdout)
+"""
+
+
+def _is_heavy(module: str, heavy: Iterable[str]) -> bool:
+    return any(module == prefix or module.startswith(prefix + ".") for prefix in heavy)
+
+
+def measure_import(statement: str = DEFAULT_STATEMENT, runs: int = DEFAULT_RUNS,
+                   heavy: Iterable[str] = HEAVY_MODULES) -> dict:
+    heavy = tuple(heavy)
+    timings: List[float] = []
+    modules: List[str] = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-c", _PROBE, statement], cwd=PROJECT_ROOT,
+                                   capture_output=True, text=True, check=True)
+        probe = json.loads(completed.stdout)
+        timings.append(probe["seconds"] * 1000)
+        modules = probe["modules"]
+    return {
+        "statement": statement,
+        "runs": runs,
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "modules_loaded": len(modules),
+        "heavy_modules": [module for module in modules if _is_heavy(module, heavy)],
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time",
+                                     description="Measure cold-start import time in a fresh interpreter.")
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT, help="import statement to time")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="exit 1 if the median import time exceeds this budget")
+    parser.add_argument("--allow-heavy", action="store_true",
+                        help="do not fail when cloud provider modules are imported")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    report = measure_import(args.statement, args.runs)
+    report["budget_ms"] = args.budget_ms
+    report["regressed"] = report["median_ms"] > args.budget_ms or bool(
+        report["heavy_modules"] and not args.allow_heavy)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if report["regressed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import math
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_bytes(children: bool = False) -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def child_cpu_seconds() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class Measurement:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    child_cpu_seconds: float = 0.0
+
+    def __enter__(self) -> "Measurement":
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._child_cpu = child_cpu_seconds()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.wall_seconds = time.perf_counter() - self._wall
+        self.child_cpu_seconds = child_cpu_seconds() - self._child_cpu
+        self.cpu_seconds = time.process_time() - self._cpu + self.child_cpu_seconds
+
+
+def summarize(measurement: Measurement, latencies: List[float], files: int, total_bytes: int) -> dict:
+    wall = measurement.wall_seconds or 1e-9
+    return {
+        "files": files,
+        "bytes": total_bytes,
+        "wall_seconds": round(measurement.wall_seconds, 6),
+        "cpu_seconds": round(measurement.cpu_seconds, 6),
+        "child_cpu_seconds": round(measurement.child_cpu_seconds, 6),
+        "throughput_mb_s": round(total_bytes / wall / 1e6, 3),
+        "files_per_second": round(files / wall, 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+        },
+        "peak_rss_bytes": peak_rss_bytes(),
+        "child_peak_rss_bytes": peak_rss_bytes(children=True),
+    }
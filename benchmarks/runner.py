@@ -0,0 +1,112 @@
+import logging
+import multiprocessing
+import platform
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.interfaces import IStorageFactory
+from .metrics import Measurement, summarize
+from .workloads import Workload
+
+UPLOAD = "upload"
+DOWNLOAD = "download"
+MODES = (UPLOAD, DOWNLOAD)
+PART_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class Provider:
+    name: str
+    create: Callable[[Path, int], IStorageFactory]
+    remote_root: Callable[[Path], str]
+
+
+def _object_store_factory(factory_class) -> Callable[[Path, int], IStorageFactory]:
+    def create(workdir: Path, concurrency: int) -> IStorageFactory:
+        store = InMemoryObjectStore()
+        return factory_class(client_factory=store.client, max_concurrency=PART_CONCURRENCY,
+                             max_connections=concurrency * PART_CONCURRENCY)
+    return create
+
+
+PROVIDERS: Dict[str, Provider] = {
+    "local": Provider("local", lambda workdir, concurrency: LocalDiskStorageFactory(),
+                      lambda workdir: str(workdir / "store")),
+    "s3": Provider("s3", _object_store_factory(AmazonStorageFactory), lambda workdir: "s3://bench"),
+    "gcs": Provider("gcs", _object_store_factory(GoogleStorageFactory), lambda workdir: "gs://bench"),
+}
+
+
+def _remote(root: str, name: str) -> str:
+    return f"{root}/{name}" if "://" in root else str(Path(root) / name)
+
+
+def run_scenario(provider: Provider, workload: Workload, mode: str, concurrency: int, processes: int = None) -> dict:
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    workdir = Path(tempfile.mkdtemp(prefix="storage-bench-"))
+    try:
+        files = workload.materialize(workdir / "source")
+        root = provider.remote_root(workdir)
+        uploads: List[Tuple[str, str]] = [(str(path), _remote(root, path.name)) for path in files]
+        with provider.create(workdir, concurrency) as factory:
+            if mode == DOWNLOAD:
+                ServiceRunner(factory, max_workers=concurrency).upload_many(uploads)
+            service = ServiceRunner(factory, max_workers=concurrency, processes=processes)
+            with Measurement() as measurement:
+                if mode == UPLOAD:
+                    results = service.upload_many(uploads)
+                else:
+                    results = service.download_many([(remote, str(workdir / "restored" / Path(local).name))
+                                                     for local, remote in uploads])
+                service.close()
+
+        failed = [result for result in results if not result.success]
+        if failed:
+            raise RuntimeError(f"{len(failed)} transfers failed, first error: {failed[0].error}")
+        report = summarize(measurement, [result.duration for result in results], len(results),
+                           workload.total_bytes)
+        report.update({"provider": provider.name, "workload": workload.name, "mode": mode,
+                       "concurrency": concurrency, "processes": processes or 0})
+        return report
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _run_named_scenario(provider: str, workload: Workload, mode: str, concurrency: int, processes: int,
+                        disabled_level: int) -> dict:
+    logging.disable(disabled_level)
+    return run_scenario(PROVIDERS[provider], workload, mode, concurrency, processes)
+
+
+def run_isolated(provider: str, workload: Workload, mode: str, concurrency: int, processes: int = None) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_run_named_scenario, provider, workload, mode, concurrency, processes,
+                               logging.root.manager.disable).result()
+
+
+def run_suite(providers: Iterable[str], workloads: Iterable[Workload], modes: Iterable[str],
+              concurrency: Iterable[int], processes: int = None) -> dict:
+    scenarios = [
+        run_isolated(provider, workload, mode, workers, processes)
+        for provider in providers
+        for workload in workloads
+        for mode in modes
+        for workers in concurrency
+    ]
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "scenarios": scenarios,
+    }
@@ -0,0 +1,44 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    sizes: List[int]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes)
+
+    def materialize(self, directory: Path) -> List[Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for index, size in enumerate(self.sizes):
+            path = directory / f"{self.name}-{index:05d}.bin"
+            with open(path, "wb") as target:
+                remaining = size
+                while remaining:
+                    chunk = min(remaining, MiB)
+                    target.write(os.urandom(chunk))
+                    remaining -= chunk
+            paths.append(path)
+        return paths
+
+
+def _scaled(value: int, scale: float) -> int:
+    return max(1, int(value * scale))
+
+
+def build_workloads(scale: float = 1.0) -> Dict[str, Workload]:
+    mixed = [4 * KiB] * _scaled(200, scale) + [256 * KiB] * _scaled(20, scale) + [_scaled(16 * MiB, scale)] * 2
+    return {
+        "small": Workload("small", [4 * KiB] * _scaled(1000, scale)),
+        "large": Workload("large", [_scaled(64 * MiB, scale)] * 2),
+        "mixed": Workload("mixed", mixed),
+    }
@@ -3,9 +3,11 @@ from pathlib import Path
 from src.factories import AmazonStorageFactory, LocalDiskStorageFactory, GoogleStorageFactory
 from src.client import ServiceRunner
 from src.exceptions import StorageOperationError
+from src.utils import configure_logging
 
 
 def main():
+    configure_logging(asynchronous=False)
     print("=== Multi-Cloud Storage Provider Demo ===\n")
     
     print("1. Testing Amazon S3 Storage (Mock)")
@@ -0,0 +1,4 @@
+from .connection_pool import ConnectionPool
+from .in_memory_object_store import InMemoryObjectStore, InMemoryObjectStoreClient
+
+__all__ = ['ConnectionPool', 'InMemoryObjectStore', 'InMemoryObjectStoreClient']
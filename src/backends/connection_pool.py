@@ -0,0 +1,133 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Iterator, List, Tuple, TypeVar
+from src.exceptions import StorageOperationError, TransientStorageError
+
+T = TypeVar("T")
+
+
+class ConnectionPool(Generic[T]):
+    def __init__(self, create: Callable[[], T], max_size: int = 10, idle_timeout: float = 60.0,
+                 acquire_timeout: float = 30.0):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._create = create
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._acquire_timeout = acquire_timeout
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[T, float]] = []
+        self._in_use = 0
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"create": self._create, "max_size": self._max_size, "idle_timeout": self._idle_timeout,
+                "acquire_timeout": self._acquire_timeout}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @property
+    def size(self) -> int:
+        with self._condition:
+            return self._in_use + len(self._idle)
+
+    @property
+    def idle(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @contextmanager
+    def connection(self) -> Iterator[T]:
+        connection = self.acquire()
+        try:
+            yield connection
+        except (OSError, ConnectionError):
+            self.discard(connection)
+            raise
+        except BaseException:
+            self.release(connection)
+            raise
+        else:
+            self.release(connection)
+
+    def acquire(self) -> T:
+        deadline = time.monotonic() + self._acquire_timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise StorageOperationError("Connection pool is closed")
+                self._evict_expired(time.monotonic())
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    self._in_use += 1
+                    self.reused += 1
+                    return connection
+                if self._in_use < self._max_size:
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise TransientStorageError(f"Timed out waiting for a connection ({self._max_size} in use)")
+
+        try:
+            connection = self._create()
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.created += 1
+        return connection
+
+    def release(self, connection: T) -> None:
+        with self._condition:
+            self._in_use -= 1
+            if not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+        _close(connection)
+
+    def discard(self, connection: T) -> None:
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+        _close(connection)
+
+    def evict_idle(self) -> int:
+        with self._condition:
+            return self._evict_expired(time.monotonic())
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for connection, _ in idle:
+            _close(connection)
+
+    def _evict_expired(self, now: float) -> int:
+        expired = [connection for connection, last_used in self._idle if now - last_used >= self._idle_timeout]
+        if expired:
+            self._idle = [(connection, last_used) for connection, last_used in self._idle
+                          if now - last_used < self._idle_timeout]
+            self.evicted += len(expired)
+            for connection in expired:
+                _close(connection)
+        return len(expired)
+
+
+def _close(connection: object) -> None:
+    close = getattr(connection, "close", None)
+    if close is not None:
+        close()
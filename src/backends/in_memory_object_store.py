@@ -0,0 +1,147 @@
+import hashlib
+import threading
+import uuid
+from typing import Dict, List, Tuple
+from src.interfaces.object_store_client import IObjectStoreClient, ObjectInfo
+from src.exceptions import FileNotFoundError, InvalidPathError
+
+
+class _StoredObject:
+    __slots__ = ("data", "etag", "metadata")
+
+    def __init__(self, data: bytes, etag: str, metadata: Dict[str, str]):
+        self.data = data
+        self.etag = etag
+        self.metadata = metadata
+
+
+class InMemoryObjectStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._objects: Dict[Tuple[str, str], _StoredObject] = {}
+        self._uploads: Dict[str, Tuple[str, str, Dict[str, str], Dict[int, bytes]]] = {}
+        self.request_count = 0
+        self.clients_created = 0
+
+    def client(self) -> "InMemoryObjectStoreClient":
+        with self._lock:
+            self.clients_created += 1
+        return InMemoryObjectStoreClient(self)
+
+    def keys(self, bucket: str) -> List[str]:
+        with self._lock:
+            return sorted(key for stored_bucket, key in self._objects if stored_bucket == bucket)
+
+    def pending_uploads(self) -> int:
+        with self._lock:
+            return len(self._uploads)
+
+    def _count(self, client: "InMemoryObjectStoreClient") -> None:
+        if client.closed:
+            raise ConnectionError("Client connection is closed")
+        self.request_count += 1
+
+    def _store(self, bucket: str, key: str, data: bytes, etag: str, metadata: Dict[str, str]) -> str:
+        self._objects[(bucket, key)] = _StoredObject(data, etag, dict(metadata or {}))
+        return etag
+
+    def _get(self, bucket: str, key: str) -> _StoredObject:
+        stored = self._objects.get((bucket, key))
+        if stored is None:
+            raise FileNotFoundError(f"Object not found: {bucket}/{key}")
+        return stored
+
+
+class InMemoryObjectStoreClient(IObjectStoreClient):
+    def __init__(self, store: InMemoryObjectStore):
+        self._store = store
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    def put_object(self, bucket: str, key: str, data: bytes, metadata: Dict[str, str] = None) -> str:
+        data = bytes(data)
+        with self._store._lock:
+            self._store._count(self)
+            return self._store._store(bucket, key, data, hashlib.md5(data).hexdigest(), metadata)
+
+    def get_object(self, bucket: str, key: str, start: int = 0, end: int = None) -> bytes:
+        with self._store._lock:
+            self._store._count(self)
+            data = self._store._get(bucket, key).data
+        return data[start:end]
+
+    def head_object(self, bucket: str, key: str) -> ObjectInfo:
+        with self._store._lock:
+            self._store._count(self)
+            stored = self._store._get(bucket, key)
+            return ObjectInfo(bucket, key, len(stored.data), stored.etag, dict(stored.metadata))
+
+    def list_objects(self, bucket: str, prefix: str = "", start_after: str = None,
+                     max_keys: int = 1000) -> List[ObjectInfo]:
+        with self._store._lock:
+            self._store._count(self)
+            keys = sorted(
+                key for stored_bucket, key in self._store._objects
+                if stored_bucket == bucket and key.startswith(prefix) and (start_after is None or key > start_after)
+            )[:max_keys]
+            return [
+                ObjectInfo(bucket, key, len(stored.data), stored.etag, dict(stored.metadata))
+                for key, stored in ((key, self._store._objects[(bucket, key)]) for key in keys)
+            ]
+
+    def delete_object(self, bucket: str, key: str) -> None:
+        with self._store._lock:
+            self._store._count(self)
+            self._store._objects.pop((bucket, key), None)
+
+    def create_multipart_upload(self, bucket: str, key: str, metadata: Dict[str, str] = None) -> str:
+        upload_id = uuid.uuid4().hex
+        with self._store._lock:
+            self._store._count(self)
+            self._store._uploads[upload_id] = (bucket, key, dict(metadata or {}), {})
+        return upload_id
+
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        data = bytes(data)
+        with self._store._lock:
+            self._store._count(self)
+            parts = self._upload(bucket, key, upload_id)[3]
+            parts[part_number] = data
+        return hashlib.md5(data).hexdigest()
+
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str,
+                                  parts: List[Tuple[int, str]]) -> str:
+        with self._store._lock:
+            self._store._count(self)
+            _, _, metadata, uploaded = self._upload(bucket, key, upload_id)
+            chunks = []
+            digests = hashlib.md5()
+            for part_number, etag in sorted(parts):
+                data = uploaded.get(part_number)
+                if data is None or hashlib.md5(data).hexdigest() != etag:
+                    raise InvalidPathError(f"Invalid part {part_number} for upload {upload_id}")
+                chunks.append(data)
+                digests.update(bytes.fromhex(etag))
+            del self._store._uploads[upload_id]
+            etag = f"{digests.hexdigest()}-{len(parts)}"
+            return self._store._store(bucket, key, b"".join(chunks), etag, metadata)
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        with self._store._lock:
+            self._store._count(self)
+            self._store._uploads.pop(upload_id, None)
+
+    def compose_object(self, bucket: str, key: str, sources: List[str], metadata: Dict[str, str] = None) -> str:
+        with self._store._lock:
+            self._store._count(self)
+            data = b"".join(self._store._get(bucket, source).data for source in sources)
+            etag = f"{hashlib.md5(data).hexdigest()}-{len(sources)}"
+            return self._store._store(bucket, key, data, etag, metadata)
+
+    def _upload(self, bucket: str, key: str, upload_id: str):
+        upload = self._store._uploads.get(upload_id)
+        if upload is None or upload[0] != bucket or upload[1] != key:
+            raise FileNotFoundError(f"Multipart upload not found: {upload_id}")
+        return upload
@@ -0,0 +1,4 @@
+from .disk_cache import DEFAULT_MAX_BYTES, DiskCache
+from .caching_downloader import CachingDownloader
+
+__all__ = ['DEFAULT_MAX_BYTES', 'DiskCache', 'CachingDownloader']
@@ -0,0 +1,63 @@
+import os
+import time
+from typing import BinaryIO, Optional
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.exceptions import StorageOperationError, classify_error
+from .disk_cache import CacheKey, DiskCache
+
+
+class CachingDownloader(IFileDownloader):
+    provider_name = "cache"
+
+    def __init__(self, downloader: IFileDownloader, inspector: IFileInspector, cache: DiskCache,
+                 provider: str = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._downloader = downloader
+        self._inspector = inspector
+        self._cache = cache
+        self._provider = provider or getattr(downloader, "provider_name", type(downloader).__name__)
+
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        key = self._key(source)
+        if key is None:
+            return self._downloader.download(source, destination)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+            hit = self._cache.fetch(key, destination, lambda path: self._downloader.download(source, path))
+            self._logger.debug("Cache %s for %s", "hit" if hit else "miss", source)
+            return TransferResult.completed(source, destination, started, os.path.getsize(destination),
+                                            "cache-hit" if hit else "cache-miss", key[2])
+
+        except StorageOperationError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to download %s to %s through cache: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        key = self._key(source)
+        path = self._cache.lookup(key) if key is not None else None
+        if path is not None:
+            try:
+                return open(path, "rb", buffering=buffer_size or -1)
+            except OSError:
+                pass
+        return self._downloader.open_read(source, buffer_size)
+
+    def _key(self, source: str) -> Optional[CacheKey]:
+        metadata = self._inspector.stat(source)
+        if metadata is None:
+            return None
+        if metadata.etag or metadata.content_hash:
+            version = metadata.etag or metadata.content_hash
+        elif metadata.modified_ns is not None:
+            version = f"{metadata.size}:{metadata.modified_ns}"
+        else:
+            return None
+        return self._provider, source, version
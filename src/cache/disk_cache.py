@@ -0,0 +1,211 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+from src.products.local.copy_engine import AUTO, copy_file
+
+INDEX_FILE = "index.sqlite3"
+OBJECTS_DIR = "objects"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+CacheKey = Tuple[str, str, str]
+
+
+class _Fetch:
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class DiskCache:
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, hardlink: bool = False,
+                 copy_strategy: str = AUTO):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self._directory = directory
+        self._objects = os.path.join(directory, OBJECTS_DIR)
+        os.makedirs(self._objects, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._hardlink = hardlink
+        self._copy_strategy = copy_strategy
+        self._lock = threading.Lock()
+        self._fetches: Dict[str, _Fetch] = {}
+        self._pins: Dict[str, int] = {}
+        self._db = sqlite3.connect(os.path.join(directory, INDEX_FILE), check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "digest TEXT PRIMARY KEY, provider TEXT, uri TEXT, version TEXT, size INTEGER, last_access REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_by_access ON entries (last_access)")
+        self._total_bytes = self._reconcile()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_hit = 0
+        self.bytes_missed = 0
+        self.evictions = 0
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def lookup(self, key: CacheKey) -> Optional[str]:
+        digest = _digest(key)
+        with self._lock:
+            row = self._db.execute("SELECT size FROM entries WHERE digest = ?", (digest,)).fetchone()
+            if row is None or not os.path.exists(self._path(digest)):
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        return self._path(digest)
+
+    def fetch(self, key: CacheKey, destination: str, populate: Callable[[str], None]) -> bool:
+        digest = _digest(key)
+        while True:
+            with self._lock:
+                if self._serve_locked(digest):
+                    break
+                fetch = self._fetches.get(digest)
+                owner = fetch is None
+                if owner:
+                    fetch = self._fetches[digest] = _Fetch()
+            if owner:
+                try:
+                    self._populate(key, digest, populate)
+                except BaseException as e:
+                    fetch.error = e
+                    raise
+                finally:
+                    with self._lock:
+                        del self._fetches[digest]
+                    fetch.done.set()
+                self._materialize(digest, destination)
+                return False
+            fetch.done.wait()
+            if fetch.error is not None:
+                raise fetch.error
+
+        self._materialize(digest, destination)
+        with self._lock:
+            self.hits += 1
+            self.bytes_hit += os.path.getsize(destination)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            for (digest,) in self._db.execute("SELECT digest FROM entries").fetchall():
+                if not self._pins.get(digest):
+                    self._remove_locked(digest)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _serve_locked(self, digest: str) -> bool:
+        row = self._db.execute("SELECT size FROM entries WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return False
+        if not os.path.exists(self._path(digest)):
+            self._db.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            self._total_bytes -= row[0]
+            return False
+        self._db.execute("UPDATE entries SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        self._pins[digest] = self._pins.get(digest, 0) + 1
+        return True
+
+    def _populate(self, key: CacheKey, digest: str, populate: Callable[[str], None]) -> None:
+        temporary = os.path.join(self._objects, f".tmp-{uuid.uuid4().hex}")
+        try:
+            populate(temporary)
+            size = os.path.getsize(temporary)
+            path = self._path(digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        provider, uri, version = key
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM entries WHERE digest = ?", (digest,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                             (digest, provider, uri, version, size, time.time()))
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._pins[digest] = self._pins.get(digest, 0) + 1
+            self.misses += 1
+            self.bytes_missed += size
+            self._evict_locked(keep=digest)
+
+    def _materialize(self, digest: str, destination: str) -> None:
+        try:
+            source = self._path(digest)
+            partial = f"{destination}.partial"
+            if os.path.exists(partial):
+                os.remove(partial)
+            if self._hardlink:
+                try:
+                    os.link(source, partial)
+                except OSError:
+                    copy_file(source, partial, self._copy_strategy)
+            else:
+                copy_file(source, partial, self._copy_strategy)
+            os.replace(partial, destination)
+        finally:
+            with self._lock:
+                self._pins[digest] -= 1
+                if not self._pins[digest]:
+                    del self._pins[digest]
+                self._evict_locked()
+
+    def _evict_locked(self, keep: str = None) -> None:
+        if self._total_bytes <= self._max_bytes:
+            return
+        rows = self._db.execute("SELECT digest FROM entries ORDER BY last_access").fetchall()
+        for (digest,) in rows:
+            if self._total_bytes <= self._max_bytes:
+                break
+            if digest == keep or self._pins.get(digest):
+                continue
+            self._remove_locked(digest)
+            self.evictions += 1
+
+    def _remove_locked(self, digest: str) -> None:
+        row = self._db.execute("SELECT size FROM entries WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return
+        self._db.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+        self._total_bytes -= row[0]
+        try:
+            os.remove(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _reconcile(self) -> int:
+        total = 0
+        for digest, size in self._db.execute("SELECT digest, size FROM entries").fetchall():
+            if os.path.exists(self._path(digest)):
+                total += size
+            else:
+                self._db.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+        return total
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self._objects, digest[:2], digest)
+
+
+def _digest(key: CacheKey) -> str:
+    return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
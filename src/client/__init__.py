@@ -1,4 +1,12 @@
+from .batch_result import BatchItemResult
+from .sync_report import SyncReport
+from .transfer_summary import TransferAggregator, TransferSummary, summarize
+from .write_behind import SpooledItem, WriteBehindQueue
 from .service_runner import ServiceRunner
+from .async_service_runner import AsyncServiceRunner
+from .replication_result import ReplicationResult
+from .replicating_service_runner import ReplicatingServiceRunner
 
-__all__ = ['ServiceRunner']
-
+__all__ = ['ServiceRunner', 'AsyncServiceRunner', 'BatchItemResult', 'SyncReport', 'SpooledItem',
+           'WriteBehindQueue', 'ReplicatingServiceRunner', 'ReplicationResult', 'TransferAggregator',
+           'TransferSummary', 'summarize']
@@ -0,0 +1,65 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.exceptions import StorageOperationError
+from .batch_result import BatchItemResult
+
+
+class AsyncServiceRunner:
+    def __init__(self, storage_factory: IStorageFactory, max_concurrency: int = 100):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._uploader: IAsyncFileUploader = storage_factory.create_async_uploader()
+        self._downloader: IAsyncFileDownloader = storage_factory.create_async_downloader()
+        self._max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore = None
+        self._semaphore_loop: asyncio.AbstractEventLoop = None
+
+    async def upload_file(self, file_path: str, destination: str) -> TransferResult:
+        async with self._get_semaphore():
+            return await self._uploader.upload(file_path, destination)
+
+    async def download_file(self, source: str, destination: str) -> TransferResult:
+        async with self._get_semaphore():
+            return await self._downloader.download(source, destination)
+
+    async def upload_many(self, pairs: Iterable[Tuple[str, str]]) -> List[BatchItemResult]:
+        return await self._run_batch(self.upload_file, pairs, size_of_source=True)
+
+    async def download_many(self, pairs: Iterable[Tuple[str, str]]) -> List[BatchItemResult]:
+        return await self._run_batch(self.download_file, pairs, size_of_source=False)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_batch(self, transfer: Callable[[str, str], Awaitable[TransferResult]],
+                         pairs: Iterable[Tuple[str, str]], size_of_source: bool) -> List[BatchItemResult]:
+        items = enumerate(pairs)
+        results: Dict[int, BatchItemResult] = {}
+
+        async def worker() -> None:
+            for index, (source, destination) in items:
+                results[index] = await self._run_item(transfer, source, destination, size_of_source)
+
+        await asyncio.gather(*(worker() for _ in range(self._max_concurrency)))
+        return [results[index] for index in range(len(results))]
+
+    @staticmethod
+    async def _run_item(transfer: Callable[[str, str], Awaitable[TransferResult]], source: str, destination: str,
+                        size_of_source: bool) -> BatchItemResult:
+        started = time.perf_counter()
+        try:
+            result = await transfer(source, destination)
+        except StorageOperationError as e:
+            return BatchItemResult(source, destination, False, error=e,
+                                   duration=time.perf_counter() - started)
+        return BatchItemResult(source, destination, True, bytes_transferred=result.bytes_transferred,
+                               duration=time.perf_counter() - started)
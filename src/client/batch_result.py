@@ -0,0 +1,26 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    source: str
+    destination: str
+    success: bool
+    error: Optional[Exception] = None
+    bytes_transferred: int = 0
+    duration: float = 0.0
+    skipped: bool = False
+    bytes_saved: int = 0
+    attempts: int = 1
+
+    def __bool__(self) -> bool:
+        return self.success
+
+
+def local_file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except (OSError, ValueError):
+        return 0
@@ -0,0 +1,39 @@
+import os
+import re
+from typing import Optional
+from src.interfaces.file_inspector import FileMetadata, IFileInspector
+from src.transfer.content_hash import DEFAULT_HASH_CACHE, HashCache
+
+_MD5_ETAG = re.compile(r"[0-9a-f]{32}")
+
+
+class Deduplicator:
+    def __init__(self, inspector: IFileInspector, hash_cache: HashCache = None):
+        self._inspector = inspector
+        self._hash_cache = hash_cache or DEFAULT_HASH_CACHE
+
+    def digest(self, local_path: str) -> Optional[str]:
+        try:
+            return self._hash_cache.digest(local_path)
+        except OSError:
+            return None
+
+    def is_duplicate(self, local_path: str, remote_path: str) -> bool:
+        try:
+            size = os.stat(local_path).st_size
+        except OSError:
+            return False
+        remote = self._inspector.stat(remote_path)
+        if remote is None or remote.size != size:
+            return False
+        return self.content_matches(local_path, remote) is True
+
+    def content_matches(self, local_path: str, remote: FileMetadata) -> Optional[bool]:
+        remote_hash = remote.content_hash
+        if remote_hash is None and remote.etag is None:
+            remote_hash = self._inspector.content_hash(remote.path)
+        if remote_hash is not None:
+            return remote_hash == self.digest(local_path)
+        if remote.etag is not None and _MD5_ETAG.fullmatch(remote.etag):
+            return remote.etag == self._hash_cache.digest(local_path, "md5")
+        return None
@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from src.exceptions import classify_error
+from src.transfer.chunked_transfer import choose_part_size, plan_parts
+from src.utils.logger import get_logger
+from src.utils.paths import require_file
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+from .batch_result import BatchItemResult
+
+DEFAULT_PROCESS_CHUNK_SIZE = 32
+DEFAULT_START_METHOD = "spawn"
+HASH_TASKS_PER_PROCESS = 4
+OPERATIONS = ("upload", "download")
+
+_worker_runner: Optional[Any] = None
+
+
+def _init_worker(runner_factory: Callable[[], Any], disabled_level: int = logging.NOTSET) -> None:
+    global _worker_runner
+    logging.disable(disabled_level)
+    _worker_runner = runner_factory()
+
+
+def _run_chunk(operation: str, pairs: List[Tuple[str, str]], max_workers: int = None) -> List[BatchItemResult]:
+    return getattr(_worker_runner, f"{operation}_many")(pairs, max_workers)
+
+
+def _hash_ranges(file_path: str, ranges: Sequence[Tuple[int, int]]) -> List[bytes]:
+    digests = []
+    with open(file_path, "rb", buffering=0) as source:
+        for offset, length in ranges:
+            digest = hashlib.md5()
+            source.seek(offset)
+            remaining = length
+            while remaining:
+                data = source.read(min(remaining, DEFAULT_CHUNK_SIZE))
+                if not data:
+                    raise OSError(f"Short read hashing {file_path} at offset {offset + length - remaining}")
+                digest.update(data)
+                remaining -= len(data)
+            digests.append(digest.digest())
+    return digests
+
+
+class ProcessTransferPool:
+    def __init__(self, runner_factory: Callable[[], Any], processes: int = None,
+                 chunk_size: int = DEFAULT_PROCESS_CHUNK_SIZE, start_method: str = DEFAULT_START_METHOD):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._logger = get_logger(self.__class__.__name__)
+        self._processes = processes or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=self._processes,
+                                             mp_context=multiprocessing.get_context(start_method),
+                                             initializer=_init_worker,
+                                             initargs=(runner_factory, logging.root.manager.disable))
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    def run(self, operation: str, pairs: Iterable[Tuple[str, str]], max_workers: int = None) -> List[BatchItemResult]:
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        pending: Dict[Future, Tuple[int, List[Tuple[str, str]]]] = {}
+        collected: Dict[int, List[BatchItemResult]] = {}
+        for index, chunk in enumerate(_chunks(pairs, self._chunk_size)):
+            if len(pending) >= self._processes:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    done_index, done_chunk = pending.pop(future)
+                    collected[done_index] = self._collect(future, done_chunk)
+            pending[self._executor.submit(_run_chunk, operation, chunk, max_workers)] = (index, chunk)
+        for future, (index, chunk) in pending.items():
+            collected[index] = self._collect(future, chunk)
+        return [result for index in range(len(collected)) for result in collected[index]]
+
+    def _collect(self, future: Future, chunk: List[Tuple[str, str]]) -> List[BatchItemResult]:
+        try:
+            return future.result()
+        except Exception as e:
+            self._logger.error("Worker failed on a chunk of %s transfers: %s", len(chunk), e)
+            error = classify_error(e, f"Worker process failed: {str(e)}")
+            return [BatchItemResult(source, destination, False, error=error) for source, destination in chunk]
+
+    def etag(self, file_path: str, part_size: int = None) -> str:
+        size = require_file(file_path).st_size
+        parts = plan_parts(size, choose_part_size(size, part_size))
+        if len(parts) <= 1:
+            return self._executor.submit(_hash_ranges, file_path, [(0, size)]).result()[0].hex()
+        per_task = max(1, math.ceil(len(parts) / (self._processes * HASH_TASKS_PER_PROCESS)))
+        futures = [self._executor.submit(_hash_ranges, file_path,
+                                         [(part.offset, part.length) for part in parts[start:start + per_task]])
+                   for start in range(0, len(parts), per_task)]
+        digests = b"".join(digest for future in futures for digest in future.result())
+        return f"{hashlib.md5(digests).hexdigest()}-{len(parts)}"
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def _chunks(pairs: Iterable[Tuple[str, str]], size: int) -> Iterator[List[Tuple[str, str]]]:
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, List, Optional, Sequence, Tuple
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.transfer_result import TransferResult
+from src.exceptions import StorageOperationError, classify_error
+from src.instrumentation import instrumented, record_counter
+from src.transfer.retry import RetryPolicy
+from src.transfer.tee import DEFAULT_TEE_DEPTH, tee_file
+from src.utils.logger import get_logger
+from src.utils.paths import require_file
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+from .batch_result import BatchItemResult
+from .replication_result import ReplicationResult
+from .service_runner import ServiceRunner
+
+WRITE_ALL = "all"
+WRITE_QUORUM = "quorum"
+WRITE_BEST_EFFORT = "best_effort"
+WRITE_POLICIES = (WRITE_ALL, WRITE_QUORUM, WRITE_BEST_EFFORT)
+
+REPLICA_WRITES_METRIC = "storage_replica_writes_total"
+
+
+class ReplicatingServiceRunner:
+    provider_name = "replicating_service_runner"
+
+    def __init__(self, storage_factories: Sequence[IStorageFactory], policy: str = WRITE_ALL, max_workers: int = 4,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, queue_depth: int = DEFAULT_TEE_DEPTH, repair_dir: str = None,
+                 retry_policy: RetryPolicy = None):
+        if not storage_factories:
+            raise ValueError("At least one storage factory is required")
+        if policy not in WRITE_POLICIES:
+            raise ValueError(f"Unknown write policy: {policy}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._logger = get_logger(self.__class__.__name__)
+        self._uploaders: List[IFileUploader] = [factory.create_uploader() for factory in storage_factories]
+        self._policy = policy
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._queue_depth = queue_depth
+        self._repairs: Optional[List[ServiceRunner]] = None
+        if repair_dir:
+            self._repairs = [ServiceRunner(factory, retry_policy=retry_policy,
+                                           spool_dir=os.path.join(repair_dir, f"replica-{index}"))
+                             for index, factory in enumerate(storage_factories)]
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def replicas(self) -> int:
+        return len(self._uploaders)
+
+    @property
+    def repairs_pending(self) -> int:
+        if self._repairs is None:
+            return 0
+        return sum(runner.spool.depth for runner in self._repairs)
+
+    @instrumented("replicate_file", size_of="file_path")
+    def upload_file(self, file_path: str, destinations: Sequence[str]) -> ReplicationResult:
+        if len(destinations) != len(self._uploaders):
+            raise ValueError(f"Expected {len(self._uploaders)} destinations, got {len(destinations)}")
+        require_file(file_path)
+
+        consumers = [self._stream_to(uploader, destination)
+                     for uploader, destination in zip(self._uploaders, destinations)]
+        try:
+            bytes_read, outcomes = tee_file(file_path, consumers, self._chunk_size, self._queue_depth)
+        except OSError as e:
+            raise classify_error(e, f"Replication failed: {str(e)}") from e
+
+        replicas = []
+        for destination, outcome in zip(destinations, outcomes):
+            if outcome.error is None:
+                replicas.append(BatchItemResult(file_path, destination, True, bytes_transferred=bytes_read,
+                                                duration=outcome.duration))
+                record_counter(REPLICA_WRITES_METRIC, outcome="success")
+                continue
+            error = outcome.error
+            if not isinstance(error, StorageOperationError):
+                error = classify_error(error, f"Replication failed: {str(error)}")
+            self._logger.error("Replica %s failed for %s: %s", destination, file_path, error)
+            replicas.append(BatchItemResult(file_path, destination, False, error=error, duration=outcome.duration))
+            record_counter(REPLICA_WRITES_METRIC, outcome="failure")
+
+        succeeded = sum(1 for replica in replicas if replica.success)
+        success = self._satisfied(succeeded)
+        repairs = self._queue_repairs(file_path, replicas) if success else 0
+        return ReplicationResult(file_path, self._policy, success, replicas, repairs)
+
+    @instrumented("replicate_many")
+    def upload_many(self, items: Iterable[Tuple[str, Sequence[str]]],
+                    max_workers: int = None) -> List[ReplicationResult]:
+        with ThreadPoolExecutor(max_workers=max_workers or self._max_workers) as executor:
+            futures = [executor.submit(self._upload_item, file_path, destinations)
+                       for file_path, destinations in items]
+        return [future.result() for future in futures]
+
+    def flush(self, timeout: float = None) -> bool:
+        if self._repairs is None:
+            return True
+        return all([runner.flush(timeout) for runner in self._repairs])
+
+    def close(self, drain: bool = True, timeout: float = None) -> bool:
+        if self._repairs is None:
+            return True
+        return all([runner.close(drain, timeout) for runner in self._repairs])
+
+    def _upload_item(self, file_path: str, destinations: Sequence[str]) -> ReplicationResult:
+        try:
+            return self.upload_file(file_path, destinations)
+        except StorageOperationError as e:
+            replicas = [BatchItemResult(file_path, destination, False, error=e) for destination in destinations]
+            return ReplicationResult(file_path, self._policy, False, replicas)
+
+    def _stream_to(self, uploader: IFileUploader, destination: str) -> Callable[[BinaryIO], TransferResult]:
+        return lambda readable: uploader.upload_stream(readable, destination)
+
+    def _satisfied(self, succeeded: int) -> bool:
+        if self._policy == WRITE_ALL:
+            return succeeded == len(self._uploaders)
+        if self._policy == WRITE_QUORUM:
+            return succeeded > len(self._uploaders) // 2
+        return succeeded > 0
+
+    def _queue_repairs(self, file_path: str, replicas: List[BatchItemResult]) -> int:
+        if self._repairs is None:
+            return 0
+        queued = 0
+        for runner, replica in zip(self._repairs, replicas):
+            if replica.success:
+                continue
+            try:
+                runner.upload_file(file_path, replica.destination)
+                queued += 1
+            except StorageOperationError as e:
+                self._logger.error("Failed to queue repair for %s: %s", replica.destination, e)
+        return queued
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import List
+from .batch_result import BatchItemResult
+
+
+@dataclass
+class ReplicationResult:
+    source: str
+    policy: str
+    success: bool
+    replicas: List[BatchItemResult] = field(default_factory=list)
+    repairs_queued: int = 0
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for replica in self.replicas if replica.success)
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [replica for replica in self.replicas if not replica.success]
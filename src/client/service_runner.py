@@ -1,16 +1,376 @@
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from src.interfaces.storage_factory import IStorageFactory
 from src.interfaces.file_uploader import IFileUploader
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.file_inspector import FileMetadata, IFileInspector
+from src.interfaces.transfer_result import TransferResult
+from src.products.local.disk_inspector import DiskInspector
+from src.exceptions import (FileNotFoundError, PermanentStorageError, StorageOperationError, ThrottledError,
+                            classify_error)
+from src.instrumentation import instrumented, record_retry
+from src.packing.pack_file import (
+    DEFAULT_MAX_PACK_BYTES,
+    DEFAULT_MAX_PACK_MEMBERS,
+    member_uri,
+    open_pack,
+    pack_chunks,
+    plan_packs,
+    split_member_uri
+)
+from src.packing.pack_index import PackIndexBuilder
+from src.transfer.concurrency import AdaptiveConcurrencyLimiter
+from src.transfer.content_hash import CONTENT_HASH_METADATA_KEY, HashCache
+from src.transfer.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from src.utils.logger import get_logger
+from src.utils.paths import parse_uri, require_file
+from .batch_result import BatchItemResult, local_file_size
+from .deduplicator import Deduplicator
+from .process_pool import DEFAULT_PROCESS_CHUNK_SIZE, ProcessTransferPool
+from .sync_report import SyncReport
+from .write_behind import DEFAULT_BATCH_SIZE, WriteBehindQueue
 
 
 class ServiceRunner:
-    def __init__(self, storage_factory: IStorageFactory):
+    provider_name = "service_runner"
+
+    def __init__(self, storage_factory: IStorageFactory, max_workers: int = 8, max_in_flight: int = None,
+                 dedup: bool = False, hash_cache: HashCache = None, retry_policy: RetryPolicy = None,
+                 limiter: AdaptiveConcurrencyLimiter = None, spool_dir: str = None,
+                 spool_batch_size: int = DEFAULT_BATCH_SIZE, spool_hardlink: bool = False, processes: int = None,
+                 process_chunk_size: int = DEFAULT_PROCESS_CHUNK_SIZE):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if processes and (hash_cache is not None or limiter is not None):
+            raise ValueError("hash_cache and limiter hold per-process state and cannot be combined with processes")
+        self._logger = get_logger(self.__class__.__name__)
         self._uploader: IFileUploader = storage_factory.create_uploader()
         self._downloader: IFileDownloader = storage_factory.create_downloader()
+        self._max_workers = max_workers
+        self._max_in_flight = max(max_in_flight or max_workers * 2, max_workers)
+        self._inspector: Optional[IFileInspector] = _create_inspector(storage_factory)
+        if dedup and self._inspector is None:
+            raise ValueError(f"dedup requires an inspector, which {type(storage_factory).__name__} does not provide")
+        self._local_inspector = DiskInspector(hash_cache)
+        self._deduplicator = Deduplicator(self._inspector, hash_cache)
+        self._dedup = dedup
+        self._retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self._limiter = limiter
+        self._spool = None
+        if spool_dir:
+            self._spool = WriteBehindQueue(spool_dir, self._deliver_spooled, spool_batch_size, spool_hardlink)
+        self._saved_lock = threading.Lock()
+        self._bytes_saved = 0
+        self._process_pool = None
+        if processes:
+            runner = partial(ServiceRunner, storage_factory, max_workers=max_workers, max_in_flight=max_in_flight,
+                             dedup=dedup, retry_policy=self._retry_policy)
+            self._process_pool = ProcessTransferPool(runner, processes, process_chunk_size)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self._bytes_saved
+
+    @property
+    def spool(self) -> Optional[WriteBehindQueue]:
+        return self._spool
+
+    @property
+    def process_pool(self) -> Optional[ProcessTransferPool]:
+        return self._process_pool
+
+    @instrumented("upload_file", target="destination", size_of="file_path")
+    def upload_file(self, file_path: str, destination: str) -> TransferResult:
+        if self._spool is not None:
+            started = time.perf_counter_ns()
+            self._spool_upload(file_path, destination)
+            return TransferResult.completed(file_path, destination, started, strategy="spooled")
+        return self._retry_policy.run(lambda: self._upload(file_path, destination), self._retry_hook(self._upload))
+
+    @instrumented("download_file", target="source", size_of="destination")
+    def download_file(self, source: str, destination: str) -> TransferResult:
+        return self._retry_policy.run(lambda: self._download(source, destination),
+                                      self._retry_hook(self._download))
+
+    @instrumented("upload_many")
+    def upload_many(self, pairs: Iterable[Tuple[str, str]], max_workers: int = None) -> List[BatchItemResult]:
+        return self._run_batch(self._upload, pairs, max_workers, size_of_source=True)
+
+    @instrumented("download_many")
+    def download_many(self, pairs: Iterable[Tuple[str, str]], max_workers: int = None) -> List[BatchItemResult]:
+        return self._run_batch(self._download, pairs, max_workers, size_of_source=False)
+
+    @instrumented("sync", target="destination")
+    def sync(self, source: str, destination: str, delete: bool = False, dry_run: bool = False,
+             max_workers: int = None) -> SyncReport:
+        if self._inspector is None:
+            raise PermanentStorageError("sync requires a storage factory that provides an inspector")
+        upload = not _is_remote(source)
+        if upload:
+            source_inspector, target_inspector = self._local_inspector, self._inspector
+        else:
+            source_inspector, target_inspector = self._inspector, self._local_inspector
+        targets = {_relative(entry.path, destination): entry for entry in target_inspector.list_files(destination)}
+        report = SyncReport(dry_run=dry_run)
+
+        def changed_pairs() -> Iterator[Tuple[str, str]]:
+            for entry in source_inspector.list_files(source):
+                relative = _relative(entry.path, source)
+                target = targets.pop(relative, None)
+                if target is not None and self._is_unchanged(entry, target, upload):
+                    report.unchanged += 1
+                    continue
+                pair = (entry.path, _join(destination, relative))
+                report.transfers.append(pair)
+                yield pair
+
+        if dry_run:
+            for _ in changed_pairs():
+                pass
+        else:
+            report.results = self._run_batch(self._upload if upload else self._download, changed_pairs(),
+                                             max_workers, size_of_source=upload)
+
+        if delete:
+            for path in sorted(entry.path for entry in targets.values()):
+                if not dry_run:
+                    self._delete_target(path, upload)
+                report.deleted.append(path)
+        return report
+
+    @instrumented("upload_packed", target="destination")
+    def upload_packed(self, pairs: Iterable[Tuple[str, str]], destination: str,
+                      max_pack_bytes: int = DEFAULT_MAX_PACK_BYTES, max_members: int = DEFAULT_MAX_PACK_MEMBERS,
+                      max_workers: int = None) -> List[BatchItemResult]:
+        results, members = [], []
+        for file_path, name in pairs:
+            if os.path.isfile(file_path):
+                members.append((file_path, name))
+            else:
+                results.append(BatchItemResult(file_path, name, False,
+                                               error=FileNotFoundError(f"Source file not found: {file_path}")))
+        packs = [(group, _join(destination, f"pack-{uuid.uuid4().hex}.pack"))
+                 for group in plan_packs(members, max_pack_bytes, max_members)]
+        with ThreadPoolExecutor(max_workers=max_workers or self._max_workers) as executor:
+            futures = [executor.submit(self._run_pack, group, pack) for group, pack in packs]
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    @instrumented("download_packed")
+    def download_packed(self, pairs: Iterable[Tuple[str, str]], max_workers: int = None) -> List[BatchItemResult]:
+        by_pack: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for source, destination in pairs:
+            pack, name = split_member_uri(source)
+            by_pack[pack].append((name, destination))
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers or self._max_workers) as executor:
+            futures = [executor.submit(self._extract_pack, pack, members) for pack, members in by_pack.items()]
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    def flush(self, timeout: float = None) -> bool:
+        return self._spool.flush(timeout) if self._spool is not None else True
+
+    def close(self, drain: bool = True, timeout: float = None) -> bool:
+        closed = self._spool.close(drain, timeout) if self._spool is not None else True
+        if self._process_pool is not None:
+            self._process_pool.close()
+        return closed
+
+    def _spool_upload(self, file_path: str, destination: str) -> None:
+        require_file(file_path)
+        try:
+            self._spool.enqueue(file_path, destination)
+        except OSError as e:
+            raise classify_error(e, f"Spooling failed: {str(e)}") from e
+
+    def _deliver_spooled(self, pairs: List[Tuple[str, str]]) -> List[BatchItemResult]:
+        return self._run_batch(self._upload, pairs, None, size_of_source=True)
+
+    def _run_pack(self, group: List[Tuple[str, str, int]], pack: str) -> List[BatchItemResult]:
+        started = time.perf_counter()
+        attempts = 1
+        record = self._retry_hook(self._upload_pack)
+
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            nonlocal attempts
+            attempts = attempt + 1
+            record(attempt, error, delay)
 
-    def upload_file(self, file_path: str, destination: str) -> bool:
-        return self._uploader.upload(file_path, destination)
+        error = None
+        try:
+            self._retry_policy.run(lambda: self._upload_pack(group, pack), on_retry)
+        except StorageOperationError as e:
+            error = e
+        duration = time.perf_counter() - started
+        return [BatchItemResult(file_path, member_uri(pack, name), error is None, error=error,
+                                bytes_transferred=size if error is None else 0, duration=duration, attempts=attempts)
+                for file_path, name, size in group]
 
-    def download_file(self, source: str, destination: str) -> bool:
+    def _upload_pack(self, group: List[Tuple[str, str, int]], pack: str) -> None:
+        builder = PackIndexBuilder()
+        try:
+            self._uploader.upload_chunks(pack_chunks(group, builder), pack)
+        except StorageOperationError:
+            raise
+        except (OSError, ValueError) as e:
+            raise classify_error(e, f"Packing failed: {str(e)}") from e
+        self._logger.info("Packed %s files (%s bytes) into %s", len(builder), builder.size, pack)
+
+    def _extract_pack(self, pack: str, members: List[Tuple[str, str]]) -> List[BatchItemResult]:
+        started = time.perf_counter()
+        try:
+            reader = self._retry_policy.run(lambda: open_pack(self._downloader, pack),
+                                            self._retry_hook(self._download))
+        except StorageOperationError as e:
+            return [BatchItemResult(member_uri(pack, name), destination, False, error=e,
+                                    duration=time.perf_counter() - started) for name, destination in members]
+        results = []
+        with reader:
+            ordered = sorted(members, key=lambda member: (reader.index.lookup(member[0]) or (-1, 0))[0])
+            for name, destination in ordered:
+                source = member_uri(pack, name)
+                try:
+                    size = reader.extract(name, destination)
+                except StorageOperationError as e:
+                    results.append(BatchItemResult(source, destination, False, error=e))
+                    continue
+                except OSError as e:
+                    results.append(BatchItemResult(source, destination, False,
+                                                   error=classify_error(e, f"Extract failed: {str(e)}")))
+                    continue
+                results.append(BatchItemResult(source, destination, True, bytes_transferred=size,
+                                               duration=time.perf_counter() - started))
+        return results
+
+    def _is_unchanged(self, source: FileMetadata, target: FileMetadata, upload: bool) -> bool:
+        if source.size != target.size:
+            return False
+        if source.modified_ns is not None and target.modified_ns is not None:
+            return source.modified_ns == target.modified_ns
+        local, remote = (source, target) if upload else (target, source)
+        return self._deduplicator.content_matches(local.path, remote) is True
+
+    def _delete_target(self, path: str, upload: bool) -> None:
+        if upload:
+            self._uploader.delete(path)
+            return
+        try:
+            os.remove(path)
+        except OSError as e:
+            raise classify_error(e, f"Delete failed: {str(e)}") from e
+
+    def _upload(self, file_path: str, destination: str) -> TransferResult:
+        if not self._dedup:
+            return self._uploader.upload(file_path, destination)
+        started = time.perf_counter_ns()
+        if self._deduplicator.is_duplicate(file_path, destination):
+            self._record_saved(file_path)
+            return TransferResult.completed(file_path, destination, started, strategy="dedup", skipped=True)
+        digest = self._deduplicator.digest(file_path)
+        return self._uploader.upload(file_path, destination, {CONTENT_HASH_METADATA_KEY: digest} if digest else None)
+
+    def _download(self, source: str, destination: str) -> TransferResult:
+        if self._dedup:
+            started = time.perf_counter_ns()
+            if self._deduplicator.is_duplicate(destination, source):
+                self._record_saved(destination)
+                return TransferResult.completed(source, destination, started, strategy="dedup", skipped=True)
         return self._downloader.download(source, destination)
 
+    def _record_saved(self, local_path: str) -> None:
+        with self._saved_lock:
+            self._bytes_saved += local_file_size(local_path)
+
+    def _run_batch(self, transfer: Callable[[str, str], TransferResult], pairs: Iterable[Tuple[str, str]],
+                   max_workers: int, size_of_source: bool) -> List[BatchItemResult]:
+        if self._process_pool is not None:
+            results = self._process_pool.run("upload" if transfer == self._upload else "download", pairs, max_workers)
+            with self._saved_lock:
+                self._bytes_saved += sum(result.bytes_saved for result in results)
+            return results
+        workers = max_workers or self._max_workers
+        if self._limiter is not None:
+            workers = min(workers, self._limiter.maximum)
+        in_flight = threading.BoundedSemaphore(max(self._max_in_flight, workers))
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for source, destination in pairs:
+                in_flight.acquire()
+                future = executor.submit(self._run_item, transfer, source, destination, size_of_source)
+                future.add_done_callback(lambda _: in_flight.release())
+                futures.append(future)
+        return [future.result() for future in futures]
+
+    def _run_item(self, transfer: Callable[[str, str], TransferResult], source: str, destination: str,
+                  size_of_source: bool) -> BatchItemResult:
+        started = time.perf_counter()
+        limiter = self._limiter
+        token = limiter.acquire() if limiter is not None else 0
+        attempts = 1
+        record = self._retry_hook(transfer)
+
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            nonlocal token, attempts
+            attempts = attempt + 1
+            record(attempt, error, delay)
+            if limiter is not None and isinstance(error, ThrottledError):
+                token = limiter.record_throttle(token)
+
+        success = False
+        try:
+            result = self._retry_policy.run(lambda: transfer(source, destination), on_retry)
+            success = True
+        except StorageOperationError as e:
+            if limiter is not None and isinstance(e, ThrottledError):
+                limiter.record_throttle(token)
+            return BatchItemResult(source, destination, False, error=e,
+                                   duration=time.perf_counter() - started, attempts=attempts)
+        finally:
+            if limiter is not None:
+                limiter.release(token, success)
+        duration = time.perf_counter() - started
+        if result.skipped:
+            size = local_file_size(source if size_of_source else destination)
+            return BatchItemResult(source, destination, True, duration=duration, skipped=True, bytes_saved=size,
+                                   attempts=attempts)
+        return BatchItemResult(source, destination, True, bytes_transferred=result.bytes_transferred,
+                               duration=duration, attempts=attempts)
+
+    def _retry_hook(self, transfer: Callable[..., object]) -> Callable[[int, BaseException, float], None]:
+        operation = transfer.__name__.lstrip("_")
+
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            record_retry(self.provider_name, operation)
+            self._logger.warning("Retrying %s after %s (attempt %d, waiting %.2fs)", operation, error, attempt, delay)
+        return on_retry
+
+
+def _create_inspector(storage_factory: IStorageFactory) -> Optional[IFileInspector]:
+    try:
+        return storage_factory.create_inspector()
+    except NotImplementedError:
+        return None
+
+
+def _is_remote(path: str) -> bool:
+    return not parse_uri(path).is_local
+
+
+def _relative(path: str, root: str) -> str:
+    relative = path[len(root):].lstrip("/" + os.sep)
+    return relative if _is_remote(root) else relative.replace(os.sep, "/")
+
+
+def _join(root: str, relative: str) -> str:
+    if _is_remote(root):
+        return f"{root.rstrip('/')}/{relative}"
+    return os.path.join(root, *relative.split("/"))
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+from .batch_result import BatchItemResult
+
+
+@dataclass
+class SyncReport:
+    dry_run: bool = False
+    transfers: List[Tuple[str, str]] = field(default_factory=list)
+    results: List[BatchItemResult] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [result for result in self.results if not result.success]
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(result.bytes_transferred for result in self.results)
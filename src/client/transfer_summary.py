@@ -0,0 +1,101 @@
+import math
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Union
+from src.interfaces.transfer_result import NS_PER_SECOND, TransferResult
+from .batch_result import BatchItemResult
+
+Result = Union[TransferResult, BatchItemResult]
+
+
+@dataclass(frozen=True)
+class TransferSummary:
+    count: int = 0
+    failed: int = 0
+    skipped: int = 0
+    bytes_transferred: int = 0
+    elapsed: float = 0.0
+    busy: float = 0.0
+    latency_mean: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return self.count - self.failed
+
+    @property
+    def throughput(self) -> float:
+        return self.bytes_transferred / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class TransferAggregator:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = array("q")
+        self._count = 0
+        self._failed = 0
+        self._skipped = 0
+        self._bytes = 0
+        self._first_ns: Optional[int] = None
+        self._last_ns: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, result: Result) -> None:
+        if isinstance(result, TransferResult):
+            success, started_ns, duration_ns = True, result.started_ns, result.duration_ns
+        else:
+            success, started_ns, duration_ns = result.success, 0, int(result.duration * NS_PER_SECOND)
+        with self._lock:
+            self._count += 1
+            if not success:
+                self._failed += 1
+                return
+            if result.skipped:
+                self._skipped += 1
+                return
+            self._bytes += result.bytes_transferred
+            self._durations.append(duration_ns)
+            if started_ns:
+                finished_ns = started_ns + duration_ns
+                if self._first_ns is None or started_ns < self._first_ns:
+                    self._first_ns = started_ns
+                if self._last_ns is None or finished_ns > self._last_ns:
+                    self._last_ns = finished_ns
+
+    def extend(self, results: Iterable[Result]) -> None:
+        for result in results:
+            self.add(result)
+
+    def summary(self, elapsed: float = None) -> TransferSummary:
+        with self._lock:
+            durations = sorted(self._durations)
+            count, failed, skipped, transferred = self._count, self._failed, self._skipped, self._bytes
+            span = None if self._first_ns is None else (self._last_ns - self._first_ns) / NS_PER_SECOND
+        busy = sum(durations) / NS_PER_SECOND
+        if elapsed is None:
+            elapsed = busy if span is None else span
+        if not durations:
+            return TransferSummary(count, failed, skipped, transferred, elapsed, busy)
+        return TransferSummary(count, failed, skipped, transferred, elapsed, busy,
+                               latency_mean=busy / len(durations),
+                               latency_p50=_percentile(durations, 0.50),
+                               latency_p95=_percentile(durations, 0.95),
+                               latency_p99=_percentile(durations, 0.99),
+                               latency_max=durations[-1] / NS_PER_SECOND)
+
+
+def summarize(results: Iterable[Result], elapsed: float = None) -> TransferSummary:
+    aggregator = TransferAggregator()
+    aggregator.extend(results)
+    return aggregator.summary(elapsed)
+
+
+def _percentile(ordered: Sequence[int], fraction: float) -> float:
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank] / NS_PER_SECOND
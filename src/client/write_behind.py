@@ -0,0 +1,246 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, List, Optional, Tuple
+from src.instrumentation import record_counter, record_gauge, record_histogram
+from src.products.local.copy_engine import AUTO, copy_file
+from src.utils.logger import get_logger
+from .batch_result import BatchItemResult
+
+FAILED_DIR = "failed"
+DEFAULT_BATCH_SIZE = 64
+
+SPOOL_DEPTH = "storage_spool_depth"
+SPOOL_OLDEST_AGE_SECONDS = "storage_spool_oldest_age_seconds"
+SPOOL_WAIT_SECONDS = "storage_spool_wait_seconds"
+SPOOL_ITEMS_TOTAL = "storage_spool_items_total"
+
+
+@dataclass(frozen=True)
+class SpooledItem:
+    id: str
+    source: str
+    destination: str
+    created: float
+
+
+class WriteBehindQueue:
+    def __init__(self, directory: str, deliver: Callable[[List[Tuple[str, str]]], List[BatchItemResult]],
+                 batch_size: int = DEFAULT_BATCH_SIZE, hardlink: bool = False, fsync: bool = True):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._logger = get_logger(self.__class__.__name__)
+        self._directory = directory
+        self._failed_directory = os.path.join(directory, FAILED_DIR)
+        os.makedirs(self._failed_directory, exist_ok=True)
+        self._deliver = deliver
+        self._batch_size = batch_size
+        self._hardlink = hardlink
+        self._fsync = fsync
+        self._condition = threading.Condition()
+        self._pending: Deque[SpooledItem] = deque()
+        self._in_flight: List[SpooledItem] = []
+        self._closed = False
+        self.delivered = 0
+        self.failed = 0
+        self.recovered = self._recover()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def depth(self) -> int:
+        with self._condition:
+            return len(self._pending) + len(self._in_flight)
+
+    @property
+    def oldest_age(self) -> float:
+        with self._condition:
+            return self._oldest_age_locked(time.time())
+
+    def enqueue(self, file_path: str, destination: str) -> SpooledItem:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+        item = SpooledItem(f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}", os.path.abspath(file_path),
+                           destination, time.time())
+        data_path = self._data_path(self._directory, item.id)
+        try:
+            self._spool_data(file_path, data_path)
+            self._write_record(item)
+        except BaseException:
+            for path in (data_path, f"{data_path}.tmp"):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        with self._condition:
+            if self._closed:
+                self._discard(item)
+                raise RuntimeError("Write-behind queue is closed")
+            self._pending.append(item)
+            self._condition.notify_all()
+            self._publish_locked()
+        record_counter(SPOOL_ITEMS_TOTAL, outcome="spooled")
+        return item
+
+    def flush(self, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, drain: bool = True, timeout: float = None) -> bool:
+        drained = self.flush(timeout) if drain else False
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return drained
+
+    def retry_failed(self) -> int:
+        items = sorted(self._load_records(self._failed_directory), key=lambda item: item.id)
+        for item in items:
+            for path in (self._record_path, self._data_path):
+                os.replace(path(self._failed_directory, item.id), path(self._directory, item.id))
+        with self._condition:
+            self._pending.extend(items)
+            self._condition.notify_all()
+            self._publish_locked()
+        return len(items)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                batch = [self._pending.popleft() for _ in range(min(self._batch_size, len(self._pending)))]
+                self._in_flight = batch
+            try:
+                results = self._deliver([(self._data_path(self._directory, item.id), item.destination)
+                                         for item in batch])
+            except Exception as e:
+                self._logger.error("Write-behind delivery failed: %s", e)
+                results = [None] * len(batch)
+            if len(results) != len(batch):
+                self._logger.error("Write-behind delivery returned %d results for %d uploads", len(results), len(batch))
+                results = (list(results) + [None] * len(batch))[:len(batch)]
+            now = time.time()
+            for item, result in zip(batch, results):
+                if result is not None and result.success:
+                    self._discard(item)
+                    record_counter(SPOOL_ITEMS_TOTAL, outcome="delivered")
+                    record_histogram(SPOOL_WAIT_SECONDS, now - item.created)
+                else:
+                    self._quarantine(item, result.error if result is not None else None)
+                    record_counter(SPOOL_ITEMS_TOTAL, outcome="failed")
+            with self._condition:
+                self.delivered += sum(1 for result in results if result is not None and result.success)
+                self.failed += sum(1 for result in results if result is None or not result.success)
+                self._in_flight = []
+                self._condition.notify_all()
+                self._publish_locked()
+
+    def _spool_data(self, file_path: str, data_path: str) -> None:
+        if self._hardlink:
+            try:
+                os.link(file_path, data_path)
+                return
+            except OSError:
+                pass
+        temporary = f"{data_path}.tmp"
+        copy_file(file_path, temporary, AUTO)
+        if self._fsync:
+            _fsync_file(temporary)
+        os.replace(temporary, data_path)
+
+    def _write_record(self, item: SpooledItem) -> None:
+        path = self._record_path(self._directory, item.id)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as target:
+            json.dump(asdict(item), target)
+            if self._fsync:
+                target.flush()
+                os.fsync(target.fileno())
+        os.replace(temporary, path)
+        if self._fsync:
+            _fsync_directory(self._directory)
+
+    def _discard(self, item: SpooledItem) -> None:
+        for path in (self._record_path(self._directory, item.id), self._data_path(self._directory, item.id)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _quarantine(self, item: SpooledItem, error: Optional[BaseException]) -> None:
+        self._logger.error("Write-behind upload of %s to %s failed: %s", item.source, item.destination, error)
+        for path in (self._data_path, self._record_path):
+            os.replace(path(self._directory, item.id), path(self._failed_directory, item.id))
+
+    def _recover(self) -> int:
+        items = sorted(self._load_records(self._directory), key=lambda item: item.id)
+        recorded = {item.id for item in items}
+        for name in os.listdir(self._directory):
+            path = os.path.join(self._directory, name)
+            orphaned = name.endswith(".data") and name[:-len(".data")] not in recorded
+            if name.endswith(".tmp") or orphaned:
+                os.remove(path)
+        self._pending.extend(items)
+        if items:
+            self._logger.info("Recovered %d pending write-behind uploads from %s", len(items), self._directory)
+        return len(items)
+
+    def _load_records(self, directory: str) -> List[SpooledItem]:
+        items = []
+        for name in os.listdir(directory):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(directory, name)) as source:
+                item = SpooledItem(**json.load(source))
+            if os.path.exists(self._data_path(directory, item.id)):
+                items.append(item)
+            else:
+                os.remove(os.path.join(directory, name))
+        return items
+
+    def _publish_locked(self) -> None:
+        record_gauge(SPOOL_DEPTH, len(self._pending) + len(self._in_flight))
+        record_gauge(SPOOL_OLDEST_AGE_SECONDS, self._oldest_age_locked(time.time()))
+
+    def _oldest_age_locked(self, now: float) -> float:
+        oldest = [item.created for item in self._in_flight[:1]] + ([self._pending[0].created] if self._pending else [])
+        return max(0.0, now - min(oldest)) if oldest else 0.0
+
+    @staticmethod
+    def _data_path(directory: str, item_id: str) -> str:
+        return os.path.join(directory, f"{item_id}.data")
+
+    @staticmethod
+    def _record_path(directory: str, item_id: str) -> str:
+        return os.path.join(directory, f"{item_id}.json")
+
+
+def _fsync_file(path: str) -> None:
+    with open(path, "rb") as source:
+        os.fsync(source.fileno())
+
+
+def _fsync_directory(directory: str) -> None:
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,20 @@
+from .codec import (
+    CODEC_METADATA_KEY,
+    Codec,
+    available_codecs,
+    get_codec,
+    is_compressible,
+    register_codec,
+    should_compress
+)
+from .transform_reader import PrefixedReader, TransformReader
+from .compressing_uploader import CompressingUploader
+from .decompressing_downloader import DecompressingDownloader
+from .async_compressing_uploader import AsyncCompressingUploader
+from .async_decompressing_downloader import AsyncDecompressingDownloader
+
+__all__ = [
+    'CODEC_METADATA_KEY', 'Codec', 'available_codecs', 'get_codec', 'is_compressible', 'register_codec',
+    'should_compress', 'PrefixedReader', 'TransformReader', 'CompressingUploader', 'DecompressingDownloader',
+    'AsyncCompressingUploader', 'AsyncDecompressingDownloader'
+]
@@ -0,0 +1,15 @@
+import asyncio
+from concurrent.futures import Executor
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.transfer_result import TransferResult
+from .compressing_uploader import CompressingUploader
+
+
+class AsyncCompressingUploader(IAsyncFileUploader):
+    def __init__(self, uploader: CompressingUploader, executor: Executor = None):
+        self._uploader = uploader
+        self._executor = executor
+
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._uploader.upload, file_path, destination)
@@ -0,0 +1,15 @@
+import asyncio
+from concurrent.futures import Executor
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from .decompressing_downloader import DecompressingDownloader
+
+
+class AsyncDecompressingDownloader(IAsyncFileDownloader):
+    def __init__(self, downloader: DecompressingDownloader, executor: Executor = None):
+        self._downloader = downloader
+        self._executor = executor
+
+    async def download(self, source: str, destination: str) -> TransferResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._downloader.download, source, destination)
@@ -0,0 +1,124 @@
+import os
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+CODEC_METADATA_KEY = "content-codec"
+HEADER_MAGIC = b"\x93MCZ"
+SAMPLE_SIZE = 64 * 1024
+MIN_COMPRESSIBLE_SIZE = 512
+DEFAULT_RATIO_THRESHOLD = 0.9
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    ".gz", ".tgz", ".bz2", ".xz", ".zst", ".lz4", ".zip", ".7z", ".rar",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp3", ".mp4", ".mkv", ".mov", ".avi", ".parquet", ".orc",
+})
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    compressor: Callable[[], object]
+    decompressor: Callable[[], object]
+
+
+class _LZ4Compressor:
+    def __init__(self):
+        self._compressor = lz4_frame.LZ4FrameCompressor()
+        self._started = False
+
+    def compress(self, data: bytes) -> bytes:
+        prefix = b"" if self._started else self._compressor.begin()
+        self._started = True
+        return prefix + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        prefix = b"" if self._started else self._compressor.begin()
+        self._started = True
+        return prefix + self._compressor.flush()
+
+
+class _LZ4Decompressor:
+    def __init__(self):
+        self._decompressor = lz4_frame.LZ4FrameDecompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+    @property
+    def eof(self) -> bool:
+        return getattr(self._decompressor, "eof", True)
+
+
+class _ZstdDecompressor:
+    def __init__(self):
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+    @property
+    def eof(self) -> bool:
+        return getattr(self._decompressor, "eof", True)
+
+
+_codecs: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    if not codec.name or len(codec.name.encode("ascii")) > 255:
+        raise ValueError(f"Invalid codec name: {codec.name!r}")
+    _codecs[codec.name] = codec
+
+
+def get_codec(name: str) -> Codec:
+    codec = _codecs.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown codec: {name} (available: {', '.join(available_codecs())})")
+    return codec
+
+
+def available_codecs() -> List[str]:
+    return sorted(_codecs)
+
+
+def encode_header(codec: Codec) -> bytes:
+    name = codec.name.encode("ascii")
+    return HEADER_MAGIC + bytes([len(name)]) + name
+
+
+def is_compressible(sample: bytes, threshold: float = DEFAULT_RATIO_THRESHOLD) -> bool:
+    if len(sample) < MIN_COMPRESSIBLE_SIZE:
+        return False
+    sample = sample[:SAMPLE_SIZE]
+    return len(zlib.compress(sample, 1)) < threshold * len(sample)
+
+
+def should_compress(file_path: str, threshold: float = DEFAULT_RATIO_THRESHOLD) -> bool:
+    if os.path.splitext(file_path)[1].lower() in INCOMPRESSIBLE_EXTENSIONS:
+        return False
+    with open(file_path, "rb") as source:
+        return is_compressible(source.read(SAMPLE_SIZE), threshold)
+
+
+register_codec(Codec("zlib", lambda: zlib.compressobj(6), zlib.decompressobj))
+register_codec(Codec("gzip", lambda: zlib.compressobj(6, zlib.DEFLATED, 31), lambda: zlib.decompressobj(31)))
+if zstandard is not None:
+    register_codec(Codec("zstd", lambda: zstandard.ZstdCompressor(level=3).compressobj(), _ZstdDecompressor))
+if lz4_frame is not None:
+    register_codec(Codec("lz4", _LZ4Compressor, _LZ4Decompressor))
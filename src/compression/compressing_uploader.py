@@ -0,0 +1,84 @@
+import io
+import time
+from typing import BinaryIO, Dict, Optional
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.transfer_result import STREAM_SOURCE, TransferResult
+from src.instrumentation import instrumented, record_counter
+from src.utils.logger import get_logger
+from src.utils.paths import require_file
+from src.utils.streams import read_exactly
+from src.exceptions import StorageOperationError, classify_error
+from .codec import (
+    CODEC_METADATA_KEY,
+    DEFAULT_RATIO_THRESHOLD,
+    SAMPLE_SIZE,
+    encode_header,
+    get_codec,
+    is_compressible,
+    should_compress
+)
+from .transform_reader import PrefixedReader, TransformReader
+
+COMPRESSION_BYTES_METRIC = "storage_compression_bytes_total"
+
+
+class CompressingUploader(IFileUploader):
+    provider_name = "compression"
+
+    def __init__(self, uploader: IFileUploader, codec: str = "gzip", threshold: float = DEFAULT_RATIO_THRESHOLD):
+        self._logger = get_logger(self.__class__.__name__)
+        self._uploader = uploader
+        self._codec = get_codec(codec)
+        self._threshold = threshold
+
+    @instrumented("upload", target="destination", size_of="file_path")
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        require_file(file_path)
+        try:
+            compress = should_compress(file_path, self._threshold)
+        except OSError as e:
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+        if not compress:
+            self._logger.debug("Uploading %s uncompressed", file_path)
+            return self._uploader.upload(file_path, destination, metadata)
+        try:
+            readable = open(file_path, "rb")
+        except OSError as e:
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+        return self._upload_encoded(file_path, readable, destination, metadata, b"", True, started)
+
+    @instrumented("upload_stream", target="destination")
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        sample = read_exactly(readable, SAMPLE_SIZE)
+        if not is_compressible(sample, self._threshold):
+            passthrough = io.BufferedReader(PrefixedReader(sample, readable, close_source=False))
+            return self._uploader.upload_stream(passthrough, destination, metadata)
+        return self._upload_encoded(STREAM_SOURCE, readable, destination, metadata, sample, False, started)
+
+    def delete(self, destination: str) -> bool:
+        return self._uploader.delete(destination)
+
+    def _upload_encoded(self, source: str, readable: BinaryIO, destination: str, metadata: Optional[Dict[str, str]],
+                        sample: bytes, close_source: bool, started: int) -> TransferResult:
+        codec = self._codec
+        compressor = codec.compressor()
+        prefix = encode_header(codec) + compressor.compress(sample)
+        encoded = TransformReader(readable, compressor.compress, compressor.flush, prefix, close_source=close_source)
+        try:
+            with encoded:
+                self._uploader.upload_stream(encoded, destination,
+                                             {**(metadata or {}), CODEC_METADATA_KEY: codec.name})
+        except StorageOperationError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to compress %s: %s", destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+        raw, stored = encoded.bytes_in + len(sample), encoded.bytes_out
+        record_counter(COMPRESSION_BYTES_METRIC, raw, codec=codec.name, stage="raw")
+        record_counter(COMPRESSION_BYTES_METRIC, stored, codec=codec.name, stage="encoded")
+        self._logger.info("Compressed %s with %s: %s -> %s bytes", destination, codec.name, raw, stored)
+        return TransferResult.completed(source, destination, started, stored, f"compress:{codec.name}")
+
@@ -0,0 +1,76 @@
+import io
+import os
+import shutil
+import time
+from typing import BinaryIO, Callable, Tuple
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.utils.streams import read_exactly
+from src.exceptions import PermanentStorageError, StorageOperationError, classify_error
+from .codec import HEADER_MAGIC, get_codec
+from .transform_reader import PrefixedReader, TransformReader
+
+
+class DecompressingDownloader(IFileDownloader):
+    provider_name = "compression"
+
+    def __init__(self, downloader: IFileDownloader):
+        self._logger = get_logger(self.__class__.__name__)
+        self._downloader = downloader
+
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        decoded, compressed = self._decode(source, self._downloader.open_read(source))
+        partial = f"{destination}.partial"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+            with decoded, open(partial, "wb") as target:
+                shutil.copyfileobj(decoded, target)
+                size = target.tell()
+            os.replace(partial, destination)
+            if not compressed:
+                return TransferResult.completed(source, destination, started, size, "stream")
+            self._logger.info("Decompressed %s to %s", source, destination)
+            return TransferResult.completed(source, destination, started, size, "decompress")
+
+        except StorageOperationError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to decompress %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        decoded, _ = self._decode(source, self._downloader.open_read(source, buffer_size))
+        return decoded
+
+    def _decode(self, source: str, readable: BinaryIO) -> Tuple[BinaryIO, bool]:
+        try:
+            head = read_exactly(readable, len(HEADER_MAGIC))
+            if head != HEADER_MAGIC:
+                return io.BufferedReader(PrefixedReader(head, readable)), False
+            length = read_exactly(readable, 1)
+            codec = get_codec(read_exactly(readable, length[0]).decode("ascii") if length else "")
+        except ValueError as e:
+            readable.close()
+            raise PermanentStorageError(f"Cannot decode {source}: {str(e)}") from e
+        except OSError as e:
+            readable.close()
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+        decompressor = codec.decompressor()
+        decoded = TransformReader(readable, decompressor.decompress, _finisher(source, decompressor))
+        return io.BufferedReader(decoded), True
+
+
+def _finisher(source: str, decompressor: object) -> Callable[[], bytes]:
+    def finish() -> bytes:
+        data = decompressor.flush()
+        if not getattr(decompressor, "eof", True):
+            raise PermanentStorageError(f"Compressed object is truncated: {source}")
+        return data
+    return finish
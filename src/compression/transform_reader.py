@@ -0,0 +1,107 @@
+import io
+import queue
+import threading
+from typing import BinaryIO, Callable
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+
+DEFAULT_PIPELINE_DEPTH = 4
+_END = object()
+
+
+class TransformReader(io.RawIOBase):
+    def __init__(self, readable: BinaryIO, transform: Callable[[bytes], bytes] = None,
+                 finish: Callable[[], bytes] = None, prefix: bytes = b"", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 depth: int = DEFAULT_PIPELINE_DEPTH, close_source: bool = True):
+        self._readable = readable
+        self._close_source = close_source
+        self._transform = transform
+        self._finish = finish
+        self._chunk_size = chunk_size
+        self._chunks: queue.Queue = queue.Queue(depth)
+        self._pending = memoryview(prefix)
+        self._finished = False
+        self._stopped = threading.Event()
+        self.bytes_in = 0
+        self.bytes_out = len(prefix)
+        self._pump = threading.Thread(target=self._run, name="codec-pump", daemon=True)
+        self._pump.start()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if self._finished:
+                return 0
+            chunk = self._chunks.get()
+            if chunk is _END:
+                self._finished = True
+                return 0
+            if isinstance(chunk, BaseException):
+                self._finished = True
+                raise chunk
+            self._pending = memoryview(chunk)
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stopped.set()
+            self._pump.join()
+            if self._close_source:
+                self._readable.close()
+        super().close()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                data = self._readable.read(self._chunk_size)
+                if not data:
+                    break
+                self.bytes_in += len(data)
+                self._put(self._transform(data) if self._transform is not None else data)
+            if self._finish is not None and not self._stopped.is_set():
+                self._put(self._finish())
+            self._put(_END)
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item: object) -> None:
+        if isinstance(item, bytes):
+            if not item:
+                return
+            self.bytes_out += len(item)
+        while not self._stopped.is_set():
+            try:
+                self._chunks.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                continue
+
+
+class PrefixedReader(io.RawIOBase):
+    def __init__(self, prefix: bytes, readable: BinaryIO, close_source: bool = True):
+        self._pending = memoryview(prefix)
+        self._readable = readable
+        self._close_source = close_source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._pending:
+            data = self._readable.read(len(buffer))
+            if not data:
+                return 0
+            self._pending = memoryview(data)
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def close(self) -> None:
+        if not self.closed and self._close_source:
+            self._readable.close()
+        super().close()
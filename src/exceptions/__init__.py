@@ -1,8 +1,16 @@
 from .storage_exceptions import (
     FileNotFoundError,
     StorageOperationError,
-    InvalidPathError
+    IntegrityError,
+    InvalidPathError,
+    PermanentStorageError,
+    ThrottledError,
+    TransientStorageError,
+    classify_error,
+    is_retryable
 )
 
-__all__ = ['FileNotFoundError', 'StorageOperationError', 'InvalidPathError']
-
+__all__ = [
+    'FileNotFoundError', 'StorageOperationError', 'IntegrityError', 'InvalidPathError', 'PermanentStorageError',
+    'ThrottledError', 'TransientStorageError', 'classify_error', 'is_retryable'
+]
@@ -1,11 +1,54 @@
+import copy
+from typing import Optional
+
+
 class StorageOperationError(Exception):
     pass
 
 
-class FileNotFoundError(StorageOperationError):
+class TransientStorageError(StorageOperationError):
     pass
 
 
-class InvalidPathError(StorageOperationError):
+class ThrottledError(TransientStorageError):
+    def __init__(self, message: str = "Request throttled", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    def __reduce__(self):
+        return type(self), (str(self), self.retry_after)
+
+
+class IntegrityError(TransientStorageError):
+    def __init__(self, message: str, expected: Optional[str] = None, actual: Optional[str] = None):
+        super().__init__(message)
+        self.expected = expected
+        self.actual = actual
+
+    def __reduce__(self):
+        return type(self), (str(self), self.expected, self.actual)
+
+
+class PermanentStorageError(StorageOperationError):
     pass
 
+
+class FileNotFoundError(PermanentStorageError):
+    pass
+
+
+class InvalidPathError(PermanentStorageError):
+    pass
+
+
+def is_retryable(error: BaseException) -> bool:
+    return isinstance(error, (TransientStorageError, ConnectionError, TimeoutError))
+
+
+def classify_error(error: BaseException, message: str) -> StorageOperationError:
+    if isinstance(error, StorageOperationError):
+        # A fresh copy keeps the concrete type and its fields, so "raise ... from error" never chains to itself.
+        return copy.copy(error)
+    if is_retryable(error):
+        return TransientStorageError(message)
+    return StorageOperationError(message)
@@ -1,6 +1,46 @@
-from .amazon_storage_factory import AmazonStorageFactory
-from .local_disk_storage_factory import LocalDiskStorageFactory
-from .google_storage_factory import GoogleStorageFactory
+import importlib
+from typing import TYPE_CHECKING, Any, List
+from .registry import (ENTRY_POINT_GROUP, FactoryRegistry, available_factories, create_factory,
+                       factory_class_for_scheme, factory_registry, get_factory_class, register_factory)
 
-__all__ = ['AmazonStorageFactory', 'LocalDiskStorageFactory', 'GoogleStorageFactory']
+if TYPE_CHECKING:
+    from .amazon_storage_factory import AmazonStorageFactory
+    from .local_disk_storage_factory import LocalDiskStorageFactory
+    from .google_storage_factory import GoogleStorageFactory
+    from .caching_storage_factory import CachingStorageFactory
+    from .routing_storage_factory import RoutingStorageFactory
+    from .compressing_storage_factory import CompressingStorageFactory
+    from .scheme_routing_storage_factory import SchemeRoutingStorageFactory
+    from .verifying_storage_factory import VerifyingStorageFactory
+    from .rate_limited_storage_factory import RateLimitedStorageFactory
 
+_LAZY_FACTORIES = {
+    'AmazonStorageFactory': '.amazon_storage_factory',
+    'LocalDiskStorageFactory': '.local_disk_storage_factory',
+    'GoogleStorageFactory': '.google_storage_factory',
+    'CachingStorageFactory': '.caching_storage_factory',
+    'RoutingStorageFactory': '.routing_storage_factory',
+    'CompressingStorageFactory': '.compressing_storage_factory',
+    'SchemeRoutingStorageFactory': '.scheme_routing_storage_factory',
+    'VerifyingStorageFactory': '.verifying_storage_factory',
+    'RateLimitedStorageFactory': '.rate_limited_storage_factory',
+}
+
+__all__ = ['AmazonStorageFactory', 'LocalDiskStorageFactory', 'GoogleStorageFactory', 'CachingStorageFactory',
+           'RoutingStorageFactory', 'CompressingStorageFactory',
+           'SchemeRoutingStorageFactory', 'VerifyingStorageFactory', 'RateLimitedStorageFactory',
+           'ENTRY_POINT_GROUP', 'FactoryRegistry', 'available_factories', 'create_factory',
+           'factory_class_for_scheme', 'factory_registry', 'get_factory_class', 'register_factory']
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_FACTORIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,79 @@
 import os
+from typing import Any, Callable, Dict, Optional, Tuple
 from src.interfaces.storage_factory import IStorageFactory
 from src.interfaces.file_uploader import IFileUploader
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.interfaces.object_store_client import IObjectStoreClient
+from src.backends.connection_pool import ConnectionPool
 from src.products.amazon.s3_uploader import S3Uploader
 from src.products.amazon.s3_downloader import S3Downloader
+from src.products.amazon.async_s3_uploader import AsyncS3Uploader
+from src.products.amazon.async_s3_downloader import AsyncS3Downloader
+from src.products.amazon.s3_inspector import S3Inspector
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY
 
 
 class AmazonStorageFactory(IStorageFactory):
-    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None):
+    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None,
+                 client_factory: Callable[[], IObjectStoreClient] = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, checkpoint_dir: str = None,
+                 max_connections: int = 10, idle_timeout: float = 60.0):
+        self._credentials = (aws_access_key, aws_secret_key, region)
+        self._resolve_credentials()
+        self._pool = ConnectionPool(client_factory, max_connections, idle_timeout) if client_factory else None
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._journal = CheckpointJournal(checkpoint_dir) if checkpoint_dir else None
+
+    @property
+    def part_size(self) -> Optional[int]:
+        return self._part_size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for resolved in ("_aws_access_key", "_aws_secret_key", "_region"):
+            del state[resolved]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._resolve_credentials()
+
+    def _resolve_credentials(self) -> None:
+        aws_access_key, aws_secret_key, region = self._credentials
         self._aws_access_key = aws_access_key or os.getenv("AWS_ACCESS_KEY_ID")
         self._aws_secret_key = aws_secret_key or os.getenv("AWS_SECRET_ACCESS_KEY")
         self._region = region or os.getenv("AWS_REGION", "us-east-1")
 
+    def _product_credentials(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        # Pooled clients already carry their credentials, so the products only need them for the mock path.
+        if self._pool is not None:
+            return None, None, None
+        return self._aws_access_key, self._aws_secret_key, self._region
+
     def create_uploader(self) -> IFileUploader:
-        return S3Uploader(self._aws_access_key, self._aws_secret_key, self._region)
+        return S3Uploader(*self._product_credentials(),
+                          self._pool, self._part_size, self._max_concurrency, self._journal)
 
     def create_downloader(self) -> IFileDownloader:
-        return S3Downloader(self._aws_access_key, self._aws_secret_key, self._region)
+        return S3Downloader(*self._product_credentials(),
+                            self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncS3Uploader(*self._product_credentials(),
+                               self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncS3Downloader(*self._product_credentials(),
+                                 self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_inspector(self) -> IFileInspector:
+        return S3Inspector(*self._product_credentials(), self._pool)
 
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
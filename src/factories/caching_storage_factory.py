@@ -0,0 +1,38 @@
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.cache.caching_downloader import CachingDownloader
+from src.cache.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+
+
+class CachingStorageFactory(IStorageFactory):
+    def __init__(self, factory: IStorageFactory, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 hardlink: bool = False):
+        self._factory = factory
+        self._cache = DiskCache(cache_dir, max_bytes, hardlink)
+
+    @property
+    def cache(self) -> DiskCache:
+        return self._cache
+
+    def create_uploader(self) -> IFileUploader:
+        return self._factory.create_uploader()
+
+    def create_downloader(self) -> IFileDownloader:
+        return CachingDownloader(self._factory.create_downloader(), self._factory.create_inspector(), self._cache)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return self._factory.create_async_uploader()
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return self._factory.create_async_downloader()
+
+    def create_inspector(self) -> IFileInspector:
+        return self._factory.create_inspector()
+
+    def close(self) -> None:
+        self._cache.close()
+        self._factory.close()
@@ -0,0 +1,38 @@
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.compression.codec import DEFAULT_RATIO_THRESHOLD, get_codec
+from src.compression.compressing_uploader import CompressingUploader
+from src.compression.decompressing_downloader import DecompressingDownloader
+from src.compression.async_compressing_uploader import AsyncCompressingUploader
+from src.compression.async_decompressing_downloader import AsyncDecompressingDownloader
+
+
+class CompressingStorageFactory(IStorageFactory):
+    def __init__(self, factory: IStorageFactory, codec: str = "gzip", threshold: float = DEFAULT_RATIO_THRESHOLD):
+        get_codec(codec)
+        self._factory = factory
+        self._codec = codec
+        self._threshold = threshold
+
+    def create_uploader(self) -> IFileUploader:
+        return CompressingUploader(self._factory.create_uploader(), self._codec, self._threshold)
+
+    def create_downloader(self) -> IFileDownloader:
+        return DecompressingDownloader(self._factory.create_downloader())
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncCompressingUploader(self.create_uploader())
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncDecompressingDownloader(self.create_downloader())
+
+    def create_inspector(self) -> IFileInspector:
+        # Stored sizes and etags describe the encoded bytes, so dedup and sync cannot compare them with local files.
+        raise NotImplementedError(f"{type(self).__name__} does not provide an inspector")
+
+    def close(self) -> None:
+        self._factory.close()
@@ -1,19 +1,78 @@
 import os
+from typing import Any, Callable, Dict, Optional, Tuple
 from src.interfaces.storage_factory import IStorageFactory
 from src.interfaces.file_uploader import IFileUploader
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.interfaces.object_store_client import IObjectStoreClient
+from src.backends.connection_pool import ConnectionPool
 from src.products.google.gcs_uploader import GCSUploader
 from src.products.google.gcs_downloader import GCSDownloader
+from src.products.google.async_gcs_uploader import AsyncGCSUploader
+from src.products.google.async_gcs_downloader import AsyncGCSDownloader
+from src.products.google.gcs_inspector import GCSInspector
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY
 
 
 class GoogleStorageFactory(IStorageFactory):
-    def __init__(self, project_id: str = None, credentials_path: str = None):
+    def __init__(self, project_id: str = None, credentials_path: str = None,
+                 client_factory: Callable[[], IObjectStoreClient] = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, checkpoint_dir: str = None,
+                 max_connections: int = 10, idle_timeout: float = 60.0):
+        self._credentials = (project_id, credentials_path)
+        self._resolve_credentials()
+        self._pool = ConnectionPool(client_factory, max_connections, idle_timeout) if client_factory else None
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._journal = CheckpointJournal(checkpoint_dir) if checkpoint_dir else None
+
+    @property
+    def part_size(self) -> Optional[int]:
+        return self._part_size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for resolved in ("_project_id", "_credentials_path"):
+            del state[resolved]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._resolve_credentials()
+
+    def _resolve_credentials(self) -> None:
+        project_id, credentials_path = self._credentials
         self._project_id = project_id or os.getenv("GOOGLE_CLOUD_PROJECT")
         self._credentials_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
+    def _product_credentials(self) -> Tuple[Optional[str], Optional[str]]:
+        # Pooled clients already carry their credentials, so the products only need them for the mock path.
+        if self._pool is not None:
+            return None, None
+        return self._project_id, self._credentials_path
+
     def create_uploader(self) -> IFileUploader:
-        return GCSUploader(self._project_id, self._credentials_path)
+        return GCSUploader(*self._product_credentials(),
+                           self._pool, self._part_size, self._max_concurrency, self._journal)
 
     def create_downloader(self) -> IFileDownloader:
-        return GCSDownloader(self._project_id, self._credentials_path)
+        return GCSDownloader(*self._product_credentials(),
+                             self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncGCSUploader(*self._product_credentials(),
+                                self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncGCSDownloader(*self._product_credentials(),
+                                  self._pool, self._part_size, self._max_concurrency, self._journal)
+
+    def create_inspector(self) -> IFileInspector:
+        return GCSInspector(*self._product_credentials(), self._pool)
 
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
@@ -1,14 +1,35 @@
 from src.interfaces.storage_factory import IStorageFactory
 from src.interfaces.file_uploader import IFileUploader
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
 from src.products.local.disk_uploader import DiskUploader
 from src.products.local.disk_downloader import DiskDownloader
+from src.products.local.async_disk_uploader import AsyncDiskUploader
+from src.products.local.async_disk_downloader import AsyncDiskDownloader
+from src.products.local.copy_engine import AUTO, DEFAULT_BUFFER_SIZE, validate_strategy
+from src.products.local.disk_inspector import DiskInspector
+from src.transfer.checkpoint import CheckpointJournal
 
 
 class LocalDiskStorageFactory(IStorageFactory):
+    def __init__(self, copy_strategy: str = AUTO, checkpoint_dir: str = None):
+        self._copy_strategy = validate_strategy(copy_strategy)
+        self._journal = CheckpointJournal(checkpoint_dir) if checkpoint_dir else None
+
     def create_uploader(self) -> IFileUploader:
-        return DiskUploader()
+        return DiskUploader(self._copy_strategy, DEFAULT_BUFFER_SIZE, self._journal)
 
     def create_downloader(self) -> IFileDownloader:
-        return DiskDownloader()
+        return DiskDownloader(self._copy_strategy, DEFAULT_BUFFER_SIZE, self._journal)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncDiskUploader(copy_strategy=self._copy_strategy)
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncDiskDownloader(copy_strategy=self._copy_strategy)
+
+    def create_inspector(self) -> IFileInspector:
+        return DiskInspector()
 
@@ -0,0 +1,42 @@
+from typing import Tuple
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.throttling.rate_limiter import RateLimiter
+from src.throttling.rate_limited_uploader import AsyncRateLimitedUploader, RateLimitedUploader
+from src.throttling.rate_limited_downloader import AsyncRateLimitedDownloader, RateLimitedDownloader
+
+
+class RateLimitedStorageFactory(IStorageFactory):
+    def __init__(self, factory: IStorageFactory, *limiters: RateLimiter):
+        if not limiters:
+            raise ValueError("At least one rate limiter is required")
+        self._factory = factory
+        self._limiters = limiters
+
+    @property
+    def limiters(self) -> Tuple[RateLimiter, ...]:
+        return self._limiters
+
+    def create_uploader(self) -> IFileUploader:
+        return RateLimitedUploader(self._factory.create_uploader(), self._limiters)
+
+    def create_downloader(self) -> IFileDownloader:
+        return RateLimitedDownloader(self._factory.create_downloader(), self._limiters)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncRateLimitedUploader(self._factory.create_async_uploader(), self._limiters,
+                                        self._factory.create_uploader())
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncRateLimitedDownloader(self._factory.create_async_downloader(), self._limiters,
+                                          self._factory.create_downloader())
+
+    def create_inspector(self) -> IFileInspector:
+        return self._factory.create_inspector()
+
+    def close(self) -> None:
+        self._factory.close()
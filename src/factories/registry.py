@@ -0,0 +1,156 @@
+import importlib
+import threading
+from typing import Dict, Iterable, List, Optional, Type, Union
+from src.interfaces.storage_factory import IStorageFactory
+from src.utils.logger import get_logger
+
+ENTRY_POINT_GROUP = "multi_cloud_storage.factories"
+
+FactoryTarget = Union[str, Type[IStorageFactory]]
+
+
+def _load_target(target: FactoryTarget) -> Type[IStorageFactory]:
+    if not isinstance(target, str):
+        return target
+    module_name, _, attribute = target.partition(":")
+    factory_class = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        factory_class = getattr(factory_class, part)
+    return factory_class
+
+
+def _entry_points(group: str) -> list:
+    # importlib.metadata costs more to import than every local provider, so it is only loaded on a lookup miss.
+    from importlib import metadata
+    discovered = metadata.entry_points()
+    if hasattr(discovered, "select"):
+        return list(discovered.select(group=group))
+    return list(discovered.get(group, ()))
+
+
+class FactoryRegistry:
+    def __init__(self, entry_point_group: str = ENTRY_POINT_GROUP):
+        self._logger = get_logger(self.__class__.__name__)
+        self._lock = threading.RLock()
+        self._group = entry_point_group
+        self._targets: Dict[str, FactoryTarget] = {}
+        self._schemes: Dict[str, str] = {}
+        self._discovered = False
+
+    def register(self, name: str, target: FactoryTarget, schemes: Iterable[str] = (),
+                 replace: bool = False) -> None:
+        name = name.lower()
+        schemes = [scheme.lower() for scheme in schemes]
+        with self._lock:
+            if not replace and name in self._targets:
+                raise ValueError(f"Storage factory already registered: {name}")
+            for scheme in schemes:
+                owner = self._schemes.get(scheme)
+                if not replace and owner not in (None, name):
+                    raise ValueError(f"Scheme {scheme!r} is already handled by {owner}")
+            self._targets[name] = target
+            for scheme in schemes:
+                self._schemes[scheme] = name
+
+    def names(self) -> List[str]:
+        self.discover()
+        with self._lock:
+            return sorted(self._targets)
+
+    def load(self, name: str) -> Type[IStorageFactory]:
+        name = name.lower()
+        with self._lock:
+            target = self._targets.get(name)
+        if target is None and self.discover():
+            with self._lock:
+                target = self._targets.get(name)
+        if target is None:
+            raise ValueError(f"Unknown storage factory: {name} (available: {', '.join(self.names())})")
+        factory_class = _load_target(target)
+        with self._lock:
+            if self._targets.get(name) is target:
+                self._targets[name] = factory_class
+        return factory_class
+
+    def for_scheme(self, scheme: str) -> Type[IStorageFactory]:
+        scheme = scheme.lower()
+        with self._lock:
+            name = self._schemes.get(scheme)
+        if name is None and self.discover():
+            name = self._scheme_from_plugins(scheme)
+        if name is None:
+            raise ValueError(f"No storage factory registered for scheme: {scheme}")
+        return self.load(name)
+
+    def create(self, name_or_scheme: str, **kwargs) -> IStorageFactory:
+        key = name_or_scheme.lower()
+        with self._lock:
+            by_scheme = key not in self._targets and key in self._schemes
+        return (self.for_scheme(key) if by_scheme else self.load(key))(**kwargs)
+
+    def discover(self) -> bool:
+        with self._lock:
+            if self._discovered:
+                return False
+            self._discovered = True
+        added = False
+        try:
+            entry_points = _entry_points(self._group)
+        except Exception as e:
+            self._logger.warning("Storage factory plugin discovery failed: %s", e)
+            return False
+        for entry_point in entry_points:
+            with self._lock:
+                if entry_point.name.lower() in self._targets:
+                    continue
+                self._targets[entry_point.name.lower()] = entry_point.value
+            self._logger.debug("Discovered storage factory plugin %s -> %s", entry_point.name, entry_point.value)
+            added = True
+        return added
+
+    def _scheme_from_plugins(self, scheme: str) -> Optional[str]:
+        with self._lock:
+            pending = [(name, target) for name, target in self._targets.items() if isinstance(target, str)]
+        for name, target in pending:
+            try:
+                factory_class = self.load(name)
+            except Exception as e:
+                self._logger.warning("Failed to load storage factory %s from %s: %s", name, target, e)
+                continue
+            declared = [declared.lower() for declared in getattr(factory_class, "schemes", ())]
+            with self._lock:
+                for declared_scheme in declared:
+                    self._schemes.setdefault(declared_scheme, name)
+            if scheme in declared:
+                return name
+        return None
+
+
+_registry = FactoryRegistry()
+_registry.register("local", "src.factories.local_disk_storage_factory:LocalDiskStorageFactory", schemes=("file",))
+_registry.register("s3", "src.factories.amazon_storage_factory:AmazonStorageFactory", schemes=("s3",))
+_registry.register("gcs", "src.factories.google_storage_factory:GoogleStorageFactory", schemes=("gs",))
+
+
+def factory_registry() -> FactoryRegistry:
+    return _registry
+
+
+def register_factory(name: str, target: FactoryTarget, schemes: Iterable[str] = (), replace: bool = False) -> None:
+    _registry.register(name, target, schemes, replace)
+
+
+def get_factory_class(name: str) -> Type[IStorageFactory]:
+    return _registry.load(name)
+
+
+def factory_class_for_scheme(scheme: str) -> Type[IStorageFactory]:
+    return _registry.for_scheme(scheme)
+
+
+def create_factory(name_or_scheme: str, **kwargs) -> IStorageFactory:
+    return _registry.create(name_or_scheme, **kwargs)
+
+
+def available_factories() -> List[str]:
+    return _registry.names()
@@ -0,0 +1,46 @@
+from typing import Sequence, Tuple
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.routing.latency_tracker import LatencyTracker
+from src.routing.routing_downloader import DEFAULT_HEDGE_DELAY, Replica, RoutingDownloader
+
+
+class RoutingStorageFactory(IStorageFactory):
+    def __init__(self, replicas: Sequence[Tuple[IStorageFactory, str]], max_hedges: int = 1,
+                 default_hedge_delay: float = DEFAULT_HEDGE_DELAY):
+        if not replicas:
+            raise ValueError("At least one replica is required")
+        self._replicas = list(replicas)
+        self._primary = self._replicas[0][0]
+        self._tracker = LatencyTracker()
+        self._max_hedges = max_hedges
+        self._default_hedge_delay = default_hedge_delay
+
+    @property
+    def tracker(self) -> LatencyTracker:
+        return self._tracker
+
+    def create_uploader(self) -> IFileUploader:
+        return self._primary.create_uploader()
+
+    def create_downloader(self) -> IFileDownloader:
+        replicas = [Replica(prefix, prefix, factory.create_downloader()) for factory, prefix in self._replicas]
+        return RoutingDownloader(replicas, self._tracker, self._max_hedges,
+                                 default_hedge_delay=self._default_hedge_delay)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return self._primary.create_async_uploader()
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return self._primary.create_async_downloader()
+
+    def create_inspector(self) -> IFileInspector:
+        return self._primary.create_inspector()
+
+    def close(self) -> None:
+        for factory, _ in self._replicas:
+            factory.close()
@@ -0,0 +1,50 @@
+from typing import List, Mapping
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.routing.scheme_router import (
+    AsyncSchemeRoutingDownloader,
+    AsyncSchemeRoutingUploader,
+    SchemeRoutingDownloader,
+    SchemeRoutingInspector,
+    SchemeRoutingUploader
+)
+from src.utils.paths import LOCAL_SCHEME
+
+
+class SchemeRoutingStorageFactory(IStorageFactory):
+    def __init__(self, factories: Mapping[str, IStorageFactory]):
+        if not factories:
+            raise ValueError("At least one storage factory is required")
+        self._factories = {scheme.rstrip(":/") or LOCAL_SCHEME: factory for scheme, factory in factories.items()}
+
+    @property
+    def schemes(self) -> List[str]:
+        return sorted(self._factories)
+
+    def create_uploader(self) -> IFileUploader:
+        return SchemeRoutingUploader({scheme: factory.create_uploader()
+                                      for scheme, factory in self._factories.items()})
+
+    def create_downloader(self) -> IFileDownloader:
+        return SchemeRoutingDownloader({scheme: factory.create_downloader()
+                                        for scheme, factory in self._factories.items()})
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return AsyncSchemeRoutingUploader({scheme: factory.create_async_uploader()
+                                           for scheme, factory in self._factories.items()})
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return AsyncSchemeRoutingDownloader({scheme: factory.create_async_downloader()
+                                             for scheme, factory in self._factories.items()})
+
+    def create_inspector(self) -> IFileInspector:
+        return SchemeRoutingInspector({scheme: factory.create_inspector()
+                                       for scheme, factory in self._factories.items()})
+
+    def close(self) -> None:
+        for factory in self._factories.values():
+            factory.close()
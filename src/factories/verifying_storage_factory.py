@@ -0,0 +1,40 @@
+from typing import Sequence
+from src.interfaces.storage_factory import IStorageFactory
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.integrity.checksums import MD5, SUPPORTED_ALGORITHMS
+from src.integrity.verifying_downloader import VerifyingDownloader
+from src.integrity.verifying_uploader import VerifyingUploader
+
+
+class VerifyingStorageFactory(IStorageFactory):
+    def __init__(self, factory: IStorageFactory, algorithms: Sequence[str] = (MD5,)):
+        unsupported = [algorithm for algorithm in algorithms if algorithm not in SUPPORTED_ALGORITHMS]
+        if unsupported:
+            raise ValueError(f"Unsupported checksum algorithms: {', '.join(unsupported)}")
+        self._factory = factory
+        self._algorithms = tuple(algorithms)
+        self._part_size = getattr(factory, "part_size", None)
+
+    def create_uploader(self) -> IFileUploader:
+        return VerifyingUploader(self._factory.create_uploader(), self._factory.create_inspector(),
+                                 self._algorithms, self._part_size)
+
+    def create_downloader(self) -> IFileDownloader:
+        return VerifyingDownloader(self._factory.create_downloader(), self._factory.create_inspector(),
+                                   self._algorithms, self._part_size)
+
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        return self._factory.create_async_uploader()
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        return self._factory.create_async_downloader()
+
+    def create_inspector(self) -> IFileInspector:
+        return self._factory.create_inspector()
+
+    def close(self) -> None:
+        self._factory.close()
@@ -0,0 +1,17 @@
+from .memory_sink import InMemoryMetricsSink
+from .registry import (
+    active_sinks,
+    clear_sinks,
+    instrumented,
+    record_counter,
+    record_gauge,
+    record_histogram,
+    record_retry,
+    register_sink,
+    unregister_sink
+)
+
+__all__ = [
+    'InMemoryMetricsSink', 'active_sinks', 'clear_sinks', 'instrumented', 'record_counter', 'record_gauge',
+    'record_histogram', 'record_retry', 'register_sink', 'unregister_sink'
+]
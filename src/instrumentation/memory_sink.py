@@ -0,0 +1,116 @@
+import bisect
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple
+from src.interfaces.metrics_sink import IMetricsSink, Span
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+SIZE_BUCKETS = tuple(float(1024 * 4 ** power) for power in range(12))
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class InMemoryMetricsSink(IMetricsSink):
+    def __init__(self, max_spans: int = 1000):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._histograms: Dict[str, Dict[LabelSet, Histogram]] = {}
+        self._gauges: Dict[str, Dict[LabelSet, float]] = {}
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def increment(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = _label_set(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = _label_set(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(SIZE_BUCKETS if name.endswith("_bytes") else LATENCY_BUCKETS)
+            histogram.observe(value)
+
+    def gauge(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = _label_set(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def span_finished(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return sum(value for key, value in self._counters.get(name, {}).items()
+                       if labels.items() <= dict(key).items())
+
+    def gauge_value(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_set(labels))
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_set(labels))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._gauges.clear()
+            self.spans.clear()
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._gauges):
+                lines.append(f"# TYPE {name} gauge")
+                for key, value in sorted(self._gauges[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _label_set(labels: Dict[str, str]) -> LabelSet:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{name}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
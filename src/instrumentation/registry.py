@@ -0,0 +1,123 @@
+import functools
+import inspect
+import os
+import time
+from typing import Callable, Optional, Tuple
+from src.interfaces.metrics_sink import IMetricsSink, Span
+from src.interfaces.transfer_result import TransferResult
+
+OPERATIONS_TOTAL = "storage_operations_total"
+ERRORS_TOTAL = "storage_operation_errors_total"
+RETRIES_TOTAL = "storage_operation_retries_total"
+BYTES_TOTAL = "storage_bytes_total"
+DURATION_SECONDS = "storage_operation_duration_seconds"
+TRANSFER_SIZE_BYTES = "storage_transfer_size_bytes"
+
+_sinks: Tuple[IMetricsSink, ...] = ()
+
+
+def register_sink(sink: IMetricsSink) -> IMetricsSink:
+    global _sinks
+    if sink not in _sinks:
+        _sinks = _sinks + (sink,)
+    return sink
+
+
+def unregister_sink(sink: IMetricsSink) -> None:
+    global _sinks
+    _sinks = tuple(registered for registered in _sinks if registered is not sink)
+
+
+def clear_sinks() -> None:
+    global _sinks
+    _sinks = ()
+
+
+def active_sinks() -> Tuple[IMetricsSink, ...]:
+    return _sinks
+
+
+def record_retry(provider: str, operation: str) -> None:
+    for sink in _sinks:
+        sink.increment(RETRIES_TOTAL, 1, {"provider": provider, "operation": operation})
+
+
+def record_gauge(name: str, value: float, **labels: str) -> None:
+    for sink in _sinks:
+        sink.gauge(name, value, labels)
+
+
+def record_histogram(name: str, value: float, **labels: str) -> None:
+    for sink in _sinks:
+        sink.observe(name, value, labels)
+
+
+def record_counter(name: str, value: float = 1, **labels: str) -> None:
+    for sink in _sinks:
+        sink.increment(name, value, labels)
+
+
+def instrumented(operation: str, target: str = None, size_of: str = None) -> Callable:
+    def decorate(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        def start(instance, args, kwargs) -> Tuple[Span, Optional[str]]:
+            arguments = signature.bind(instance, *args, **kwargs).arguments
+            span = Span(getattr(instance, "provider_name", type(instance).__name__), operation,
+                        arguments.get(target), time.perf_counter_ns())
+            for sink in _sinks:
+                sink.span_started(span)
+            return span, arguments.get(size_of)
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if not _sinks:
+                    return await method(self, *args, **kwargs)
+                span, sized = start(self, args, kwargs)
+                try:
+                    result = await method(self, *args, **kwargs)
+                except BaseException as e:
+                    _finish(span, sized, e)
+                    raise
+                _finish(span, sized, None, result)
+                return result
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _sinks:
+                return method(self, *args, **kwargs)
+            span, sized = start(self, args, kwargs)
+            try:
+                result = method(self, *args, **kwargs)
+            except BaseException as e:
+                _finish(span, sized, e)
+                raise
+            _finish(span, sized, None, result)
+            return result
+        return wrapper
+    return decorate
+
+
+def _finish(span: Span, sized: Optional[str], error: Optional[BaseException], result: object = None) -> None:
+    span.end_ns = time.perf_counter_ns()
+    span.error = error
+    if isinstance(result, TransferResult):
+        span.bytes = result.bytes_transferred
+    elif error is None and isinstance(sized, str):
+        try:
+            span.bytes = os.stat(sized).st_size
+        except OSError:
+            span.bytes = 0
+    labels = span.labels
+    outcome = "success" if error is None else "error"
+    for sink in _sinks:
+        sink.increment(OPERATIONS_TOTAL, 1, dict(labels, outcome=outcome))
+        sink.observe(DURATION_SECONDS, span.duration, labels)
+        if error is not None:
+            sink.increment(ERRORS_TOTAL, 1, dict(labels, error=type(error).__name__))
+        elif span.bytes:
+            sink.increment(BYTES_TOTAL, span.bytes, labels)
+            sink.observe(TRANSFER_SIZE_BYTES, span.bytes, labels)
+        sink.span_finished(span)
@@ -0,0 +1,18 @@
+from .checksums import (
+    CRC32C,
+    MD5,
+    SHA256,
+    Checksums,
+    HashingReader,
+    IntegrityResult,
+    crc32c,
+    match_etag,
+    verify_etag
+)
+from .verifying_uploader import VerifyingUploader
+from .verifying_downloader import VerifyingDownloader
+
+__all__ = [
+    'CRC32C', 'MD5', 'SHA256', 'Checksums', 'HashingReader', 'IntegrityResult', 'crc32c', 'match_etag',
+    'verify_etag', 'VerifyingUploader', 'VerifyingDownloader'
+]
@@ -0,0 +1,169 @@
+import hashlib
+import io
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Sequence
+from src.instrumentation import record_counter
+from src.utils.logger import get_logger
+from src.exceptions import IntegrityError
+
+try:
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+MD5 = "md5"
+SHA256 = "sha256"
+CRC32C = "crc32c"
+SUPPORTED_ALGORITHMS = (MD5, SHA256, CRC32C)
+INTEGRITY_CHECKS_METRIC = "storage_integrity_checks_total"
+
+_CRC32C_POLYNOMIAL = 0x82F63B78
+
+
+def _crc32c_table() -> List[int]:
+    table = []
+    for byte in range(256):
+        value = byte
+        for _ in range(8):
+            value = (value >> 1) ^ _CRC32C_POLYNOMIAL if value & 1 else value >> 1
+        table.append(value)
+    return table
+
+
+_CRC32C_TABLE = _crc32c_table()
+_crc32c_fallback_warned = False
+
+
+def crc32c(data: bytes, value: int = 0) -> int:
+    if google_crc32c is not None:
+        return google_crc32c.extend(value, bytes(data))
+    table = _CRC32C_TABLE
+    crc = value ^ 0xFFFFFFFF
+    for byte in bytes(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+class _Crc32c:
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data: bytes) -> None:
+        self._value = crc32c(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def _warn_crc32c_fallback() -> None:
+    global _crc32c_fallback_warned
+    if google_crc32c is not None or _crc32c_fallback_warned:
+        return
+    _crc32c_fallback_warned = True
+    get_logger("Checksums").warning("google-crc32c is not installed: CRC32C falls back to a pure-Python loop that "
+                                    "hashes only a few MB/s. Install google-crc32c or drop crc32c from algorithms.")
+
+
+def _new_checksum(algorithm: str):
+    if algorithm == CRC32C:
+        _warn_crc32c_fallback()
+        return _Crc32c()
+    if algorithm in (MD5, SHA256):
+        return hashlib.new(algorithm)
+    raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+
+
+class Checksums:
+    def __init__(self, algorithms: Sequence[str] = (MD5,), part_size: int = None):
+        self._digests = {algorithm: _new_checksum(algorithm) for algorithm in dict.fromkeys(algorithms)}
+        self._part_size = part_size
+        self._part = hashlib.md5() if part_size else None
+        self._part_filled = 0
+        self._part_digests: List[bytes] = []
+        self.size = 0
+
+    def update(self, data: bytes) -> None:
+        for digest in self._digests.values():
+            digest.update(data)
+        self.size += len(data)
+        if self._part is None:
+            return
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self._part_size - self._part_filled)
+            self._part.update(view[:take])
+            self._part_filled += take
+            view = view[take:]
+            if self._part_filled == self._part_size:
+                self._part_digests.append(self._part.digest())
+                self._part, self._part_filled = hashlib.md5(), 0
+
+    def hexdigests(self) -> Dict[str, str]:
+        return {algorithm: digest.hexdigest() for algorithm, digest in self._digests.items()}
+
+    def multipart_etag(self) -> Optional[str]:
+        if self._part is None:
+            return None
+        digests = self._part_digests + ([self._part.digest()] if self._part_filled else [])
+        if len(digests) < 2:
+            return None
+        return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+class HashingReader(io.RawIOBase):
+    def __init__(self, readable: BinaryIO, checksums: Checksums):
+        self._readable = readable
+        self.checksums = checksums
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._readable.read(len(buffer))
+        if not data:
+            return 0
+        count = len(data)
+        buffer[:count] = data
+        self.checksums.update(data)
+        return count
+
+
+@dataclass
+class IntegrityResult:
+    path: str
+    size: int
+    checksums: Dict[str, str] = field(default_factory=dict)
+    provider_checksum: Optional[str] = None
+    verified: bool = False
+
+    def __bool__(self) -> bool:
+        return self.verified
+
+
+def match_etag(etag: Optional[str], checksums: Checksums) -> Optional[bool]:
+    if not etag:
+        return None
+    etag = etag.strip('"')
+    md5 = checksums.hexdigests().get(MD5)
+    _, separator, count = etag.partition("-")
+    if not separator:
+        return etag == md5 if md5 and len(etag) == 32 else None
+    if md5 and etag == f"{md5}-{count}":
+        return True
+    multipart = checksums.multipart_etag()
+    if multipart is None or not multipart.endswith(f"-{count}"):
+        return None
+    return multipart == etag
+
+
+def verify_etag(result: IntegrityResult, etag: Optional[str], checksums: Checksums) -> IntegrityResult:
+    matched = match_etag(etag, checksums)
+    result.provider_checksum = etag
+    if matched is False:
+        record_counter(INTEGRITY_CHECKS_METRIC, outcome="mismatch")
+        computed = result.checksums.get(MD5)
+        raise IntegrityError(f"Checksum mismatch for {result.path}: provider reported {etag}, computed {computed}",
+                             etag, computed)
+    result.verified = bool(matched)
+    record_counter(INTEGRITY_CHECKS_METRIC, outcome="verified" if matched else "unverified")
+    return result
@@ -0,0 +1,65 @@
+import os
+import shutil
+import time
+from typing import BinaryIO, Sequence
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.file_inspector import IFileInspector
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented, record_counter
+from src.utils.logger import get_logger
+from src.exceptions import FileNotFoundError, IntegrityError, StorageOperationError, classify_error
+from src.transfer.chunked_transfer import choose_part_size
+from .checksums import INTEGRITY_CHECKS_METRIC, MD5, Checksums, HashingReader, IntegrityResult, verify_etag
+
+
+class VerifyingDownloader(IFileDownloader):
+    provider_name = "integrity"
+
+    def __init__(self, downloader: IFileDownloader, inspector: IFileInspector, algorithms: Sequence[str] = (MD5,),
+                 part_size: int = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._downloader = downloader
+        self._inspector = inspector
+        self._algorithms = tuple(dict.fromkeys((MD5,) + tuple(algorithms)))
+        self._part_size = part_size
+
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        result = self.download_verified(source, destination)
+        return TransferResult.completed(source, destination, started, result.size, "verified",
+                                        result.provider_checksum)
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        return self._downloader.open_read(source, buffer_size)
+
+    def download_verified(self, source: str, destination: str) -> IntegrityResult:
+        reported = self._inspector.stat(source)
+        if reported is None:
+            raise FileNotFoundError(f"Source not found: {source}")
+        checksums = Checksums(self._algorithms, choose_part_size(reported.size, self._part_size))
+        partial = f"{destination}.partial"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+            with self._downloader.open_read(source) as readable, open(partial, "wb") as target:
+                shutil.copyfileobj(HashingReader(readable, checksums), target)
+            result = IntegrityResult(source, checksums.size, checksums.hexdigests())
+            if checksums.size != reported.size:
+                record_counter(INTEGRITY_CHECKS_METRIC, outcome="mismatch")
+                raise IntegrityError(f"Size mismatch downloading {source}: expected {reported.size} bytes, "
+                                     f"received {checksums.size}", str(reported.size), str(checksums.size))
+            verify_etag(result, reported.etag or reported.content_hash, checksums)
+            os.replace(partial, destination)
+            return result
+
+        except IntegrityError as e:
+            self._logger.error("%s", e)
+            raise
+        except StorageOperationError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
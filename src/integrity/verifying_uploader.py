@@ -0,0 +1,71 @@
+import time
+from typing import BinaryIO, Dict, Sequence
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_inspector import IFileInspector
+from src.interfaces.transfer_result import STREAM_SOURCE, TransferResult
+from src.instrumentation import instrumented, record_counter
+from src.utils.logger import get_logger
+from src.utils.paths import require_file
+from src.exceptions import IntegrityError, classify_error
+from src.transfer.chunked_transfer import DEFAULT_PART_SIZE
+from .checksums import INTEGRITY_CHECKS_METRIC, MD5, Checksums, HashingReader, IntegrityResult, verify_etag
+
+
+class VerifyingUploader(IFileUploader):
+    provider_name = "integrity"
+
+    def __init__(self, uploader: IFileUploader, inspector: IFileInspector, algorithms: Sequence[str] = (MD5,),
+                 part_size: int = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._uploader = uploader
+        self._inspector = inspector
+        self._algorithms = tuple(dict.fromkeys((MD5,) + tuple(algorithms)))
+        self._part_size = part_size or DEFAULT_PART_SIZE
+
+    @instrumented("upload", target="destination", size_of="file_path")
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        result = self.upload_verified(file_path, destination, metadata)
+        return TransferResult.completed(file_path, destination, started, result.size, "verified",
+                                        result.provider_checksum)
+
+    @instrumented("upload_stream", target="destination")
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        result = self.upload_stream_verified(readable, destination, metadata)
+        return TransferResult.completed(STREAM_SOURCE, destination, started, result.size, "verified",
+                                        result.provider_checksum)
+
+    def delete(self, destination: str) -> bool:
+        return self._uploader.delete(destination)
+
+    def upload_verified(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> IntegrityResult:
+        require_file(file_path)
+        try:
+            readable = open(file_path, "rb")
+        except OSError as e:
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+        with readable:
+            return self.upload_stream_verified(readable, destination, metadata)
+
+    def upload_stream_verified(self, readable: BinaryIO, destination: str,
+                               metadata: Dict[str, str] = None) -> IntegrityResult:
+        checksums = Checksums(self._algorithms, self._part_size)
+        self._uploader.upload_stream(HashingReader(readable, checksums), destination, metadata)
+        reported = self._inspector.stat(destination)
+        result = IntegrityResult(destination, checksums.size, checksums.hexdigests())
+        if reported is None:
+            self._logger.warning("No metadata reported for %s; integrity not verified", destination)
+            record_counter(INTEGRITY_CHECKS_METRIC, outcome="unverified")
+            return result
+        if reported.size != checksums.size:
+            record_counter(INTEGRITY_CHECKS_METRIC, outcome="mismatch")
+            raise IntegrityError(f"Size mismatch after upload to {destination}: sent {checksums.size} bytes, "
+                                 f"stored {reported.size}", str(checksums.size), str(reported.size))
+        try:
+            return verify_etag(result, reported.etag, checksums)
+        except IntegrityError as e:
+            self._logger.error("%s", e)
+            raise
+
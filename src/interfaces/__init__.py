@@ -1,6 +1,15 @@
 from .file_uploader import IFileUploader
 from .file_downloader import IFileDownloader
+from .async_file_uploader import IAsyncFileUploader
+from .async_file_downloader import IAsyncFileDownloader
+from .file_inspector import FileMetadata, IFileInspector
+from .metrics_sink import IMetricsSink, Span
+from .object_store_client import IObjectStoreClient, ObjectInfo
 from .storage_factory import IStorageFactory
+from .transfer_result import STREAM_SOURCE, TransferResult
 
-__all__ = ['IFileUploader', 'IFileDownloader', 'IStorageFactory']
-
+__all__ = [
+    'IFileUploader', 'IFileDownloader', 'IAsyncFileUploader', 'IAsyncFileDownloader',
+    'IFileInspector', 'FileMetadata', 'IMetricsSink', 'Span', 'IObjectStoreClient', 'ObjectInfo',
+    'IStorageFactory', 'TransferResult'
+]
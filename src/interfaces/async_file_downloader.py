@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from .transfer_result import TransferResult
+
+
+class IAsyncFileDownloader(ABC):
+    @abstractmethod
+    async def download(self, source: str, destination: str) -> TransferResult:
+        pass
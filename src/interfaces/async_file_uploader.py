@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from .transfer_result import TransferResult
+
+
+class IAsyncFileUploader(ABC):
+    @abstractmethod
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        pass
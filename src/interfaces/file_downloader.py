@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterator
+from src.utils.streams import DEFAULT_CHUNK_SIZE, iter_chunks
+from .transfer_result import TransferResult
 
 
 class IFileDownloader(ABC):
     @abstractmethod
-    def download(self, source: str, destination: str) -> bool:
+    def download(self, source: str, destination: str) -> TransferResult:
         pass
 
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming reads")
+
+    def iter_chunks(self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        return iter_chunks(self.open_read(source, chunk_size), chunk_size)
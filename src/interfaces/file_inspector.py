@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    path: str
+    size: int
+    etag: Optional[str] = None
+    content_hash: Optional[str] = None
+    modified_ns: Optional[int] = None
+
+
+class IFileInspector(ABC):
+    @abstractmethod
+    def stat(self, path: str) -> Optional[FileMetadata]:
+        pass
+
+    @abstractmethod
+    def content_hash(self, path: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def list_files(self, prefix: str) -> Iterator[FileMetadata]:
+        pass
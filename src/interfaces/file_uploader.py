@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, Iterable
+from src.utils.streams import ChunkReader
+from .transfer_result import TransferResult
 
 
 class IFileUploader(ABC):
     @abstractmethod
-    def upload(self, file_path: str, destination: str) -> bool:
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
         pass
 
+    def upload_stream(self, readable: BinaryIO, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        raise NotImplementedError(f"{type(self).__name__} does not support stream uploads")
+
+    def upload_chunks(self, chunks: Iterable[bytes], destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        return self.upload_stream(ChunkReader(chunks), destination, metadata)
+
+    def delete(self, destination: str) -> bool:
+        raise NotImplementedError(f"{type(self).__name__} does not support deletes")
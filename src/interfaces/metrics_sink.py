@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class Span:
+    provider: str
+    operation: str
+    target: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    bytes: int = 0
+    error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> float:
+        return ((self.end_ns or self.start_ns) - self.start_ns) / 1e9
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        return {"provider": self.provider, "operation": self.operation}
+
+
+class IMetricsSink(ABC):
+    @abstractmethod
+    def increment(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        pass
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        pass
+
+    def gauge(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        pass
+
+    def span_started(self, span: Span) -> None:
+        pass
+
+    def span_finished(self, span: Span) -> None:
+        pass
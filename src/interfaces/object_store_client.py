@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    bucket: str
+    key: str
+    size: int
+    etag: str
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+class IObjectStoreClient(ABC):
+    @abstractmethod
+    def put_object(self, bucket: str, key: str, data: bytes, metadata: Dict[str, str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def get_object(self, bucket: str, key: str, start: int = 0, end: int = None) -> bytes:
+        pass
+
+    @abstractmethod
+    def head_object(self, bucket: str, key: str) -> ObjectInfo:
+        pass
+
+    @abstractmethod
+    def list_objects(self, bucket: str, prefix: str = "", start_after: str = None,
+                     max_keys: int = 1000) -> List[ObjectInfo]:
+        pass
+
+    @abstractmethod
+    def delete_object(self, bucket: str, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, bucket: str, key: str, metadata: Dict[str, str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str,
+                                  parts: List[Tuple[int, str]]) -> str:
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def compose_object(self, bucket: str, key: str, sources: List[str], metadata: Dict[str, str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
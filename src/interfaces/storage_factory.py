@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from .file_uploader import IFileUploader
 from .file_downloader import IFileDownloader
+from .async_file_uploader import IAsyncFileUploader
+from .async_file_downloader import IAsyncFileDownloader
+from .file_inspector import IFileInspector
 
 
 class IStorageFactory(ABC):
@@ -12,3 +15,20 @@ class IStorageFactory(ABC):
     def create_downloader(self) -> IFileDownloader:
         pass
 
+    def create_async_uploader(self) -> IAsyncFileUploader:
+        raise NotImplementedError(f"{type(self).__name__} does not provide an async uploader")
+
+    def create_async_downloader(self) -> IAsyncFileDownloader:
+        raise NotImplementedError(f"{type(self).__name__} does not provide an async downloader")
+
+    def create_inspector(self) -> IFileInspector:
+        raise NotImplementedError(f"{type(self).__name__} does not provide an inspector")
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "IStorageFactory":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
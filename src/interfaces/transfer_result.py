@@ -0,0 +1,58 @@
+import time
+from typing import Optional
+
+NS_PER_SECOND = 1_000_000_000
+STREAM_SOURCE = "<stream>"
+
+
+class TransferResult:
+    __slots__ = ("source", "destination", "bytes_transferred", "started_ns", "duration_ns", "strategy", "etag",
+                 "skipped")
+
+    def __init__(self, source: str, destination: str, bytes_transferred: int = 0, started_ns: int = 0,
+                 duration_ns: int = 0, strategy: Optional[str] = None, etag: Optional[str] = None,
+                 skipped: bool = False):
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "destination", destination)
+        object.__setattr__(self, "bytes_transferred", bytes_transferred)
+        object.__setattr__(self, "started_ns", started_ns)
+        object.__setattr__(self, "duration_ns", duration_ns)
+        object.__setattr__(self, "strategy", strategy)
+        object.__setattr__(self, "etag", etag)
+        object.__setattr__(self, "skipped", skipped)
+
+    @classmethod
+    def completed(cls, source: str, destination: str, started_ns: int, bytes_transferred: int = 0,
+                  strategy: Optional[str] = None, etag: Optional[str] = None,
+                  skipped: bool = False) -> "TransferResult":
+        return cls(source, destination, bytes_transferred, started_ns, time.perf_counter_ns() - started_ns,
+                   strategy, etag, skipped)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("TransferResult is immutable")
+
+    def __bool__(self) -> bool:
+        return True
+
+    @property
+    def duration(self) -> float:
+        return self.duration_ns / NS_PER_SECOND
+
+    @property
+    def throughput(self) -> float:
+        if self.duration_ns <= 0:
+            return 0.0
+        return self.bytes_transferred * NS_PER_SECOND / self.duration_ns
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TransferResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return (f"TransferResult(source={self.source!r}, destination={self.destination!r}, "
+                f"bytes_transferred={self.bytes_transferred}, duration_ns={self.duration_ns}, "
+                f"strategy={self.strategy!r}, etag={self.etag!r}, skipped={self.skipped})")
@@ -0,0 +1,16 @@
+from .pack_index import PackIndex, PackIndexBuilder
+from .pack_file import (
+    DEFAULT_MAX_PACK_BYTES,
+    DEFAULT_MAX_PACK_MEMBERS,
+    PackReader,
+    member_uri,
+    open_pack,
+    pack_chunks,
+    plan_packs,
+    split_member_uri
+)
+
+__all__ = [
+    'PackIndex', 'PackIndexBuilder', 'DEFAULT_MAX_PACK_BYTES', 'DEFAULT_MAX_PACK_MEMBERS', 'PackReader',
+    'member_uri', 'open_pack', 'pack_chunks', 'plan_packs', 'split_member_uri'
+]
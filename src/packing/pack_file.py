@@ -0,0 +1,149 @@
+import io
+import mmap
+import os
+import stat
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+from src.interfaces.file_downloader import IFileDownloader
+from src.utils.streams import DEFAULT_CHUNK_SIZE, read_exactly
+from src.exceptions import FileNotFoundError, PermanentStorageError
+from .pack_index import PackIndex, PackIndexBuilder
+
+PACK_MAGIC = b"MCPACK01"
+FOOTER = struct.Struct("<QQ8s")
+MEMBER_SEPARATOR = "#"
+DEFAULT_MAX_PACK_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_PACK_MEMBERS = 100000
+
+
+def member_uri(pack: str, name: str) -> str:
+    return f"{pack}{MEMBER_SEPARATOR}{name}"
+
+
+def split_member_uri(uri: str) -> Tuple[str, str]:
+    pack, separator, name = uri.partition(MEMBER_SEPARATOR)
+    if not separator or not name:
+        raise ValueError(f"Not a pack member URI: {uri}")
+    return pack, name
+
+
+def plan_packs(members: Sequence[Tuple[str, str]], max_pack_bytes: int = DEFAULT_MAX_PACK_BYTES,
+               max_members: int = DEFAULT_MAX_PACK_MEMBERS) -> Iterator[List[Tuple[str, str, int]]]:
+    group: List[Tuple[str, str, int]] = []
+    group_bytes = 0
+    for file_path, name in members:
+        size = os.path.getsize(file_path)
+        if group and (group_bytes + size > max_pack_bytes or len(group) >= max_members):
+            yield group
+            group, group_bytes = [], 0
+        group.append((file_path, name, size))
+        group_bytes += size
+    if group:
+        yield group
+
+
+def pack_chunks(members: Sequence[Tuple[str, str, int]], builder: PackIndexBuilder,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    for file_path, name, size in members:
+        written = 0
+        with open(file_path, "rb") as source:
+            while written < size:
+                chunk = source.read(min(chunk_size, size - written))
+                if not chunk:
+                    break
+                written += len(chunk)
+                yield chunk
+        if written != size:
+            raise OSError(f"File changed while packing: {file_path}")
+        builder.add(name, size)
+    index = builder.build().to_bytes()
+    yield index
+    yield FOOTER.pack(builder.size, len(index), PACK_MAGIC)
+
+
+class PackReader:
+    def __init__(self, readable: BinaryIO, size: int, source: str = "<pack>"):
+        self._source = source
+        self._readable = readable
+        self._map: Optional[mmap.mmap] = None
+        if size < FOOTER.size:
+            raise PermanentStorageError(f"Not a pack: {source}")
+        descriptor = _regular_file_descriptor(readable)
+        if descriptor is not None:
+            self._map = mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ)
+        index_offset, index_length, magic = FOOTER.unpack(self._read(size - FOOTER.size, FOOTER.size))
+        if magic != PACK_MAGIC or index_offset + index_length + FOOTER.size != size:
+            raise PermanentStorageError(f"Not a pack: {source}")
+        try:
+            self._index = PackIndex.from_bytes(self._read(index_offset, index_length))
+        except (ValueError, struct.error) as e:
+            raise PermanentStorageError(f"Corrupt pack index in {source}: {str(e)}") from e
+
+    @property
+    def index(self) -> PackIndex:
+        return self._index
+
+    @property
+    def memory_mapped(self) -> bool:
+        return self._map is not None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __enter__(self) -> "PackReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def names(self) -> Iterator[str]:
+        return self._index.names()
+
+    def read(self, name: str) -> bytes:
+        entry = self._index.lookup(name)
+        if entry is None:
+            raise FileNotFoundError(f"Member {name} not found in {self._source}")
+        offset, size = entry
+        return self._read(offset, size)
+
+    def extract(self, name: str, destination: str) -> int:
+        data = self.read(name)
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        with open(destination, "wb") as target:
+            target.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._readable.close()
+
+    def _read(self, offset: int, size: int) -> bytes:
+        if self._map is not None:
+            return self._map[offset:offset + size]
+        self._readable.seek(offset)
+        data = read_exactly(self._readable, size)
+        if len(data) != size:
+            raise PermanentStorageError(f"Pack is truncated: {self._source}")
+        return data
+
+
+def open_pack(downloader: IFileDownloader, source: str, buffer_size: int = None) -> PackReader:
+    readable = downloader.open_read(source, buffer_size)
+    try:
+        size = readable.seek(0, io.SEEK_END)
+        return PackReader(readable, size, source)
+    except BaseException:
+        readable.close()
+        raise
+
+
+def _regular_file_descriptor(readable: BinaryIO) -> Optional[int]:
+    try:
+        descriptor = readable.fileno()
+    except (AttributeError, OSError):
+        return None
+    return descriptor if stat.S_ISREG(os.fstat(descriptor).st_mode) else None
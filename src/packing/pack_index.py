@@ -0,0 +1,118 @@
+import struct
+import sys
+from array import array
+from typing import Iterator, Optional, Tuple
+
+INDEX_HEADER = struct.Struct("<QQ")
+_EMPTY = 0
+
+
+class PackIndex:
+    def __init__(self, names: bytes, name_ends: array, offsets: array, sizes: array):
+        if not len(name_ends) == len(offsets) == len(sizes):
+            raise ValueError("Index arrays must have the same length")
+        self._names = names
+        self._name_ends = name_ends
+        self._offsets = offsets
+        self._sizes = sizes
+        self._mask = _table_size(len(offsets)) - 1
+        self._slots = array("q", [_EMPTY]) * (self._mask + 1)
+        for position in range(len(offsets)):
+            name = self._name(position)
+            slot = self._probe(name)
+            if self._slots[slot] != _EMPTY:
+                raise ValueError(f"Duplicate pack member: {name.decode('utf-8')}")
+            self._slots[slot] = position + 1
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, name: str) -> bool:
+        return self.lookup(name) is not None
+
+    def lookup(self, name: str) -> Optional[Tuple[int, int]]:
+        position = self._slots[self._probe(name.encode("utf-8"))] - 1
+        if position < 0:
+            return None
+        return self._offsets[position], self._sizes[position]
+
+    def names(self) -> Iterator[str]:
+        for position in range(len(self._offsets)):
+            yield self._name(position).decode("utf-8")
+
+    def entries(self) -> Iterator[Tuple[str, int, int]]:
+        for position in range(len(self._offsets)):
+            yield self._name(position).decode("utf-8"), self._offsets[position], self._sizes[position]
+
+    def to_bytes(self) -> bytes:
+        header = INDEX_HEADER.pack(len(self._offsets), len(self._names))
+        return header + b"".join(_little_endian(values) for values in (self._name_ends, self._offsets, self._sizes)) \
+            + self._names
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackIndex":
+        count, names_length = INDEX_HEADER.unpack_from(data)
+        position = INDEX_HEADER.size
+        arrays = []
+        for _ in range(3):
+            values = array("Q")
+            values.frombytes(data[position:position + count * values.itemsize])
+            if sys.byteorder == "big":
+                values.byteswap()
+            arrays.append(values)
+            position += count * values.itemsize
+        names = bytes(data[position:position + names_length])
+        if len(names) != names_length:
+            raise ValueError("Pack index is truncated")
+        return cls(names, *arrays)
+
+    def _name(self, position: int) -> bytes:
+        start = self._name_ends[position - 1] if position else 0
+        return self._names[start:self._name_ends[position]]
+
+    def _probe(self, name: bytes) -> int:
+        slot = hash(name) & self._mask
+        while True:
+            position = self._slots[slot] - 1
+            if position < 0 or self._name(position) == name:
+                return slot
+            slot = (slot + 1) & self._mask
+
+
+class PackIndexBuilder:
+    def __init__(self):
+        self._names = bytearray()
+        self._name_ends = array("Q")
+        self._offsets = array("Q")
+        self._sizes = array("Q")
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add(self, name: str, size: int) -> int:
+        offset = self.size
+        self._names += name.encode("utf-8")
+        self._name_ends.append(len(self._names))
+        self._offsets.append(offset)
+        self._sizes.append(size)
+        self.size += size
+        return offset
+
+    def build(self) -> PackIndex:
+        return PackIndex(bytes(self._names), self._name_ends, self._offsets, self._sizes)
+
+
+def _table_size(count: int) -> int:
+    size = 8
+    while size < count * 2:
+        size *= 2
+    return size
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -1,5 +1,7 @@
 from .s3_uploader import S3Uploader
 from .s3_downloader import S3Downloader
+from .async_s3_uploader import AsyncS3Uploader
+from .async_s3_downloader import AsyncS3Downloader
+from .s3_inspector import S3Inspector
 
-__all__ = ['S3Uploader', 'S3Downloader']
-
+__all__ = ['S3Uploader', 'S3Downloader', 'AsyncS3Uploader', 'AsyncS3Downloader', 'S3Inspector']
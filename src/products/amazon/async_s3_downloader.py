@@ -0,0 +1,57 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.backends.connection_pool import ConnectionPool
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.utils.paths import parse_uri, split_bucket_key
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY, ChunkedTransfer, MultipartAssembler
+
+
+class AsyncS3Downloader(IAsyncFileDownloader):
+    provider_name = "s3"
+
+    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None,
+                 pool: ConnectionPool = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None,
+                 executor: Executor = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._aws_access_key = aws_access_key
+        self._aws_secret_key = aws_secret_key
+        self._region = region or "us-east-1"
+        self._pool = pool
+        self._transfer = ChunkedTransfer(MultipartAssembler(), part_size, max_concurrency, journal)
+        self._executor = executor
+
+    @instrumented("download", target="source", size_of="destination")
+    async def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        try:
+            if parse_uri(source).scheme != "s3":
+                raise InvalidPathError(f"Invalid S3 source format: {source}")
+
+            dest_path = Path(destination)
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._logger.info("Downloading %s from S3 to %s", source, destination)
+            if self._pool is None:
+                self._logger.warning("AsyncS3Downloader is a mock implementation. Real S3 integration requires aiobotocore.")
+                return TransferResult.completed(source, destination, started, strategy="mock")
+
+            bucket, key = split_bucket_key(source, "s3")
+            loop = asyncio.get_running_loop()
+            size = await loop.run_in_executor(self._executor, self._transfer.download, self._pool, bucket, key,
+                                              str(dest_path))
+            self._logger.info("Downloaded %s bytes from S3: %s", size, source)
+            return TransferResult.completed(source, destination, started, size)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
@@ -1,31 +1,73 @@
+import io
+import time
 from pathlib import Path
+from typing import BinaryIO
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.backends.connection_pool import ConnectionPool
+from src.instrumentation import instrumented
 from src.utils.logger import get_logger
-from src.exceptions import FileNotFoundError, InvalidPathError, StorageOperationError
+from src.utils.paths import parse_uri, split_bucket_key
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY, ChunkedTransfer, MultipartAssembler
+from src.transfer.object_reader import open_object
 
 
 class S3Downloader(IFileDownloader):
-    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None):
+    provider_name = "s3"
+
+    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None,
+                 pool: ConnectionPool = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None):
         self._logger = get_logger(self.__class__.__name__)
         self._aws_access_key = aws_access_key
         self._aws_secret_key = aws_secret_key
         self._region = region or "us-east-1"
+        self._pool = pool
+        self._transfer = ChunkedTransfer(MultipartAssembler(), part_size, max_concurrency, journal)
 
-    def download(self, source: str, destination: str) -> bool:
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
         try:
-            if not source.startswith("s3://"):
+            if parse_uri(source).scheme != "s3":
                 raise InvalidPathError(f"Invalid S3 source format: {source}")
 
             dest_path = Path(destination)
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            self._logger.info(f"Downloading {source} from S3 to {destination}")
-            self._logger.warning("S3Downloader is a mock implementation. Real S3 integration requires boto3.")
-            return True
+            self._logger.info("Downloading %s from S3 to %s", source, destination)
+            if self._pool is None:
+                self._logger.warning("S3Downloader is a mock implementation. Real S3 integration requires boto3.")
+                return TransferResult.completed(source, destination, started, strategy="mock")
+
+            bucket, key = split_bucket_key(source, "s3")
+            size = self._transfer.download(self._pool, bucket, key, str(dest_path))
+            self._logger.info("Downloaded %s bytes from S3: %s", size, source)
+            return TransferResult.completed(source, destination, started, size)
 
         except (FileNotFoundError, InvalidPathError):
             raise
         except Exception as e:
-            self._logger.error(f"Failed to download {source} to {destination}: {str(e)}")
-            raise StorageOperationError(f"Download failed: {str(e)}") from e
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+
+    @instrumented("open_read", target="source")
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        try:
+            bucket, key = split_bucket_key(source, "s3")
+
+            self._logger.info("Opening S3 object for reading: %s", source)
+            if self._pool is None:
+                self._logger.warning("S3Downloader is a mock implementation. Real S3 integration requires boto3.")
+                return io.BytesIO()
 
+            return open_object(self._pool, bucket, key, buffer_size or DEFAULT_CHUNK_SIZE)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to open %s: %s", source, e)
+            raise classify_error(e, f"Open failed: {str(e)}") from e
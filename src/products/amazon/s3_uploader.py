@@ -1,34 +1,92 @@
-from pathlib import Path
+import time
+from typing import BinaryIO, Dict
 from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.transfer_result import STREAM_SOURCE, TransferResult
+from src.backends.connection_pool import ConnectionPool
+from src.instrumentation import instrumented
 from src.utils.logger import get_logger
-from src.exceptions import FileNotFoundError, InvalidPathError, StorageOperationError
+from src.utils.paths import parse_uri, require_file, split_bucket_key
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY, ChunkedTransfer, MultipartAssembler
 
 
 class S3Uploader(IFileUploader):
-    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None):
+    provider_name = "s3"
+
+    def __init__(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = None,
+                 pool: ConnectionPool = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None):
         self._logger = get_logger(self.__class__.__name__)
         self._aws_access_key = aws_access_key
         self._aws_secret_key = aws_secret_key
         self._region = region or "us-east-1"
+        self._pool = pool
+        self._transfer = ChunkedTransfer(MultipartAssembler(), part_size, max_concurrency, journal)
 
-    def upload(self, file_path: str, destination: str) -> bool:
+    @instrumented("upload", target="destination", size_of="file_path")
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
         try:
-            source_path = Path(file_path)
-            if not source_path.exists():
-                raise FileNotFoundError(f"Source file not found: {file_path}")
-            if not source_path.is_file():
-                raise InvalidPathError(f"Source path is not a file: {file_path}")
+            require_file(file_path)
 
-            if not destination.startswith("s3://"):
+            if parse_uri(destination).scheme != "s3":
                 raise InvalidPathError(f"Invalid S3 destination format: {destination}")
 
-            self._logger.info(f"Uploading {file_path} to S3: {destination}")
-            self._logger.warning("S3Uploader is a mock implementation. Real S3 integration requires boto3.")
-            return True
+            self._logger.info("Uploading %s to S3: %s", file_path, destination)
+            if self._pool is None:
+                self._logger.warning("S3Uploader is a mock implementation. Real S3 integration requires boto3.")
+                return TransferResult.completed(file_path, destination, started, strategy="mock")
+
+            bucket, key = split_bucket_key(destination, "s3")
+            size = self._transfer.upload(self._pool, file_path, bucket, key, metadata)
+            self._logger.info("Uploaded %s bytes to S3: %s", size, destination)
+            return TransferResult.completed(file_path, destination, started, size)
 
         except (FileNotFoundError, InvalidPathError):
             raise
         except Exception as e:
-            self._logger.error(f"Failed to upload {file_path} to {destination}: {str(e)}")
-            raise StorageOperationError(f"Upload failed: {str(e)}") from e
+            self._logger.error("Failed to upload %s to %s: %s", file_path, destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+
+    @instrumented("upload_stream", target="destination")
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        try:
+            bucket, key = split_bucket_key(destination, "s3")
 
+            self._logger.info("Streaming upload to S3: %s", destination)
+            if self._pool is None:
+                self._logger.warning("S3Uploader is a mock implementation. Real S3 integration requires boto3.")
+                return TransferResult.completed(STREAM_SOURCE, destination, started, strategy="mock")
+
+            size = self._transfer.upload_stream(self._pool, readable, bucket, key, metadata)
+            self._logger.info("Uploaded %s bytes to S3: %s", size, destination)
+            return TransferResult.completed(STREAM_SOURCE, destination, started, size)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to stream to %s: %s", destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+
+    @instrumented("delete", target="destination")
+    def delete(self, destination: str) -> bool:
+        try:
+            bucket, key = split_bucket_key(destination, "s3")
+
+            self._logger.info("Deleting S3 object: %s", destination)
+            if self._pool is None:
+                self._logger.warning("S3Uploader is a mock implementation. Real S3 integration requires boto3.")
+                return True
+
+            with self._pool.connection() as client:
+                client.delete_object(bucket, key)
+            return True
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to delete %s: %s", destination, e)
+            raise classify_error(e, f"Delete failed: {str(e)}") from e
@@ -1,5 +1,7 @@
 from .gcs_uploader import GCSUploader
 from .gcs_downloader import GCSDownloader
+from .async_gcs_uploader import AsyncGCSUploader
+from .async_gcs_downloader import AsyncGCSDownloader
+from .gcs_inspector import GCSInspector
 
-__all__ = ['GCSUploader', 'GCSDownloader']
-
+__all__ = ['GCSUploader', 'GCSDownloader', 'AsyncGCSUploader', 'AsyncGCSDownloader', 'GCSInspector']
@@ -0,0 +1,56 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.backends.connection_pool import ConnectionPool
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.utils.paths import parse_uri, split_bucket_key
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY, ChunkedTransfer, ComposeAssembler
+
+
+class AsyncGCSDownloader(IAsyncFileDownloader):
+    provider_name = "gcs"
+
+    def __init__(self, project_id: str = None, credentials_path: str = None,
+                 pool: ConnectionPool = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None,
+                 executor: Executor = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._project_id = project_id
+        self._credentials_path = credentials_path
+        self._pool = pool
+        self._transfer = ChunkedTransfer(ComposeAssembler(), part_size, max_concurrency, journal)
+        self._executor = executor
+
+    @instrumented("download", target="source", size_of="destination")
+    async def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        try:
+            if parse_uri(source).scheme != "gs":
+                raise InvalidPathError(f"Invalid GCS source format: {source}")
+
+            dest_path = Path(destination)
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._logger.info("Downloading %s from GCS to %s", source, destination)
+            if self._pool is None:
+                self._logger.warning("AsyncGCSDownloader is a mock implementation. Real GCS integration requires gcloud-aio-storage.")
+                return TransferResult.completed(source, destination, started, strategy="mock")
+
+            bucket, key = split_bucket_key(source, "gs")
+            loop = asyncio.get_running_loop()
+            size = await loop.run_in_executor(self._executor, self._transfer.download, self._pool, bucket, key,
+                                              str(dest_path))
+            self._logger.info("Downloaded %s bytes from GCS: %s", size, source)
+            return TransferResult.completed(source, destination, started, size)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
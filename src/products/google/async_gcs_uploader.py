@@ -0,0 +1,54 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.transfer_result import TransferResult
+from src.backends.connection_pool import ConnectionPool
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.utils.paths import parse_uri, require_file, split_bucket_key
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from src.transfer.chunked_transfer import DEFAULT_MAX_CONCURRENCY, ChunkedTransfer, ComposeAssembler
+
+
+class AsyncGCSUploader(IAsyncFileUploader):
+    provider_name = "gcs"
+
+    def __init__(self, project_id: str = None, credentials_path: str = None,
+                 pool: ConnectionPool = None, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None,
+                 executor: Executor = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._project_id = project_id
+        self._credentials_path = credentials_path
+        self._pool = pool
+        self._transfer = ChunkedTransfer(ComposeAssembler(), part_size, max_concurrency, journal)
+        self._executor = executor
+
+    @instrumented("upload", target="destination", size_of="file_path")
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        try:
+            require_file(file_path)
+
+            if parse_uri(destination).scheme != "gs":
+                raise InvalidPathError(f"Invalid GCS destination format: {destination}")
+
+            self._logger.info("Uploading %s to GCS: %s", file_path, destination)
+            if self._pool is None:
+                self._logger.warning("AsyncGCSUploader is a mock implementation. Real GCS integration requires gcloud-aio-storage.")
+                return TransferResult.completed(file_path, destination, started, strategy="mock")
+
+            bucket, key = split_bucket_key(destination, "gs")
+            loop = asyncio.get_running_loop()
+            size = await loop.run_in_executor(self._executor, self._transfer.upload, self._pool, file_path,
+                                              bucket, key)
+            self._logger.info("Uploaded %s bytes to GCS: %s", size, destination)
+            return TransferResult.completed(file_path, destination, started, size)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to upload %s to %s: %s", file_path, destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
@@ -0,0 +1,58 @@
+from typing import Iterator, Optional
+from src.interfaces.file_inspector import FileMetadata, IFileInspector
+from src.backends.connection_pool import ConnectionPool
+from src.utils.logger import get_logger
+from src.utils.paths import split_bucket_key, split_bucket_prefix
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.content_hash import CONTENT_HASH_METADATA_KEY
+
+
+class GCSInspector(IFileInspector):
+    PAGE_SIZE = 1000
+
+    def __init__(self, project_id: str = None, credentials_path: str = None,
+                 pool: ConnectionPool = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._project_id = project_id
+        self._credentials_path = credentials_path
+        self._pool = pool
+
+    def stat(self, path: str) -> Optional[FileMetadata]:
+        try:
+            bucket, key = split_bucket_key(path, "gs")
+            if self._pool is None:
+                return None
+            with self._pool.connection() as client:
+                info = client.head_object(bucket, key)
+            return FileMetadata(path, info.size, info.etag, info.metadata.get(CONTENT_HASH_METADATA_KEY))
+
+        except FileNotFoundError:
+            return None
+        except InvalidPathError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to stat %s: %s", path, e)
+            raise classify_error(e, f"Stat failed: {str(e)}") from e
+
+    def list_files(self, prefix: str) -> Iterator[FileMetadata]:
+        bucket, key_prefix = split_bucket_prefix(prefix, "gs")
+        if self._pool is None:
+            return
+        start_after = None
+        while True:
+            try:
+                with self._pool.connection() as client:
+                    page = client.list_objects(bucket, key_prefix, start_after, self.PAGE_SIZE)
+            except Exception as e:
+                self._logger.error("Failed to list %s: %s", prefix, e)
+                raise classify_error(e, f"Listing failed: {str(e)}") from e
+            for info in page:
+                yield FileMetadata(f"gs://{bucket}/{info.key}", info.size, info.etag,
+                                   info.metadata.get(CONTENT_HASH_METADATA_KEY))
+            if len(page) < self.PAGE_SIZE:
+                return
+            start_after = page[-1].key
+
+    def content_hash(self, path: str) -> Optional[str]:
+        metadata = self.stat(path)
+        return metadata.content_hash if metadata else None
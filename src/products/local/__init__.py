@@ -1,5 +1,7 @@
 from .disk_uploader import DiskUploader
 from .disk_downloader import DiskDownloader
+from .async_disk_uploader import AsyncDiskUploader
+from .async_disk_downloader import AsyncDiskDownloader
+from .disk_inspector import DiskInspector
 
-__all__ = ['DiskUploader', 'DiskDownloader']
-
+__all__ = ['DiskUploader', 'DiskDownloader', 'AsyncDiskUploader', 'AsyncDiskDownloader', 'DiskInspector']
@@ -0,0 +1,16 @@
+import asyncio
+from concurrent.futures import Executor
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from .disk_downloader import DiskDownloader
+from .copy_engine import AUTO
+
+
+class AsyncDiskDownloader(IAsyncFileDownloader):
+    def __init__(self, executor: Executor = None, copy_strategy: str = AUTO):
+        self._downloader = DiskDownloader(copy_strategy)
+        self._executor = executor
+
+    async def download(self, source: str, destination: str) -> TransferResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._downloader.download, source, destination)
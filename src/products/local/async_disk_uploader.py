@@ -0,0 +1,16 @@
+import asyncio
+from concurrent.futures import Executor
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.transfer_result import TransferResult
+from .disk_uploader import DiskUploader
+from .copy_engine import AUTO
+
+
+class AsyncDiskUploader(IAsyncFileUploader):
+    def __init__(self, executor: Executor = None, copy_strategy: str = AUTO):
+        self._uploader = DiskUploader(copy_strategy)
+        self._executor = executor
+
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._uploader.upload, file_path, destination)
@@ -0,0 +1,196 @@
+import errno
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, Tuple
+from src.transfer.checkpoint import CheckpointJournal
+
+AUTO = "auto"
+REFLINK = "reflink"
+COPY_FILE_RANGE = "copy_file_range"
+SENDFILE = "sendfile"
+BUFFERED = "buffered"
+
+STRATEGIES: Tuple[str, ...] = (REFLINK, COPY_FILE_RANGE, SENDFILE, BUFFERED)
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_CHECKPOINT_INTERVAL = 64 * 1024 * 1024
+
+_FICLONE = 0x40049409
+_UNSUPPORTED_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, name, None)
+        for name in ("EOPNOTSUPP", "ENOTSUP", "EXDEV", "EINVAL", "ENOSYS", "ENOTTY", "EBADF", "EPERM", "ENOTSOCK")
+    )
+    if code is not None
+)
+
+
+@dataclass(frozen=True)
+class CopyResult:
+    strategy: str
+    bytes_copied: int
+
+
+class _StrategyUnavailable(Exception):
+    pass
+
+
+def validate_strategy(strategy: str) -> str:
+    if strategy != AUTO and strategy not in STRATEGIES:
+        raise ValueError(f"Unknown copy strategy: {strategy}")
+    return strategy
+
+
+def copy_file(source: str, destination: str, strategy: str = AUTO,
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> CopyResult:
+    chain = STRATEGIES if validate_strategy(strategy) == AUTO else (strategy,)
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+    with open(source, "rb", buffering=0) as src, open(destination, "wb", buffering=0) as dst:
+        size = os.fstat(src.fileno()).st_size
+        for name in chain:
+            try:
+                copied = _COPIERS[name](src, dst, size, buffer_size)
+            except _StrategyUnavailable:
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate(0)
+                continue
+            break
+        else:
+            raise OSError(errno.EOPNOTSUPP, f"Copy strategy {strategy} is not supported for {destination}")
+    shutil.copystat(source, destination)
+    return CopyResult(name, copied)
+
+
+def copy_file_resumable(source: str, destination: str, journal: CheckpointJournal,
+                        buffer_size: int = DEFAULT_BUFFER_SIZE,
+                        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL) -> CopyResult:
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+    stat = os.stat(source)
+    size = stat.st_size
+    partial = f"{destination}.partial"
+    checkpoint = journal.open(source, destination, size, stat.st_mtime_ns)
+    if checkpoint.offset and (not os.path.exists(partial) or os.path.getsize(partial) < checkpoint.offset):
+        checkpoint.discard()
+        checkpoint = journal.open(source, destination, size, stat.st_mtime_ns)
+
+    start = offset = checkpoint.offset
+    strategy = BUFFERED
+    with open(source, "rb", buffering=0) as src, open(partial, "r+b" if offset else "wb", buffering=0) as dst:
+        dst.truncate(offset)
+        while offset < size:
+            length = min(checkpoint_interval, size - offset)
+            strategy = _copy_range(src, dst, offset, length, buffer_size)
+            offset += length
+            checkpoint.record_offset(offset)
+    shutil.copystat(source, partial)
+    os.replace(partial, destination)
+    checkpoint.discard()
+    return CopyResult(strategy, size - start)
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int, buffer_size: int) -> str:
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < length:
+                sent = os.copy_file_range(src.fileno(), dst.fileno(), length - copied,
+                                          offset + copied, offset + copied)
+                if sent == 0:
+                    raise OSError(errno.EIO, "Source file shrank during copy")
+                copied += sent
+            return COPY_FILE_RANGE
+        except OSError as e:
+            if copied or e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    view = memoryview(bytearray(min(buffer_size, length)))
+    src.seek(offset)
+    dst.seek(offset)
+    while copied < length:
+        read = src.readinto(view[:min(len(view), length - copied)])
+        if not read:
+            raise OSError(errno.EIO, "Source file shrank during copy")
+        written = 0
+        while written < read:
+            written += dst.write(view[written:read])
+        copied += read
+    return BUFFERED
+
+
+def _unavailable_if_unsupported(error: OSError, copied: int) -> None:
+    if copied == 0 and error.errno in _UNSUPPORTED_ERRNOS:
+        raise _StrategyUnavailable() from error
+
+
+def _copy_reflink(src: BinaryIO, dst: BinaryIO, size: int, buffer_size: int) -> int:
+    if not sys.platform.startswith("linux"):
+        raise _StrategyUnavailable()
+    import fcntl
+    try:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError as e:
+        _unavailable_if_unsupported(e, 0)
+        raise
+    return size
+
+
+def _copy_file_range(src: BinaryIO, dst: BinaryIO, size: int, buffer_size: int) -> int:
+    if not hasattr(os, "copy_file_range"):
+        raise _StrategyUnavailable()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+        except OSError as e:
+            _unavailable_if_unsupported(e, copied)
+            raise
+        if sent == 0:
+            if copied == 0:
+                raise _StrategyUnavailable()
+            break
+        copied += sent
+    return copied
+
+
+def _copy_sendfile(src: BinaryIO, dst: BinaryIO, size: int, buffer_size: int) -> int:
+    if not hasattr(os, "sendfile") or not sys.platform.startswith("linux"):
+        raise _StrategyUnavailable()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+        except OSError as e:
+            _unavailable_if_unsupported(e, copied)
+            raise
+        if sent == 0:
+            break
+        copied += sent
+    return copied
+
+
+def _copy_buffered(src: BinaryIO, dst: BinaryIO, size: int, buffer_size: int) -> int:
+    view = memoryview(bytearray(buffer_size))
+    copied = 0
+    while True:
+        read = src.readinto(view)
+        if not read:
+            break
+        written = 0
+        while written < read:
+            written += dst.write(view[written:read])
+        copied += read
+    return copied
+
+
+_COPIERS: Dict[str, Callable[[BinaryIO, BinaryIO, int, int], int]] = {
+    REFLINK: _copy_reflink,
+    COPY_FILE_RANGE: _copy_file_range,
+    SENDFILE: _copy_sendfile,
+    BUFFERED: _copy_buffered,
+}
@@ -1,33 +1,58 @@
-import os
-import shutil
+import time
 from pathlib import Path
+from typing import BinaryIO
 from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented
 from src.utils.logger import get_logger
-from src.exceptions import FileNotFoundError, InvalidPathError, StorageOperationError
+from src.utils.paths import require_file
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from .copy_engine import AUTO, DEFAULT_BUFFER_SIZE, copy_file, copy_file_resumable, validate_strategy
 
 
 class DiskDownloader(IFileDownloader):
-    def __init__(self):
+    provider_name = "local"
+
+    def __init__(self, copy_strategy: str = AUTO, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 journal: CheckpointJournal = None):
         self._logger = get_logger(self.__class__.__name__)
+        self._copy_strategy = validate_strategy(copy_strategy)
+        self._buffer_size = buffer_size
+        self._journal = journal
 
-    def download(self, source: str, destination: str) -> bool:
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
         try:
-            source_path = Path(source)
-            if not source_path.exists():
-                raise FileNotFoundError(f"Source file not found: {source}")
-            if not source_path.is_file():
-                raise InvalidPathError(f"Source path is not a file: {source}")
+            require_file(source)
 
             dest_path = Path(destination)
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            shutil.copy2(source_path, dest_path)
-            self._logger.info(f"Successfully copied {source} to {destination}")
-            return True
+            if self._journal is not None:
+                result = copy_file_resumable(source, str(dest_path), self._journal, self._buffer_size)
+            else:
+                result = copy_file(source, str(dest_path), self._copy_strategy, self._buffer_size)
+            self._logger.info("Successfully copied %s to %s "
+                              "(%s bytes via %s)", source, destination, result.bytes_copied, result.strategy)
+            return TransferResult.completed(source, destination, started, result.bytes_copied, result.strategy)
 
         except (FileNotFoundError, InvalidPathError):
             raise
         except Exception as e:
-            self._logger.error(f"Failed to download {source} to {destination}: {str(e)}")
-            raise StorageOperationError(f"Download failed: {str(e)}") from e
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+
+    @instrumented("open_read", target="source")
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        try:
+            require_file(source)
+
+            return open(source, "rb", buffering=buffer_size or self._buffer_size)
 
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to open %s: %s", source, e)
+            raise classify_error(e, f"Open failed: {str(e)}") from e
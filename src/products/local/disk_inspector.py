@@ -0,0 +1,61 @@
+import errno
+import os
+import stat as stat_module
+from typing import Iterator, Optional, Tuple
+from src.interfaces.file_inspector import FileMetadata, IFileInspector
+from src.utils.logger import get_logger
+from src.exceptions import classify_error
+from src.transfer.content_hash import DEFAULT_HASH_CACHE, HashCache
+
+_MISSING_ERRNOS = (errno.ENOENT, errno.ENOTDIR)
+
+
+class DiskInspector(IFileInspector):
+    def __init__(self, hash_cache: HashCache = None):
+        self._logger = get_logger(self.__class__.__name__)
+        self._hash_cache = hash_cache or DEFAULT_HASH_CACHE
+
+    def stat(self, path: str) -> Optional[FileMetadata]:
+        try:
+            result = os.stat(path)
+        except OSError as e:
+            if e.errno in _MISSING_ERRNOS:
+                return None
+            self._logger.error("Failed to stat %s: %s", path, e)
+            raise classify_error(e, f"Stat failed: {str(e)}") from e
+        if not stat_module.S_ISREG(result.st_mode):
+            return None
+        return FileMetadata(path, result.st_size, modified_ns=result.st_mtime_ns)
+
+    def list_files(self, prefix: str) -> Iterator[FileMetadata]:
+        try:
+            for _, entry in scan_files(prefix):
+                result = entry.stat()
+                yield FileMetadata(entry.path, result.st_size, modified_ns=result.st_mtime_ns)
+        except OSError as e:
+            if e.errno in _MISSING_ERRNOS:
+                return
+            self._logger.error("Failed to list %s: %s", prefix, e)
+            raise classify_error(e, f"Listing failed: {str(e)}") from e
+
+    def content_hash(self, path: str) -> Optional[str]:
+        try:
+            return self._hash_cache.digest(path)
+        except OSError as e:
+            if e.errno in _MISSING_ERRNOS or e.errno == errno.EISDIR:
+                return None
+            self._logger.error("Failed to hash %s: %s", path, e)
+            raise classify_error(e, f"Hash failed: {str(e)}") from e
+
+
+def scan_files(root: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    pending = [("", root)]
+    while pending:
+        relative_dir, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative = f"{relative_dir}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((f"{relative}/", entry.path))
+                elif entry.is_file():
+                    yield relative, entry
@@ -1,33 +1,88 @@
 import os
 import shutil
+import time
 from pathlib import Path
+from typing import BinaryIO, Dict
 from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.transfer_result import STREAM_SOURCE, TransferResult
+from src.instrumentation import instrumented
 from src.utils.logger import get_logger
-from src.exceptions import FileNotFoundError, InvalidPathError, StorageOperationError
+from src.utils.paths import require_file
+from src.exceptions import FileNotFoundError, InvalidPathError, classify_error
+from src.transfer.checkpoint import CheckpointJournal
+from .copy_engine import AUTO, DEFAULT_BUFFER_SIZE, copy_file, copy_file_resumable, validate_strategy
 
 
 class DiskUploader(IFileUploader):
-    def __init__(self):
+    provider_name = "local"
+
+    def __init__(self, copy_strategy: str = AUTO, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 journal: CheckpointJournal = None):
         self._logger = get_logger(self.__class__.__name__)
+        self._copy_strategy = validate_strategy(copy_strategy)
+        self._buffer_size = buffer_size
+        self._journal = journal
 
-    def upload(self, file_path: str, destination: str) -> bool:
+    @instrumented("upload", target="destination", size_of="file_path")
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
         try:
-            source_path = Path(file_path)
-            if not source_path.exists():
-                raise FileNotFoundError(f"Source file not found: {file_path}")
-            if not source_path.is_file():
-                raise InvalidPathError(f"Source path is not a file: {file_path}")
+            require_file(file_path)
 
             dest_path = Path(destination)
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            shutil.copy2(source_path, dest_path)
-            self._logger.info(f"Successfully copied {file_path} to {destination}")
-            return True
+            if self._journal is not None:
+                result = copy_file_resumable(file_path, str(dest_path), self._journal, self._buffer_size)
+            else:
+                result = copy_file(file_path, str(dest_path), self._copy_strategy, self._buffer_size)
+            self._logger.info("Successfully copied %s to %s "
+                              "(%s bytes via %s)", file_path, destination, result.bytes_copied, result.strategy)
+            return TransferResult.completed(file_path, destination, started, result.bytes_copied, result.strategy)
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to upload %s to %s: %s", file_path, destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+
+    @instrumented("upload_stream", target="destination", size_of="destination")
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        partial = f"{destination}.partial"
+        try:
+            dest_path = Path(destination)
+            if dest_path.is_dir():
+                raise InvalidPathError(f"Destination path is a directory: {destination}")
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(partial, "wb") as target:
+                shutil.copyfileobj(readable, target, self._buffer_size)
+                size = target.tell()
+            os.replace(partial, destination)
+            self._logger.info("Successfully streamed %s bytes to %s", size, destination)
+            return TransferResult.completed(STREAM_SOURCE, destination, started, size, "stream")
 
         except (FileNotFoundError, InvalidPathError):
             raise
         except Exception as e:
-            self._logger.error(f"Failed to upload {file_path} to {destination}: {str(e)}")
-            raise StorageOperationError(f"Upload failed: {str(e)}") from e
+            if os.path.exists(partial):
+                os.remove(partial)
+            self._logger.error("Failed to stream to %s: %s", destination, e)
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
 
+    @instrumented("delete", target="destination")
+    def delete(self, destination: str) -> bool:
+        try:
+            require_file(destination, "Destination")
+
+            os.remove(destination)
+            self._logger.info("Deleted %s", destination)
+            return True
+
+        except (FileNotFoundError, InvalidPathError):
+            raise
+        except Exception as e:
+            self._logger.error("Failed to delete %s: %s", destination, e)
+            raise classify_error(e, f"Delete failed: {str(e)}") from e
@@ -0,0 +1,14 @@
+from .latency_tracker import LatencyTracker, ProviderStats
+from .routing_downloader import Replica, RoutingDownloader
+from .scheme_router import (
+    AsyncSchemeRoutingDownloader,
+    AsyncSchemeRoutingUploader,
+    SchemeRoutingDownloader,
+    SchemeRoutingInspector,
+    SchemeRoutingUploader
+)
+
+__all__ = [
+    'LatencyTracker', 'ProviderStats', 'Replica', 'RoutingDownloader', 'AsyncSchemeRoutingDownloader',
+    'AsyncSchemeRoutingUploader', 'SchemeRoutingDownloader', 'SchemeRoutingInspector', 'SchemeRoutingUploader'
+]
@@ -0,0 +1,67 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+DEFAULT_ALPHA = 0.2
+DEFAULT_WINDOW = 64
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_ERROR_PENALTY = 10.0
+MIN_SAMPLES = 5
+
+
+class ProviderStats:
+    def __init__(self, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW):
+        self._alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float, success: bool) -> None:
+        self.requests += 1
+        self.error_rate += self._alpha * ((0.0 if success else 1.0) - self.error_rate)
+        if not success:
+            self.errors += 1
+            return
+        self.latency = latency if self.latency is None else self.latency + self._alpha * (latency - self.latency)
+        self.samples.append(latency)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if len(self.samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LatencyTracker:
+    def __init__(self, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW,
+                 error_penalty: float = DEFAULT_ERROR_PENALTY):
+        self._alpha = alpha
+        self._window = window
+        self._error_penalty = error_penalty
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ProviderStats] = {}
+
+    def record(self, provider: str, latency: float, success: bool = True) -> None:
+        with self._lock:
+            stats = self._stats.get(provider)
+            if stats is None:
+                stats = self._stats[provider] = ProviderStats(self._alpha, self._window)
+            stats.record(latency, success)
+
+    def score(self, provider: str) -> float:
+        with self._lock:
+            stats = self._stats.get(provider)
+            if stats is None or stats.latency is None:
+                return 0.0 if stats is None or not stats.errors else float("inf")
+            return stats.latency * (1.0 + self._error_penalty * stats.error_rate)
+
+    def hedge_delay(self, provider: str, fraction: float = DEFAULT_HEDGE_PERCENTILE) -> Optional[float]:
+        with self._lock:
+            stats = self._stats.get(provider)
+            return stats.percentile(fraction) if stats is not None else None
+
+    def stats(self, provider: str) -> Optional[ProviderStats]:
+        with self._lock:
+            return self._stats.get(provider)
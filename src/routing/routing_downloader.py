@@ -0,0 +1,190 @@
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented, record_counter
+from src.utils.logger import get_logger
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+from src.exceptions import InvalidPathError, StorageOperationError, classify_error
+from .latency_tracker import DEFAULT_HEDGE_PERCENTILE, LatencyTracker
+
+DEFAULT_HEDGE_DELAY = 1.0
+MIN_HEDGE_DELAY = 0.005
+HEDGED_REQUESTS_METRIC = "storage_hedged_requests_total"
+
+
+@dataclass(frozen=True)
+class Replica:
+    name: str
+    prefix: str
+    downloader: IFileDownloader
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _Attempt:
+    def __init__(self, replica: Replica, source: str, partial: str):
+        self.replica = replica
+        self.source = source
+        self.partial = partial
+        self.cancelled = threading.Event()
+        self.started = time.perf_counter()
+        self.first_byte = False
+        self.size = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class RoutingDownloader(IFileDownloader):
+    provider_name = "routing"
+
+    def __init__(self, replicas: Sequence[Replica], tracker: LatencyTracker = None, max_hedges: int = 1,
+                 hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE, default_hedge_delay: float = DEFAULT_HEDGE_DELAY,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if not replicas:
+            raise ValueError("At least one replica is required")
+        self._logger = get_logger(self.__class__.__name__)
+        self._replicas = list(replicas)
+        self._tracker = tracker or LatencyTracker()
+        self._max_hedges = max_hedges
+        self._hedge_percentile = hedge_percentile
+        self._default_hedge_delay = default_hedge_delay
+        self._chunk_size = chunk_size
+
+    @property
+    def tracker(self) -> LatencyTracker:
+        return self._tracker
+
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        candidates = self._route(source)
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        condition = threading.Condition()
+        attempts: List[_Attempt] = []
+        winner: List[_Attempt] = []
+        hedges = 0
+
+        def launch(index: int) -> None:
+            replica, replica_source = candidates[index]
+            attempt = _Attempt(replica, replica_source, f"{destination}.{uuid.uuid4().hex[:8]}.partial")
+            attempts.append(attempt)
+            threading.Thread(target=self._fetch, args=(attempt, destination, condition, winner),
+                             name=f"routing-{replica.name}", daemon=True).start()
+
+        with condition:
+            launch(0)
+            while not winner:
+                running = [attempt for attempt in attempts if not attempt.done]
+                if not running:
+                    if len(attempts) == len(candidates):
+                        break
+                    self._logger.warning("Failing over %s to %s", source, candidates[len(attempts)][0].name)
+                    launch(len(attempts))
+                    continue
+                latest = attempts[-1]
+                can_hedge = (hedges < self._max_hedges and len(attempts) < len(candidates)
+                             and not any(attempt.first_byte for attempt in running))
+                if not can_hedge:
+                    condition.wait()
+                    continue
+                deadline = latest.started + self._hedge_delay(latest.replica)
+                remaining = deadline - time.perf_counter()
+                if remaining > 0:
+                    condition.wait(remaining)
+                    continue
+                hedges += 1
+                record_counter(HEDGED_REQUESTS_METRIC, provider=latest.replica.name)
+                self._logger.info("Hedging %s on %s after %.3fs", source, candidates[len(attempts)][0].name,
+                                  time.perf_counter() - latest.started)
+                launch(len(attempts))
+            for attempt in attempts:
+                if attempt not in winner:
+                    attempt.cancelled.set()
+
+        if winner:
+            self._logger.info("Downloaded %s from %s", source, winner[0].replica.name)
+            return TransferResult.completed(source, destination, started, winner[0].size,
+                                            f"routed:{winner[0].replica.name}")
+        errors = [attempt.error for attempt in attempts if attempt.error is not None]
+        error = errors[0]
+        if isinstance(error, StorageOperationError):
+            raise error
+        raise classify_error(error, f"Download failed: {str(error)}") from error
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        errors = []
+        for replica, replica_source in self._route(source):
+            started = time.perf_counter()
+            try:
+                readable = replica.downloader.open_read(replica_source, buffer_size)
+            except StorageOperationError as e:
+                self._tracker.record(replica.name, time.perf_counter() - started, success=False)
+                errors.append(e)
+                continue
+            self._tracker.record(replica.name, time.perf_counter() - started)
+            return readable
+        raise errors[0]
+
+    def _route(self, source: str) -> List[Tuple[Replica, str]]:
+        relative = None
+        for replica in self._replicas:
+            if source.startswith(replica.prefix):
+                relative = source[len(replica.prefix):]
+                break
+        if relative is None:
+            raise InvalidPathError(f"Source does not match any replica prefix: {source}")
+        ordered = sorted(self._replicas, key=lambda replica: self._tracker.score(replica.name))
+        return [(replica, _join(replica.prefix, relative)) for replica in ordered]
+
+    def _hedge_delay(self, replica: Replica) -> float:
+        delay = self._tracker.hedge_delay(replica.name, self._hedge_percentile)
+        return self._default_hedge_delay if delay is None else max(delay, MIN_HEDGE_DELAY)
+
+    def _fetch(self, attempt: _Attempt, destination: str, condition: threading.Condition,
+               winner: List[_Attempt]) -> None:
+        try:
+            with attempt.replica.downloader.open_read(attempt.source) as readable, open(attempt.partial, "wb") as out:
+                while True:
+                    chunk = readable.read(self._chunk_size)
+                    if attempt.cancelled.is_set():
+                        raise _Cancelled()
+                    if not attempt.first_byte:
+                        self._tracker.record(attempt.replica.name, time.perf_counter() - attempt.started)
+                        with condition:
+                            attempt.first_byte = True
+                            condition.notify_all()
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                attempt.size = out.tell()
+            with condition:
+                if not winner and not attempt.cancelled.is_set():
+                    os.replace(attempt.partial, destination)
+                    winner.append(attempt)
+        except _Cancelled:
+            if not attempt.first_byte:
+                self._tracker.record(attempt.replica.name, time.perf_counter() - attempt.started)
+        except Exception as e:
+            if not attempt.first_byte:
+                self._tracker.record(attempt.replica.name, time.perf_counter() - attempt.started, success=False)
+            self._logger.warning("Replica %s failed for %s: %s", attempt.replica.name, attempt.source, e)
+            attempt.error = e
+        finally:
+            if os.path.exists(attempt.partial):
+                os.remove(attempt.partial)
+            with condition:
+                attempt.done = True
+                condition.notify_all()
+
+
+def _join(prefix: str, relative: str) -> str:
+    if "://" in prefix:
+        return prefix + relative
+    return os.path.join(prefix, *relative.split("/"))
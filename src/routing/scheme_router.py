@@ -0,0 +1,93 @@
+from typing import BinaryIO, Dict, Iterator, Mapping, Optional, Tuple, TypeVar
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.file_inspector import FileMetadata, IFileInspector
+from src.interfaces.transfer_result import TransferResult
+from src.utils.paths import parse_uri
+from src.exceptions import InvalidPathError
+
+T = TypeVar("T")
+
+
+def route(products: Mapping[str, T], uri: str) -> Tuple[T, str]:
+    parsed = parse_uri(uri)
+    product = products.get(parsed.scheme)
+    if product is None:
+        raise InvalidPathError(f"No storage provider registered for scheme '{parsed.scheme}': {uri}")
+    return product, str(parsed) if parsed.is_local else uri
+
+
+class SchemeRoutingUploader(IFileUploader):
+    provider_name = "scheme_router"
+
+    def __init__(self, uploaders: Dict[str, IFileUploader]):
+        self._uploaders = uploaders
+
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        uploader, destination = route(self._uploaders, destination)
+        return uploader.upload(file_path, destination, metadata)
+
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        uploader, destination = route(self._uploaders, destination)
+        return uploader.upload_stream(readable, destination, metadata)
+
+    def delete(self, destination: str) -> bool:
+        uploader, destination = route(self._uploaders, destination)
+        return uploader.delete(destination)
+
+
+class SchemeRoutingDownloader(IFileDownloader):
+    provider_name = "scheme_router"
+
+    def __init__(self, downloaders: Dict[str, IFileDownloader]):
+        self._downloaders = downloaders
+
+    def download(self, source: str, destination: str) -> TransferResult:
+        downloader, source = route(self._downloaders, source)
+        return downloader.download(source, destination)
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        downloader, source = route(self._downloaders, source)
+        return downloader.open_read(source, buffer_size)
+
+
+class SchemeRoutingInspector(IFileInspector):
+    def __init__(self, inspectors: Dict[str, IFileInspector]):
+        self._inspectors = inspectors
+
+    def stat(self, path: str) -> Optional[FileMetadata]:
+        inspector, path = route(self._inspectors, path)
+        return inspector.stat(path)
+
+    def content_hash(self, path: str) -> Optional[str]:
+        inspector, path = route(self._inspectors, path)
+        return inspector.content_hash(path)
+
+    def list_files(self, prefix: str) -> Iterator[FileMetadata]:
+        inspector, prefix = route(self._inspectors, prefix)
+        return inspector.list_files(prefix)
+
+
+class AsyncSchemeRoutingUploader(IAsyncFileUploader):
+    provider_name = "scheme_router"
+
+    def __init__(self, uploaders: Dict[str, IAsyncFileUploader]):
+        self._uploaders = uploaders
+
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        uploader, destination = route(self._uploaders, destination)
+        return await uploader.upload(file_path, destination)
+
+
+class AsyncSchemeRoutingDownloader(IAsyncFileDownloader):
+    provider_name = "scheme_router"
+
+    def __init__(self, downloaders: Dict[str, IAsyncFileDownloader]):
+        self._downloaders = downloaders
+
+    async def download(self, source: str, destination: str) -> TransferResult:
+        downloader, source = route(self._downloaders, source)
+        return await downloader.download(source, destination)
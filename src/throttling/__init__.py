@@ -0,0 +1,9 @@
+from .token_bucket import TokenBucket
+from .rate_limiter import RATE_LIMIT_WAIT_METRIC, RateLimiter, ThrottledReader, global_rate_limiter
+from .rate_limited_uploader import AsyncRateLimitedUploader, RateLimitedUploader
+from .rate_limited_downloader import AsyncRateLimitedDownloader, RateLimitedDownloader
+
+__all__ = [
+    'TokenBucket', 'RATE_LIMIT_WAIT_METRIC', 'RateLimiter', 'ThrottledReader', 'global_rate_limiter',
+    'RateLimitedUploader', 'AsyncRateLimitedUploader', 'RateLimitedDownloader', 'AsyncRateLimitedDownloader'
+]
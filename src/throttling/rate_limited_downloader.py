@@ -0,0 +1,82 @@
+import asyncio
+import io
+import os
+import shutil
+import time
+from concurrent.futures import Executor
+from typing import BinaryIO, List, Sequence
+from src.interfaces.file_downloader import IFileDownloader
+from src.interfaces.async_file_downloader import IAsyncFileDownloader
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented
+from src.utils.logger import get_logger
+from src.exceptions import StorageOperationError, classify_error
+from .rate_limiter import RateLimiter, ThrottledReader, acquire_async, acquire_op, limits_bytes
+
+
+class RateLimitedDownloader(IFileDownloader):
+    provider_name = "rate_limit"
+
+    def __init__(self, downloader: IFileDownloader, limiters: Sequence[RateLimiter]):
+        self._logger = get_logger(self.__class__.__name__)
+        self._downloader = downloader
+        self._limiters: List[RateLimiter] = list(limiters)
+
+    @instrumented("download", target="source", size_of="destination")
+    def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        acquire_op(self._limiters)
+        if not limits_bytes(self._limiters):
+            return self._downloader.download(source, destination)
+        return self._download_throttled(source, destination, started)
+
+    def _download_throttled(self, source: str, destination: str, started: int) -> TransferResult:
+        readable = self._downloader.open_read(source)
+        partial = f"{destination}.partial"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+            with io.BufferedReader(ThrottledReader(readable, self._limiters, close_source=False)) as throttled, \
+                    open(partial, "wb") as target:
+                shutil.copyfileobj(throttled, target)
+                size = target.tell()
+            os.replace(partial, destination)
+            return TransferResult.completed(source, destination, started, size, "throttled")
+        except StorageOperationError:
+            raise
+        except Exception as e:
+            self._logger.error("Failed to download %s to %s: %s", source, destination, e)
+            raise classify_error(e, f"Download failed: {str(e)}") from e
+        finally:
+            readable.close()
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def open_read(self, source: str, buffer_size: int = None) -> BinaryIO:
+        acquire_op(self._limiters)
+        readable = self._downloader.open_read(source, buffer_size)
+        if not limits_bytes(self._limiters):
+            return readable
+        return io.BufferedReader(ThrottledReader(readable, self._limiters))
+
+
+class AsyncRateLimitedDownloader(IAsyncFileDownloader):
+    provider_name = "rate_limit"
+
+    def __init__(self, downloader: IAsyncFileDownloader, limiters: Sequence[RateLimiter],
+                 streaming: IFileDownloader = None, executor: Executor = None):
+        self._downloader = downloader
+        self._limiters: List[RateLimiter] = list(limiters)
+        self._streaming = RateLimitedDownloader(streaming, limiters) if streaming is not None else None
+        self._executor = executor
+
+    async def download(self, source: str, destination: str) -> TransferResult:
+        started = time.perf_counter_ns()
+        await acquire_async(self._limiters)
+        if self._streaming is not None and limits_bytes(self._limiters):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._streaming._download_throttled, source,
+                                              destination, started)
+        result = await self._downloader.download(source, destination)
+        for limiter in self._limiters:
+            limiter.reserve_bytes(result.bytes_transferred)
+        return result
@@ -0,0 +1,74 @@
+import asyncio
+import io
+import time
+from concurrent.futures import Executor
+from typing import BinaryIO, Dict, List, Sequence
+from src.interfaces.file_uploader import IFileUploader
+from src.interfaces.async_file_uploader import IAsyncFileUploader
+from src.interfaces.transfer_result import TransferResult
+from src.instrumentation import instrumented
+from src.utils.paths import require_file
+from src.exceptions import classify_error
+from .rate_limiter import RateLimiter, ThrottledReader, acquire_async, acquire_op, limits_bytes
+
+
+class RateLimitedUploader(IFileUploader):
+    provider_name = "rate_limit"
+
+    def __init__(self, uploader: IFileUploader, limiters: Sequence[RateLimiter]):
+        self._uploader = uploader
+        self._limiters: List[RateLimiter] = list(limiters)
+
+    @instrumented("upload", target="destination", size_of="file_path")
+    def upload(self, file_path: str, destination: str, metadata: Dict[str, str] = None) -> TransferResult:
+        started = time.perf_counter_ns()
+        acquire_op(self._limiters)
+        if not limits_bytes(self._limiters):
+            return self._uploader.upload(file_path, destination, metadata)
+        return self._upload_throttled(file_path, destination, metadata, started)
+
+    def _upload_throttled(self, file_path: str, destination: str, metadata: Dict[str, str],
+                          started: int) -> TransferResult:
+        require_file(file_path)
+        try:
+            readable = open(file_path, "rb")
+        except OSError as e:
+            raise classify_error(e, f"Upload failed: {str(e)}") from e
+        with io.BufferedReader(ThrottledReader(readable, self._limiters)) as throttled:
+            result = self._uploader.upload_stream(throttled, destination, metadata)
+        return TransferResult.completed(file_path, destination, started, result.bytes_transferred, result.strategy,
+                                        result.etag)
+
+    @instrumented("upload_stream", target="destination")
+    def upload_stream(self, readable: BinaryIO, destination: str,
+                      metadata: Dict[str, str] = None) -> TransferResult:
+        acquire_op(self._limiters)
+        if limits_bytes(self._limiters):
+            readable = io.BufferedReader(ThrottledReader(readable, self._limiters, close_source=False))
+        return self._uploader.upload_stream(readable, destination, metadata)
+
+    def delete(self, destination: str) -> bool:
+        acquire_op(self._limiters)
+        return self._uploader.delete(destination)
+
+
+class AsyncRateLimitedUploader(IAsyncFileUploader):
+    provider_name = "rate_limit"
+
+    def __init__(self, uploader: IAsyncFileUploader, limiters: Sequence[RateLimiter],
+                 streaming: IFileUploader = None, executor: Executor = None):
+        self._uploader = uploader
+        self._limiters: List[RateLimiter] = list(limiters)
+        self._streaming = RateLimitedUploader(streaming, limiters) if streaming is not None else None
+        self._executor = executor
+
+    async def upload(self, file_path: str, destination: str) -> TransferResult:
+        if self._streaming is None or not limits_bytes(self._limiters):
+            size = require_file(file_path).st_size
+            await acquire_async(self._limiters, size)
+            return await self._uploader.upload(file_path, destination)
+        started = time.perf_counter_ns()
+        await acquire_async(self._limiters)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._streaming._upload_throttled, file_path,
+                                          destination, None, started)
@@ -0,0 +1,118 @@
+import asyncio
+import io
+from typing import BinaryIO, Optional, Sequence
+from src.instrumentation import record_counter
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+from .token_bucket import TokenBucket
+
+RATE_LIMIT_WAIT_METRIC = "storage_rate_limit_wait_seconds_total"
+BYTES = "bytes"
+OPS = "ops"
+
+
+class RateLimiter:
+    def __init__(self, bytes_per_second: Optional[float] = None, ops_per_second: Optional[float] = None,
+                 burst_bytes: float = None, burst_ops: float = None, name: str = "default"):
+        self.name = name
+        self._bytes = TokenBucket(bytes_per_second, burst_bytes)
+        self._ops = TokenBucket(ops_per_second, burst_ops)
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        return self._bytes.rate
+
+    @property
+    def ops_per_second(self) -> Optional[float]:
+        return self._ops.rate
+
+    @property
+    def limits_bytes(self) -> bool:
+        return self._bytes.rate is not None
+
+    @property
+    def chunk_size(self) -> int:
+        return max(int(self._bytes.burst), 1) if self.limits_bytes else DEFAULT_CHUNK_SIZE
+
+    @property
+    def wait_seconds(self) -> float:
+        return self._bytes.waited + self._ops.waited
+
+    @property
+    def bytes_wait_seconds(self) -> float:
+        return self._bytes.waited
+
+    @property
+    def ops_wait_seconds(self) -> float:
+        return self._ops.waited
+
+    def set_bytes_per_second(self, rate: Optional[float], burst: float = None) -> None:
+        self._bytes.set_rate(rate, burst)
+
+    def set_ops_per_second(self, rate: Optional[float], burst: float = None) -> None:
+        self._ops.set_rate(rate, burst)
+
+    def reserve_op(self) -> float:
+        return self._record(OPS, self._ops.reserve())
+
+    def reserve_bytes(self, count: int) -> float:
+        return self._record(BYTES, self._bytes.reserve(count)) if count > 0 else 0.0
+
+    def acquire_op(self) -> float:
+        return self._record(OPS, self._ops.acquire())
+
+    def acquire_bytes(self, count: int) -> float:
+        return self._record(BYTES, self._bytes.acquire(count)) if count > 0 else 0.0
+
+    def _record(self, kind: str, waited: float) -> float:
+        if waited > 0:
+            record_counter(RATE_LIMIT_WAIT_METRIC, waited, limiter=self.name, kind=kind)
+        return waited
+
+
+_GLOBAL_RATE_LIMITER = RateLimiter(name="global")
+
+
+def global_rate_limiter() -> RateLimiter:
+    return _GLOBAL_RATE_LIMITER
+
+
+def limits_bytes(limiters: Sequence[RateLimiter]) -> bool:
+    return any(limiter.limits_bytes for limiter in limiters)
+
+
+def acquire_op(limiters: Sequence[RateLimiter]) -> None:
+    for limiter in limiters:
+        limiter.acquire_op()
+
+
+async def acquire_async(limiters: Sequence[RateLimiter], byte_count: int = 0) -> float:
+    delay = max([max(limiter.reserve_op(), limiter.reserve_bytes(byte_count)) for limiter in limiters], default=0.0)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return delay
+
+
+class ThrottledReader(io.RawIOBase):
+    def __init__(self, readable: BinaryIO, limiters: Sequence[RateLimiter], close_source: bool = True):
+        self._readable = readable
+        self._limiters = [limiter for limiter in limiters if limiter.limits_bytes]
+        self._chunk_size = min([limiter.chunk_size for limiter in self._limiters] or [DEFAULT_CHUNK_SIZE])
+        self._close_source = close_source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._readable.read(min(len(buffer), self._chunk_size))
+        if not data:
+            return 0
+        for limiter in self._limiters:
+            limiter.acquire_bytes(len(data))
+        count = len(data)
+        buffer[:count] = data
+        return count
+
+    def close(self) -> None:
+        if not self.closed and self._close_source:
+            self._readable.close()
+        super().close()
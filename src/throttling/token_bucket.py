@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Callable, Optional
+
+DEFAULT_BURST_SECONDS = 0.1
+
+
+class TokenBucket:
+    def __init__(self, rate: Optional[float] = None, burst: float = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self._rate: Optional[float] = None
+        self._burst = 0.0
+        self._tokens = 0.0
+        self._updated = clock()
+        self._waited = 0.0
+        self.set_rate(rate, burst)
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    @property
+    def waited(self) -> float:
+        return self._waited
+
+    def set_rate(self, rate: Optional[float], burst: float = None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive or None for unlimited")
+        if burst is not None and burst <= 0:
+            raise ValueError("burst must be positive")
+        with self._lock:
+            self._refill()
+            previous, self._rate = self._rate, rate
+            self._burst = burst or (max(rate * DEFAULT_BURST_SECONDS, 1.0) if rate else 0.0)
+            if rate is None:
+                self._tokens = 0.0
+            elif previous is None:
+                self._tokens = self._burst
+            else:
+                self._tokens = min(self._tokens, self._burst)
+
+    def reserve(self, amount: float = 1.0) -> float:
+        with self._lock:
+            if self._rate is None:
+                return 0.0
+            self._refill()
+            self._tokens -= amount
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self._waited += delay
+            return delay
+
+    def acquire(self, amount: float = 1.0) -> float:
+        delay = self.reserve(amount)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
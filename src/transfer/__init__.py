@@ -0,0 +1,18 @@
+from .chunked_transfer import (
+    ChunkedTransfer,
+    ComposeAssembler,
+    MultipartAssembler,
+    Part,
+    PartAssembler,
+    choose_part_size,
+    plan_parts
+)
+from .concurrency import AdaptiveConcurrencyLimiter
+from .retry import DEFAULT_RETRY_POLICY, NO_RETRY, RetryPolicy
+from .tee import TeeOutcome, tee_file
+
+__all__ = [
+    'ChunkedTransfer', 'ComposeAssembler', 'MultipartAssembler', 'Part', 'PartAssembler',
+    'choose_part_size', 'plan_parts', 'AdaptiveConcurrencyLimiter', 'DEFAULT_RETRY_POLICY', 'NO_RETRY',
+    'RetryPolicy', 'TeeOutcome', 'tee_file'
+]
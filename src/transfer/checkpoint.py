@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Checkpoint:
+    def __init__(self, path: str, header: Dict[str, Any]):
+        self._path = path
+        self._header = header
+        self._lock = threading.Lock()
+        self.session: Optional[str] = None
+        self.offset = 0
+        self.parts: Dict[int, str] = {}
+
+    @property
+    def size(self) -> int:
+        return self._header["size"]
+
+    @property
+    def part_size(self) -> int:
+        return self._header["part_size"]
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.session is None and self.offset == 0 and not self.parts
+
+    def record_session(self, session: str) -> None:
+        self._append({"session": session})
+        self.session = session
+
+    def record_part(self, part_number: int, token: str) -> None:
+        self._append({"part": part_number, "token": token})
+        self.parts[part_number] = token
+
+    def record_offset(self, offset: int) -> None:
+        self._append({"offset": offset})
+        self.offset = offset
+
+    def discard(self) -> None:
+        with self._lock:
+            if os.path.exists(self._path):
+                os.remove(self._path)
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        if "session" in record:
+            self.session = record["session"]
+        elif "part" in record:
+            self.parts[int(record["part"])] = record["token"]
+        elif "offset" in record:
+            self.offset = int(record["offset"])
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self._path, "a", encoding="utf-8") as journal:
+                journal.write(line)
+
+
+class CheckpointJournal:
+    def __init__(self, directory: str):
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def open(self, source: str, destination: str, size: int, version: Any, part_size: int = 0,
+             on_stale: Callable[[Checkpoint], None] = None) -> Checkpoint:
+        digest = hashlib.sha256(f"{source}\0{destination}".encode("utf-8")).hexdigest()[:32]
+        path = os.path.join(self._directory, f"{digest}.journal")
+        header = {
+            "source": source,
+            "destination": destination,
+            "size": size,
+            "version": str(version),
+            "part_size": part_size,
+        }
+        checkpoint = self._load(path, header, on_stale)
+        if checkpoint is not None:
+            return checkpoint
+
+        checkpoint = Checkpoint(path, header)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as journal:
+            journal.write(json.dumps(header, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, path)
+        return checkpoint
+
+    @staticmethod
+    def _load(path: str, header: Dict[str, Any], on_stale: Callable[[Checkpoint], None] = None) -> Optional[Checkpoint]:
+        try:
+            with open(path, "r", encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+        except OSError:
+            return None
+
+        try:
+            stored = json.loads(lines[0]) if lines else None
+        except ValueError:
+            stored = None
+        if stored != header:
+            os.remove(path)
+            if on_stale is not None and isinstance(stored, dict):
+                on_stale(CheckpointJournal._replay_lines(path, stored, lines[1:]))
+            return None
+        return CheckpointJournal._replay_lines(path, header, lines[1:])
+
+    @staticmethod
+    def _replay_lines(path: str, header: Dict[str, Any], lines: List[str]) -> Checkpoint:
+        checkpoint = Checkpoint(path, header)
+        for line in lines:
+            try:
+                checkpoint._replay(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                break
+        return checkpoint
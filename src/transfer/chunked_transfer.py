@@ -0,0 +1,347 @@
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, List, Sequence, Tuple, TypeVar
+from src.interfaces.object_store_client import IObjectStoreClient
+from src.backends.connection_pool import ConnectionPool
+from src.utils.logger import get_logger
+from src.utils.streams import read_exactly
+from src.exceptions import FileNotFoundError, StorageOperationError, TransientStorageError
+from .checkpoint import Checkpoint, CheckpointJournal
+
+MiB = 1024 * 1024
+DEFAULT_PART_SIZE = 8 * MiB
+MAX_PART_SIZE = 5 * 1024 * MiB
+MAX_PARTS = 10000
+AUTO_TARGET_PARTS = 1000
+DEFAULT_MAX_CONCURRENCY = 4
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Part:
+    number: int
+    offset: int
+    length: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+def choose_part_size(size: int, part_size: int = None) -> int:
+    if part_size is not None and part_size < 1:
+        raise ValueError("part_size must be positive")
+    chosen = part_size or DEFAULT_PART_SIZE
+    if part_size is None:
+        while size > chosen * AUTO_TARGET_PARTS and chosen < MAX_PART_SIZE:
+            chosen *= 2
+    while size > chosen * MAX_PARTS:
+        chosen *= 2
+    return chosen
+
+
+def plan_parts(size: int, part_size: int) -> List[Part]:
+    return [
+        Part(number, offset, min(part_size, size - offset))
+        for number, offset in enumerate(range(0, size, part_size), start=1)
+    ]
+
+
+class PartAssembler(ABC):
+    name = "parts"
+
+    @abstractmethod
+    def begin(self, client: IObjectStoreClient, bucket: str, key: str, metadata: Dict[str, str]) -> str:
+        pass
+
+    @abstractmethod
+    def upload_part(self, client: IObjectStoreClient, bucket: str, key: str, session: str,
+                    part: Part, data: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def complete(self, client: IObjectStoreClient, bucket: str, key: str, session: str,
+                 tokens: List[Tuple[int, str]], metadata: Dict[str, str]) -> str:
+        pass
+
+    @abstractmethod
+    def abort(self, client: IObjectStoreClient, bucket: str, key: str, session: str,
+              parts: Sequence[Part]) -> None:
+        pass
+
+
+class MultipartAssembler(PartAssembler):
+    name = "multipart"
+
+    def begin(self, client, bucket, key, metadata):
+        return client.create_multipart_upload(bucket, key, metadata)
+
+    def upload_part(self, client, bucket, key, session, part, data):
+        return client.upload_part(bucket, key, session, part.number, data)
+
+    def complete(self, client, bucket, key, session, tokens, metadata):
+        return client.complete_multipart_upload(bucket, key, session, tokens)
+
+    def abort(self, client, bucket, key, session, parts):
+        client.abort_multipart_upload(bucket, key, session)
+
+
+class ComposeAssembler(PartAssembler):
+    name = "compose"
+    MAX_COMPONENTS = 32
+
+    def begin(self, client, bucket, key, metadata):
+        return uuid.uuid4().hex
+
+    def upload_part(self, client, bucket, key, session, part, data):
+        component = self._component_key(key, session, part.number)
+        client.put_object(bucket, component, data)
+        return component
+
+    def complete(self, client, bucket, key, session, tokens, metadata):
+        components = [component for _, component in sorted(tokens)]
+        intermediates = []
+        try:
+            while len(components) > self.MAX_COMPONENTS:
+                intermediate = f"{key}.__compose_{session}_{len(intermediates):05d}"
+                client.compose_object(bucket, intermediate, components[:self.MAX_COMPONENTS])
+                intermediates.append(intermediate)
+                components = [intermediate] + components[self.MAX_COMPONENTS:]
+            etag = client.compose_object(bucket, key, components, metadata)
+        finally:
+            for intermediate in intermediates:
+                client.delete_object(bucket, intermediate)
+        # Components stay in place until the compose succeeds so a failed complete can still be aborted or retried.
+        for _, component in tokens:
+            client.delete_object(bucket, component)
+        return etag
+
+    def abort(self, client, bucket, key, session, parts):
+        for part in parts:
+            client.delete_object(bucket, self._component_key(key, session, part.number))
+
+    @staticmethod
+    def _component_key(key: str, session: str, part_number: int) -> str:
+        return f"{key}.__part_{session}_{part_number:05d}"
+
+
+class ChunkedTransfer:
+    def __init__(self, assembler: PartAssembler, part_size: int = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, journal: CheckpointJournal = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        choose_part_size(0, part_size)
+        self._assembler = assembler
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._journal = journal
+        self._logger = get_logger(self.__class__.__name__)
+
+    def upload(self, pool: ConnectionPool, file_path: str, bucket: str, key: str,
+               metadata: Dict[str, str] = None) -> int:
+        stat = os.stat(file_path)
+        size = stat.st_size
+        part_size = choose_part_size(size, self._part_size)
+        if size <= part_size:
+            with open(file_path, "rb") as source:
+                data = source.read()
+            with pool.connection() as client:
+                client.put_object(bucket, key, data, metadata)
+            return size
+
+        parts = plan_parts(size, part_size)
+        if self._journal is not None:
+            self._upload_resumable(pool, file_path, bucket, key, metadata, stat, parts, part_size)
+            return size
+
+        with pool.connection() as client:
+            session = self._assembler.begin(client, bucket, key, metadata)
+        try:
+            tokens = self._run_parts(parts, lambda part: self._upload_part(pool, file_path, bucket, key, session, part))
+            with pool.connection() as client:
+                self._assembler.complete(client, bucket, key, session,
+                                         [(part.number, token) for part, token in zip(parts, tokens)], metadata)
+        except BaseException:
+            with pool.connection() as client:
+                self._assembler.abort(client, bucket, key, session, parts)
+            raise
+        return size
+
+    def upload_stream(self, pool: ConnectionPool, readable: BinaryIO, bucket: str, key: str,
+                      metadata: Dict[str, str] = None) -> int:
+        part_size = self._part_size or DEFAULT_PART_SIZE
+        data = read_exactly(readable, part_size)
+        if len(data) < part_size:
+            with pool.connection() as client:
+                client.put_object(bucket, key, data, metadata)
+            return len(data)
+
+        with pool.connection() as client:
+            session = self._assembler.begin(client, bucket, key, metadata)
+        parts: List[Part] = []
+        futures: List[Future] = []
+        errors: List[BaseException] = []
+        slots = threading.BoundedSemaphore(self._max_concurrency)
+
+        def release(future: Future) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                errors.append(future.exception())
+            slots.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+                offset = 0
+                while data and not errors:
+                    if len(parts) == MAX_PARTS:
+                        raise StorageOperationError(f"Stream exceeds {MAX_PARTS} parts of {part_size} bytes")
+                    part = Part(len(parts) + 1, offset, len(data))
+                    parts.append(part)
+                    offset = part.end
+                    slots.acquire()
+                    future = executor.submit(self._upload_data, pool, bucket, key, session, part, data)
+                    future.add_done_callback(release)
+                    futures.append(future)
+                    data = read_exactly(readable, part_size)
+            if errors:
+                raise errors[0]
+            with pool.connection() as client:
+                self._assembler.complete(client, bucket, key, session,
+                                         [(part.number, future.result()) for part, future in zip(parts, futures)],
+                                         metadata)
+        except BaseException:
+            with pool.connection() as client:
+                self._assembler.abort(client, bucket, key, session, parts)
+            raise
+        return offset
+
+    def download(self, pool: ConnectionPool, bucket: str, key: str, destination: str) -> int:
+        with pool.connection() as client:
+            info = client.head_object(bucket, key)
+        size = info.size
+        part_size = choose_part_size(size, self._part_size)
+        partial = f"{destination}.partial"
+        if self._journal is not None:
+            self._download_resumable(pool, bucket, key, info.etag, size, part_size, partial, destination)
+            return size
+
+        try:
+            with open(partial, "wb") as target:
+                target.truncate(size)
+            parts = plan_parts(size, part_size)
+            self._run_parts(parts, lambda part: self._download_part(pool, bucket, key, partial, part))
+            os.replace(partial, destination)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        return size
+
+    def _upload_part(self, pool: ConnectionPool, file_path: str, bucket: str, key: str, session: str,
+                     part: Part) -> str:
+        return self._upload_data(pool, bucket, key, session, part, _read_range(file_path, part))
+
+    def _upload_data(self, pool: ConnectionPool, bucket: str, key: str, session: str, part: Part,
+                     data: bytes) -> str:
+        with pool.connection() as client:
+            return self._assembler.upload_part(client, bucket, key, session, part, data)
+
+    @staticmethod
+    def _download_part(pool: ConnectionPool, bucket: str, key: str, partial: str, part: Part) -> None:
+        with pool.connection() as client:
+            data = client.get_object(bucket, key, part.offset, part.end)
+        _write_range(partial, part, data)
+
+    def _upload_resumable(self, pool: ConnectionPool, file_path: str, bucket: str, key: str,
+                          metadata: Dict[str, str], stat: os.stat_result, parts: List[Part], part_size: int) -> None:
+        checkpoint = self._journal.open(file_path, f"{self._assembler.name}:{bucket}/{key}",
+                                        stat.st_size, stat.st_mtime_ns, part_size,
+                                        on_stale=lambda stale: self._abandon(pool, bucket, key, stale))
+        resumed = checkpoint.session is not None
+        if not resumed:
+            with pool.connection() as client:
+                checkpoint.record_session(self._assembler.begin(client, bucket, key, metadata))
+        session = checkpoint.session
+
+        def upload_part(part: Part) -> None:
+            checkpoint.record_part(part.number, self._upload_part(pool, file_path, bucket, key, session, part))
+
+        try:
+            self._run_parts([part for part in parts if part.number not in checkpoint.parts], upload_part)
+        except FileNotFoundError:
+            if resumed:
+                self._abandon(pool, bucket, key, checkpoint)
+            raise
+        try:
+            with pool.connection() as client:
+                self._assembler.complete(client, bucket, key, session,
+                                         [(part.number, checkpoint.parts[part.number]) for part in parts], metadata)
+        except BaseException:
+            self._abandon(pool, bucket, key, checkpoint)
+            raise
+        checkpoint.discard()
+
+    def _abandon(self, pool: ConnectionPool, bucket: str, key: str, checkpoint: Checkpoint) -> None:
+        checkpoint.discard()
+        if checkpoint.session is None:
+            return
+        try:
+            with pool.connection() as client:
+                self._assembler.abort(client, bucket, key, checkpoint.session,
+                                      plan_parts(checkpoint.size, checkpoint.part_size))
+        except Exception as e:
+            self._logger.warning("Failed to abort %s session %s for %s/%s: %s",
+                                 self._assembler.name, checkpoint.session, bucket, key, e)
+
+    def _download_resumable(self, pool: ConnectionPool, bucket: str, key: str, etag: str, size: int,
+                            part_size: int, partial: str, destination: str) -> None:
+        checkpoint = self._journal.open(f"{bucket}/{key}", destination, size, etag, part_size)
+        if not checkpoint.is_fresh and (not os.path.exists(partial) or os.path.getsize(partial) != size):
+            checkpoint.discard()
+            checkpoint = self._journal.open(f"{bucket}/{key}", destination, size, etag, part_size)
+        if checkpoint.is_fresh:
+            with open(partial, "wb") as target:
+                target.truncate(size)
+
+        def download_part(part: Part) -> None:
+            self._download_part(pool, bucket, key, partial, part)
+            checkpoint.record_part(part.number, "")
+
+        parts = plan_parts(size, part_size)
+        self._run_parts([part for part in parts if part.number not in checkpoint.parts], download_part)
+        os.replace(partial, destination)
+        checkpoint.discard()
+
+    def _run_parts(self, parts: List[Part], work: Callable[[Part], T]) -> List[T]:
+        if len(parts) <= 1:
+            return [work(part) for part in parts]
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(parts))) as executor:
+            futures: List[Future] = [executor.submit(work, part) for part in parts]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+            return [future.result() for future in futures]
+
+
+def _read_range(file_path: str, part: Part) -> bytes:
+    with open(file_path, "rb") as source:
+        source.seek(part.offset)
+        data = source.read(part.length)
+    if len(data) != part.length:
+        raise StorageOperationError(f"Short read on part {part.number} of {file_path}")
+    return data
+
+
+def _write_range(file_path: str, part: Part, data: bytes) -> None:
+    if len(data) != part.length:
+        raise TransientStorageError(f"Short read on part {part.number}: expected {part.length} bytes")
+    with open(file_path, "r+b") as target:
+        target.seek(part.offset)
+        target.write(data)
@@ -0,0 +1,51 @@
+import threading
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 64, decrease_factor: float = 0.5):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self._condition = threading.Condition()
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._epoch = 0
+        self.throttles = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def maximum(self) -> int:
+        return self._maximum
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> int:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return self._epoch
+
+    def release(self, token: int, success: bool = True) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if success and token == self._epoch:
+                self._limit = min(self._maximum, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def record_throttle(self, token: int) -> int:
+        with self._condition:
+            self.throttles += 1
+            if token == self._epoch:
+                self._limit = max(self._minimum, self._limit * self._decrease_factor)
+                self._epoch += 1
+            return self._epoch
@@ -0,0 +1,66 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+DEFAULT_ALGORITHM = "blake2b"
+CONTENT_HASH_METADATA_KEY = "content-blake2b"
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def new_hash(algorithm: str = DEFAULT_ALGORITHM):
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algorithm)
+
+
+def hash_file(path: str, algorithm: str = DEFAULT_ALGORITHM, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    digest = new_hash(algorithm)
+    view = memoryview(bytearray(chunk_size))
+    with open(path, "rb", buffering=0) as source:
+        while True:
+            read = source.readinto(view)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class HashCache:
+    def __init__(self, max_entries: int = 100_000, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._max_entries = max_entries
+        self._chunk_size = chunk_size
+        self._entries: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def digest(self, path: str, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_dev, algorithm)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        value = hash_file(path, algorithm, self._chunk_size)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+DEFAULT_HASH_CACHE = HashCache()
@@ -0,0 +1,57 @@
+import io
+from src.backends.connection_pool import ConnectionPool
+
+
+class RangedObjectReader(io.RawIOBase):
+    def __init__(self, pool: ConnectionPool, bucket: str, key: str, size: int):
+        self._pool = pool
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed reader")
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        with self._pool.connection() as client:
+            data = client.get_object(self._bucket, self._key, self._position, end)
+        count = len(data)
+        buffer[:count] = data
+        self._position += count
+        return count
+
+
+def open_object(pool: ConnectionPool, bucket: str, key: str, buffer_size: int) -> io.BufferedReader:
+    with pool.connection() as client:
+        info = client.head_object(bucket, key)
+    return io.BufferedReader(RangedObjectReader(pool, bucket, key, info.size), buffer_size)
@@ -0,0 +1,52 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional, TypeVar
+from src.exceptions import ThrottledError, is_retryable
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.1
+    max_delay: float = 20.0
+    multiplier: float = 2.0
+    deadline: Optional[float] = None
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False, compare=False)
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must not be negative")
+
+    def backoff(self, attempt: int, error: BaseException = None) -> float:
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        retry_after = getattr(error, "retry_after", None) if isinstance(error, ThrottledError) else None
+        return max(delay, retry_after) if retry_after else delay
+
+    def run(self, operation: Callable[[], T],
+            on_retry: Callable[[int, BaseException, float], None] = None) -> T:
+        started = self.clock()
+        attempt = 1
+        while True:
+            try:
+                return operation()
+            except Exception as e:
+                if attempt >= self.max_attempts or not is_retryable(e):
+                    raise
+                delay = self.backoff(attempt, e)
+                if self.deadline is not None and self.clock() + delay - started > self.deadline:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, e, delay)
+                self.sleep(delay)
+                attempt += 1
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,95 @@
+import io
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, List, Optional, Sequence, Tuple
+from src.utils.streams import DEFAULT_CHUNK_SIZE
+
+DEFAULT_TEE_DEPTH = 4
+_END = object()
+
+
+@dataclass(frozen=True)
+class TeeOutcome:
+    result: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+
+class _TeeBranch(io.RawIOBase):
+    def __init__(self, depth: int):
+        self._chunks: queue.Queue = queue.Queue(depth)
+        self._pending = memoryview(b"")
+        self._finished = False
+        self.abandoned = threading.Event()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if self._finished:
+                return 0
+            chunk = self._chunks.get()
+            if chunk is _END:
+                self._finished = True
+                return 0
+            if isinstance(chunk, BaseException):
+                self._finished = True
+                raise chunk
+            self._pending = memoryview(chunk)
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def feed(self, item: object) -> None:
+        while not self.abandoned.is_set():
+            try:
+                self._chunks.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                continue
+
+
+def tee_file(file_path: str, consumers: Sequence[Callable[[BinaryIO], Any]], chunk_size: int = DEFAULT_CHUNK_SIZE,
+             depth: int = DEFAULT_TEE_DEPTH) -> Tuple[int, List[TeeOutcome]]:
+    branches = [_TeeBranch(depth) for _ in consumers]
+    outcomes: List[Optional[TeeOutcome]] = [None] * len(consumers)
+
+    def consume(index: int) -> None:
+        started = time.perf_counter()
+        try:
+            result = consumers[index](branches[index])
+            outcomes[index] = TeeOutcome(result, None, time.perf_counter() - started)
+        except BaseException as e:
+            outcomes[index] = TeeOutcome(None, e, time.perf_counter() - started)
+        finally:
+            branches[index].abandoned.set()
+
+    threads = [threading.Thread(target=consume, args=(index,), name=f"tee-{index}", daemon=True)
+               for index in range(len(consumers))]
+    for thread in threads:
+        thread.start()
+
+    bytes_read = 0
+    read_error: Optional[BaseException] = None
+    try:
+        with open(file_path, "rb", buffering=0) as source:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                bytes_read += len(chunk)
+                for branch in branches:
+                    branch.feed(chunk)
+    except OSError as e:
+        read_error = e
+    for branch in branches:
+        branch.feed(read_error if read_error is not None else _END)
+    for thread in threads:
+        thread.join()
+    if read_error is not None:
+        raise read_error
+    return bytes_read, outcomes
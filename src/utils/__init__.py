@@ -1,4 +1,9 @@
-from .logger import get_logger
-
-__all__ = ['get_logger']
+from .logger import JsonFormatter, RateLimitFilter, configure_logging, get_logger, shutdown_logging
+from .paths import StorageURI, parse_uri, require_file, split_bucket_key, split_bucket_prefix
+from .streams import ChunkReader, iter_chunks, read_exactly
 
+__all__ = [
+    'JsonFormatter', 'RateLimitFilter', 'configure_logging', 'get_logger', 'shutdown_logging',
+    'StorageURI', 'parse_uri', 'require_file', 'split_bucket_key', 'split_bucket_prefix', 'ChunkReader',
+    'iter_chunks', 'read_exactly'
+]
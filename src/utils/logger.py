@@ -1,16 +1,168 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, TextIO, Tuple
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_WARNING_INTERVAL = 60.0
+DEFAULT_QUEUE_SIZE = 10000
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, interval: float = DEFAULT_WARNING_INTERVAL, level: int = logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.level = level
+        self._lock = threading.Lock()
+        self._last: Dict[Tuple[str, object], Tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != self.level or self.interval <= 0:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            last, suppressed = self._last.get(key, (None, 0))
+            if last is not None and now - last < self.interval:
+                self._last[key] = (last, suppressed + 1)
+                return False
+            self._last[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if getattr(record, "suppressed", 0):
+            payload["suppressed"] = record.suppressed
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class _SuppressedCountFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{message} ({suppressed} similar messages suppressed)" if suppressed else message
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def __init__(self, records: queue.Queue, output: logging.Handler):
+        super().__init__(records)
+        self.output = output
+        self.direct = False
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.direct:
+            self.output.handle(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Only chatter is shed under back-pressure; warnings and errors block on the output instead.
+            if record.levelno >= logging.WARNING:
+                self.output.handle(record)
+            else:
+                self.dropped += 1
+
+
+class _LoggingState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loggers: "weakref.WeakSet[logging.Logger]" = weakref.WeakSet()
+        self.level = logging.INFO
+        self.handler: Optional[logging.Handler] = None
+        self.listener: Optional[QueueListener] = None
+
+
+_state = _LoggingState()
+
+
+def configure_logging(level: int = logging.INFO, stream: TextIO = None, asynchronous: bool = True,
+                      json_format: bool = False, warning_interval: float = DEFAULT_WARNING_INTERVAL,
+                      queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+    handler, listener = _build(stream, asynchronous, json_format, warning_interval, queue_size)
+    with _state.lock:
+        previous_handler, previous_listener = _install(level, handler, listener)
+    _stop(previous_handler, previous_listener)
+
+
+def shutdown_logging() -> None:
+    with _state.lock:
+        handler, listener, _state.listener = _state.handler, _state.listener, None
+    _stop(handler, listener)
 
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    with _state.lock:
+        if _state.handler is None:
+            _install(logging.INFO, *_build())
+        if logger not in _state.loggers and not logger.handlers:
+            _state.loggers.add(logger)
+            _attach(logger, None)
     return logger
 
+
+def _build(stream: TextIO = None, asynchronous: bool = True, json_format: bool = False,
+           warning_interval: float = DEFAULT_WARNING_INTERVAL,
+           queue_size: int = DEFAULT_QUEUE_SIZE) -> Tuple[logging.Handler, Optional[QueueListener]]:
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if json_format else _SuppressedCountFormatter(DEFAULT_FORMAT))
+    if asynchronous:
+        handler = _DeferredQueueHandler(queue.Queue(queue_size), output)
+        listener = QueueListener(handler.queue, output)
+    else:
+        handler, listener = output, None
+    handler.addFilter(RateLimitFilter(warning_interval))
+    return handler, listener
+
+
+def _install(level: int, handler: logging.Handler,
+             listener: Optional[QueueListener]) -> Tuple[Optional[logging.Handler], Optional[QueueListener]]:
+    previous_handler, previous_listener = _state.handler, _state.listener
+    _state.level, _state.handler, _state.listener = level, handler, listener
+    if listener is not None:
+        listener.start()
+    for logger in list(_state.loggers):
+        _attach(logger, previous_handler)
+    return previous_handler, previous_listener
+
+
+def _stop(handler: Optional[logging.Handler], listener: Optional[QueueListener]) -> None:
+    if listener is None:
+        return
+    # Records logged after the listener stops would sit in a queue nobody drains, so they go straight to the output.
+    if isinstance(handler, _DeferredQueueHandler):
+        handler.direct = True
+    listener.stop()
+
+
+def _attach(logger: logging.Logger, previous: Optional[logging.Handler]) -> None:
+    if previous is not None and previous in logger.handlers:
+        logger.removeHandler(previous)
+    logger.setLevel(_state.level)
+    if _state.handler not in logger.handlers:
+        logger.addHandler(_state.handler)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,85 @@
+import builtins
+import os
+import stat
+from functools import lru_cache
+from typing import Tuple
+from src.exceptions import FileNotFoundError, InvalidPathError
+
+LOCAL_SCHEME = "file"
+URI_CACHE_SIZE = 4096
+
+
+class StorageURI:
+    __slots__ = ("scheme", "bucket", "key")
+
+    def __init__(self, scheme: str, bucket: str, key: str):
+        object.__setattr__(self, "scheme", scheme)
+        object.__setattr__(self, "bucket", bucket)
+        object.__setattr__(self, "key", key)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("StorageURI is immutable")
+
+    @property
+    def is_local(self) -> bool:
+        return self.scheme == LOCAL_SCHEME
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StorageURI):
+            return NotImplemented
+        return (self.scheme, self.bucket, self.key) == (other.scheme, other.bucket, other.key)
+
+    def __hash__(self) -> int:
+        return hash((self.scheme, self.bucket, self.key))
+
+    def __str__(self) -> str:
+        if self.is_local:
+            return self.key
+        return f"{self.scheme}://{self.bucket}/{self.key}"
+
+    def __repr__(self) -> str:
+        return f"StorageURI(scheme={self.scheme!r}, bucket={self.bucket!r}, key={self.key!r})"
+
+
+@lru_cache(maxsize=URI_CACHE_SIZE)
+def parse_uri(uri: str) -> StorageURI:
+    scheme, separator, rest = uri.partition("://")
+    if not separator:
+        return StorageURI(LOCAL_SCHEME, "", uri)
+    if not scheme:
+        raise InvalidPathError(f"URI is missing a scheme: {uri}")
+    if scheme == LOCAL_SCHEME:
+        return StorageURI(LOCAL_SCHEME, "", rest)
+    bucket, _, key = rest.partition("/")
+    return StorageURI(scheme, bucket, key)
+
+
+def split_bucket_key(uri: str, scheme: str) -> Tuple[str, str]:
+    parsed = parse_uri(uri)
+    if parsed.scheme != scheme:
+        raise InvalidPathError(f"Invalid {scheme} URI: {uri}")
+    if not parsed.bucket or not parsed.key:
+        raise InvalidPathError(f"URI must include a bucket and an object key: {uri}")
+    return parsed.bucket, parsed.key
+
+
+def split_bucket_prefix(uri: str, scheme: str) -> Tuple[str, str]:
+    parsed = parse_uri(uri)
+    if parsed.scheme != scheme:
+        raise InvalidPathError(f"Invalid {scheme} URI: {uri}")
+    if not parsed.bucket:
+        raise InvalidPathError(f"URI must include a bucket: {uri}")
+    key_prefix = parsed.key
+    if key_prefix and not key_prefix.endswith("/"):
+        key_prefix += "/"
+    return parsed.bucket, key_prefix
+
+
+def require_file(path: str, role: str = "Source") -> os.stat_result:
+    try:
+        info = os.stat(path)
+    except (builtins.FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"{role} file not found: {path}") from None
+    if not stat.S_ISREG(info.st_mode):
+        raise InvalidPathError(f"{role} path is not a file: {path}")
+    return info
@@ -0,0 +1,48 @@
+import io
+from typing import BinaryIO, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ChunkReader(io.RawIOBase):
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+
+def read_exactly(readable: BinaryIO, size: int) -> bytes:
+    data = readable.read(size)
+    if data is None or len(data) == size or not data:
+        return data or b""
+    buffer = bytearray(data)
+    while len(buffer) < size:
+        chunk = readable.read(size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+def iter_chunks(readable: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    with readable:
+        while True:
+            chunk = readable.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,110 @@
+import asyncio
+import pytest
+import tempfile
+from pathlib import Path
+from src.backends import InMemoryObjectStore
+from src.factories import LocalDiskStorageFactory, AmazonStorageFactory, GoogleStorageFactory
+from src.client import AsyncServiceRunner
+from src.exceptions import FileNotFoundError, InvalidPathError
+from src.interfaces import IAsyncFileUploader, IAsyncFileDownloader, TransferResult
+
+
+class TestAsyncServiceRunner:
+    def test_upload_file_with_local_factory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "test.txt"
+            source_file.write_text("test content")
+
+            dest_file = Path(tmpdir) / "uploaded" / "test.txt"
+            service = AsyncServiceRunner(LocalDiskStorageFactory())
+
+            result = asyncio.run(service.upload_file(str(source_file), str(dest_file)))
+
+            assert result
+            assert dest_file.read_text() == "test content"
+
+    def test_download_file_with_google_factory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = AsyncServiceRunner(GoogleStorageFactory())
+
+            result = asyncio.run(service.download_file("gs://bucket/test.txt", str(Path(tmpdir) / "test.txt")))
+
+            assert result
+
+    @pytest.mark.parametrize("factory_class, scheme", [(AmazonStorageFactory, "s3"), (GoogleStorageFactory, "gs")])
+    def test_cloud_round_trip_uses_the_factory_pool(self, factory_class, scheme):
+        store = InMemoryObjectStore()
+        service = AsyncServiceRunner(factory_class(client_factory=store.client, part_size=64 * 1024))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "data.bin"
+            source_file.write_bytes(bytes(range(256)) * 1000)
+
+            uploaded = asyncio.run(service.upload_file(str(source_file), f"{scheme}://bucket/data.bin"))
+            assert store.keys("bucket") == ["data.bin"]
+            assert store.client().get_object("bucket", "data.bin") == source_file.read_bytes()
+
+            downloaded = asyncio.run(service.download_file(f"{scheme}://bucket/data.bin", f"{tmpdir}/back.bin"))
+            assert (Path(tmpdir) / "back.bin").read_bytes() == source_file.read_bytes()
+            assert uploaded.bytes_transferred == downloaded.bytes_transferred == 256_000
+
+    def test_upload_file_raises_on_missing_source(self):
+        service = AsyncServiceRunner(AmazonStorageFactory())
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(service.upload_file("/nonexistent/file.txt", "s3://bucket/test.txt"))
+
+    def test_upload_many_bounds_concurrency(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = []
+            for i in range(50):
+                source_file = Path(tmpdir) / f"file_{i}.txt"
+                source_file.write_text("x" * i)
+                pairs.append((str(source_file), str(Path(tmpdir) / "uploaded" / f"file_{i}.txt")))
+            pairs.append(("/nonexistent/file.txt", str(Path(tmpdir) / "uploaded" / "missing.txt")))
+
+            service = AsyncServiceRunner(LocalDiskStorageFactory(), max_concurrency=8)
+            results = asyncio.run(service.upload_many(pairs))
+
+            assert len(results) == 51
+            assert all(result.success for result in results[:50])
+            assert [result.bytes_transferred for result in results[:50]] == list(range(50))
+            assert isinstance(results[50].error, FileNotFoundError)
+
+    def test_in_flight_never_exceeds_limit(self):
+        class SlowUploader(IAsyncFileUploader):
+            def __init__(self):
+                self.active = 0
+                self.peak = 0
+
+            async def upload(self, file_path, destination):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.001)
+                self.active -= 1
+                return TransferResult.completed(file_path, destination, 0)
+
+        uploader = SlowUploader()
+        factory = AmazonStorageFactory()
+        factory.create_async_uploader = lambda: uploader
+        service = AsyncServiceRunner(factory, max_concurrency=5)
+
+        results = asyncio.run(service.upload_many((f"file_{i}", f"s3://bucket/{i}") for i in range(40)))
+
+        assert len(results) == 40
+        assert uploader.peak == 5
+
+    def test_download_many_with_amazon_factory_reports_invalid_paths(self):
+        service = AsyncServiceRunner(AmazonStorageFactory())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = asyncio.run(service.download_many([
+                ("s3://bucket/a.txt", str(Path(tmpdir) / "a.txt")),
+                ("gs://bucket/b.txt", str(Path(tmpdir) / "b.txt")),
+            ]))
+
+        assert results[0].success
+        assert isinstance(results[1].error, InvalidPathError)
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncServiceRunner(LocalDiskStorageFactory(), max_concurrency=0)
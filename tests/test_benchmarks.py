@@ -0,0 +1,78 @@
+import json
+import subprocess
+import sys
+import pytest
+from benchmarks import PROVIDERS, Workload, find_regressions, run_isolated, run_scenario
+from benchmarks.__main__ import main
+from benchmarks.import_time import measure_import
+from benchmarks.metrics import Measurement, percentile
+
+
+class TestBenchmarkMetrics:
+    def test_percentile_uses_nearest_rank(self):
+        samples = list(range(1, 101))
+
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 99) == 99
+        assert percentile([], 95) == 0.0
+
+    def test_cpu_time_includes_child_processes(self):
+        with Measurement() as measurement:
+            subprocess.run([sys.executable, "-c", "sum(range(3_000_000))"], check=True)
+
+        assert measurement.child_cpu_seconds > 0
+        assert measurement.cpu_seconds >= measurement.child_cpu_seconds
+
+    def test_regression_detection(self):
+        scenario = {"provider": "s3", "workload": "small", "mode": "upload", "concurrency": 4}
+        baseline = {"scenarios": [dict(scenario, throughput_mb_s=100.0)]}
+
+        assert find_regressions(baseline, {"scenarios": [dict(scenario, throughput_mb_s=95.0)]}) == []
+        regressions = find_regressions(baseline, {"scenarios": [dict(scenario, throughput_mb_s=80.0)]})
+        assert regressions[0]["change"] == -0.2
+
+
+class TestBenchmarkRunner:
+    @pytest.mark.parametrize("provider", sorted(PROVIDERS))
+    @pytest.mark.parametrize("mode", ["upload", "download"])
+    def test_scenario_report(self, provider, mode):
+        workload = Workload("tiny", [1024] * 5 + [300 * 1024])
+
+        report = run_scenario(PROVIDERS[provider], workload, mode, concurrency=2)
+
+        assert (report["provider"], report["mode"], report["files"]) == (provider, mode, 6)
+        assert report["bytes"] == 5 * 1024 + 300 * 1024
+        assert report["throughput_mb_s"] > 0
+        assert set(report["latency_ms"]) == {"p50", "p95", "p99"}
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+
+    def test_isolated_scenario_reports_its_own_resources(self):
+        report = run_isolated("local", Workload("tiny", [1024] * 3), "upload", concurrency=1)
+
+        assert (report["provider"], report["files"]) == ("local", 3)
+        assert {"cpu_seconds", "child_cpu_seconds", "peak_rss_bytes", "child_peak_rss_bytes"} <= set(report)
+
+    def test_cli_writes_json(self, tmp_path):
+        output = tmp_path / "report.json"
+
+        exit_code = main(["--providers", "local", "--workloads", "small", "--modes", "upload",
+                          "--concurrency", "2", "--scale", "0.005", "--output", str(output)])
+
+        report = json.loads(output.read_text())
+        assert exit_code == 0
+        assert len(report["scenarios"]) == 1
+        assert report["scenarios"][0]["files"] == 5
+
+
+class TestImportTime:
+    def test_local_factory_skips_cloud_providers(self):
+        report = measure_import(runs=1)
+
+        assert report["heavy_modules"] == []
+        assert report["median_ms"] < 1000
+
+    def test_cloud_factories_load_on_first_access(self):
+        report = measure_import("import src.factories as f; f.AmazonStorageFactory", runs=1)
+
+        assert "src.products.amazon.s3_uploader" in report["heavy_modules"]
+        assert not any(module.startswith("src.products.google") for module in report["heavy_modules"])
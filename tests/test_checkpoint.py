@@ -0,0 +1,231 @@
+import os
+import pytest
+import tempfile
+from pathlib import Path
+from src.backends import InMemoryObjectStore, InMemoryObjectStoreClient
+from src.client import ServiceRunner
+from src.exceptions import StorageOperationError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.products.local import copy_engine
+from src.transfer.checkpoint import CheckpointJournal
+
+
+class FaultPlan:
+    def __init__(self, fail_part=None, fail_range_start=None, fail_compose=False):
+        self.fail_part = fail_part
+        self.fail_range_start = fail_range_start
+        self.fail_compose = fail_compose
+        self.uploaded_parts = []
+        self.ranges = []
+
+
+class FlakyClient(InMemoryObjectStoreClient):
+    def __init__(self, store, plan):
+        super().__init__(store)
+        self.plan = plan
+
+    def upload_part(self, bucket, key, upload_id, part_number, data):
+        if part_number == self.plan.fail_part:
+            self.plan.fail_part = None
+            raise IOError("connection reset")
+        self.plan.uploaded_parts.append(part_number)
+        return super().upload_part(bucket, key, upload_id, part_number, data)
+
+    def compose_object(self, bucket, key, sources, metadata=None):
+        if self.plan.fail_compose:
+            self.plan.fail_compose = False
+            raise IOError("backend error")
+        return super().compose_object(bucket, key, sources, metadata)
+
+    def get_object(self, bucket, key, start=0, end=None):
+        if start == self.plan.fail_range_start:
+            self.plan.fail_range_start = None
+            raise IOError("connection reset")
+        self.plan.ranges.append(start)
+        return super().get_object(bucket, key, start, end)
+
+
+class TestCheckpointJournal:
+    def test_records_survive_reopen(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = CheckpointJournal(tmpdir)
+            checkpoint = journal.open("src", "dst", 100, 5, part_size=10)
+            checkpoint.record_session("upload-1")
+            checkpoint.record_part(1, "etag-1")
+            checkpoint.record_offset(40)
+
+            reopened = journal.open("src", "dst", 100, 5, part_size=10)
+
+            assert reopened.session == "upload-1"
+            assert reopened.parts == {1: "etag-1"}
+            assert reopened.offset == 40
+
+    def test_mismatched_checkpoint_is_discarded(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = CheckpointJournal(tmpdir)
+            journal.open("src", "dst", 100, 5).record_offset(40)
+
+            assert journal.open("src", "dst", 100, 6).is_fresh
+            assert journal.open("src", "dst", 100, 6).is_fresh
+
+    def test_truncated_record_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = CheckpointJournal(tmpdir)
+            checkpoint = journal.open("src", "dst", 100, 5)
+            checkpoint.record_offset(40)
+            with open(checkpoint._path, "a") as handle:
+                handle.write('{"offset": 8')
+
+            assert journal.open("src", "dst", 100, 5).offset == 40
+
+    def test_discard_removes_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = CheckpointJournal(tmpdir)
+            journal.open("src", "dst", 100, 5).discard()
+
+            assert os.listdir(tmpdir) == []
+
+
+class TestResumableDiskCopy:
+    def test_resumes_after_interruption(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(10_000))
+            dest_file = Path(tmpdir) / "dest.bin"
+            journal = CheckpointJournal(str(Path(tmpdir) / "checkpoints"))
+
+            real_copy_range = copy_engine._copy_range
+            calls = []
+
+            def crash_on_third_chunk(*args):
+                calls.append(args)
+                if len(calls) == 3:
+                    raise OSError("disk went away")
+                return real_copy_range(*args)
+
+            monkeypatch.setattr(copy_engine, "_copy_range", crash_on_third_chunk)
+            with pytest.raises(OSError):
+                copy_engine.copy_file_resumable(str(source_file), str(dest_file), journal, checkpoint_interval=1000)
+            assert not dest_file.exists()
+
+            monkeypatch.setattr(copy_engine, "_copy_range", real_copy_range)
+            result = copy_engine.copy_file_resumable(str(source_file), str(dest_file), journal,
+                                                     checkpoint_interval=1000)
+
+            assert result.bytes_copied == 8000
+            assert dest_file.read_bytes() == source_file.read_bytes()
+            assert os.listdir(journal.directory) == []
+
+    def test_changed_source_restarts_copy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(5000))
+            dest_file = Path(tmpdir) / "dest.bin"
+            journal = CheckpointJournal(str(Path(tmpdir) / "checkpoints"))
+            stat = source_file.stat()
+            journal.open(str(source_file), str(dest_file), stat.st_size, stat.st_mtime_ns).record_offset(3000)
+            Path(f"{dest_file}.partial").write_bytes(b"\0" * 3000)
+
+            os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            result = copy_engine.copy_file_resumable(str(source_file), str(dest_file), journal)
+
+            assert result.bytes_copied == 5000
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+    def test_service_runner_with_checkpointed_local_factory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(4096))
+            dest_file = Path(tmpdir) / "uploaded" / "dest.bin"
+            factory = LocalDiskStorageFactory(checkpoint_dir=str(Path(tmpdir) / "checkpoints"))
+
+            assert ServiceRunner(factory).upload_file(str(source_file), str(dest_file))
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+
+class TestResumableCloudTransfers:
+    def test_upload_resumes_with_missing_parts_only(self):
+        store = InMemoryObjectStore()
+        plan = FaultPlan(fail_part=3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(1024 * 6))
+            factory = AmazonStorageFactory(client_factory=lambda: FlakyClient(store, plan), part_size=1024, max_concurrency=1,
+                                           checkpoint_dir=str(Path(tmpdir) / "checkpoints"))
+            service = ServiceRunner(factory)
+
+            with pytest.raises(StorageOperationError):
+                service.upload_file(str(source_file), "s3://bucket/source.bin")
+            assert store.pending_uploads() == 1
+            first_attempt = list(plan.uploaded_parts)
+
+            assert service.upload_file(str(source_file), "s3://bucket/source.bin")
+
+            resumed = plan.uploaded_parts[len(first_attempt):]
+            assert not set(first_attempt) & set(resumed)
+            assert sorted(first_attempt + resumed) == [1, 2, 3, 4, 5, 6]
+            assert store.client().get_object("bucket", "source.bin") == source_file.read_bytes()
+            assert os.listdir(Path(tmpdir) / "checkpoints") == []
+
+    def test_failed_compose_is_retried_from_scratch(self):
+        store = InMemoryObjectStore()
+        plan = FaultPlan(fail_compose=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(1024 * 4))
+            factory = GoogleStorageFactory(client_factory=lambda: FlakyClient(store, plan), part_size=1024,
+                                           max_concurrency=1, checkpoint_dir=str(Path(tmpdir) / "checkpoints"))
+            service = ServiceRunner(factory)
+
+            with pytest.raises(StorageOperationError):
+                service.upload_file(str(source_file), "gs://bucket/source.bin")
+            assert store.keys("bucket") == []
+            assert os.listdir(Path(tmpdir) / "checkpoints") == []
+
+            assert service.upload_file(str(source_file), "gs://bucket/source.bin")
+            assert store.keys("bucket") == ["source.bin"]
+            assert store.client().get_object("bucket", "source.bin") == source_file.read_bytes()
+
+    def test_changed_source_aborts_the_stale_session(self):
+        store = InMemoryObjectStore()
+        plan = FaultPlan(fail_part=3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(1024 * 6))
+            factory = AmazonStorageFactory(client_factory=lambda: FlakyClient(store, plan), part_size=1024,
+                                           max_concurrency=1, checkpoint_dir=str(Path(tmpdir) / "checkpoints"))
+            service = ServiceRunner(factory)
+
+            with pytest.raises(StorageOperationError):
+                service.upload_file(str(source_file), "s3://bucket/source.bin")
+            assert store.pending_uploads() == 1
+
+            source_file.write_bytes(os.urandom(1024 * 5))
+            assert service.upload_file(str(source_file), "s3://bucket/source.bin")
+            assert store.pending_uploads() == 0
+            assert store.client().get_object("bucket", "source.bin") == source_file.read_bytes()
+
+    def test_download_resumes_with_missing_ranges_only(self):
+        store = InMemoryObjectStore()
+        payload = os.urandom(1024 * 5)
+        store.client().put_object("bucket", "blob.bin", payload)
+        plan = FaultPlan(fail_range_start=1024 * 3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest_file = Path(tmpdir) / "blob.bin"
+            factory = AmazonStorageFactory(client_factory=lambda: FlakyClient(store, plan), part_size=1024, max_concurrency=1,
+                                           checkpoint_dir=str(Path(tmpdir) / "checkpoints"))
+            service = ServiceRunner(factory)
+
+            with pytest.raises(StorageOperationError):
+                service.download_file("s3://bucket/blob.bin", str(dest_file))
+            assert Path(f"{dest_file}.partial").exists()
+            first_attempt = list(plan.ranges)
+
+            assert service.download_file("s3://bucket/blob.bin", str(dest_file))
+
+            assert sorted(plan.ranges[len(first_attempt):] + first_attempt) == [0, 1024, 2048, 3072, 4096]
+            assert dest_file.read_bytes() == payload
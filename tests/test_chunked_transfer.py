@@ -0,0 +1,129 @@
+import os
+import pytest
+import tempfile
+from pathlib import Path
+from src.backends import ConnectionPool, InMemoryObjectStore, InMemoryObjectStoreClient
+from src.client import ServiceRunner
+from src.exceptions import FileNotFoundError, StorageOperationError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory
+from src.products.amazon.s3_uploader import S3Uploader
+from src.products.google.gcs_uploader import GCSUploader
+from src.transfer import choose_part_size, plan_parts
+from src.transfer.chunked_transfer import DEFAULT_PART_SIZE, MAX_PARTS, MiB
+
+
+class FailingPartClient(InMemoryObjectStoreClient):
+    def upload_part(self, bucket, key, upload_id, part_number, data):
+        if part_number == 3:
+            raise IOError("connection reset")
+        return super().upload_part(bucket, key, upload_id, part_number, data)
+
+
+class TestPartPlanning:
+    def test_plan_parts_covers_file(self):
+        parts = plan_parts(10, 4)
+
+        assert [(part.number, part.offset, part.length) for part in parts] == [(1, 0, 4), (2, 4, 4), (3, 8, 2)]
+
+    def test_auto_part_size_grows_with_file_size(self):
+        assert choose_part_size(10 * MiB) == DEFAULT_PART_SIZE
+        assert choose_part_size(100 * 1024 * MiB) > DEFAULT_PART_SIZE
+
+    def test_explicit_part_size_respects_part_limit(self):
+        assert choose_part_size(10 * MiB, part_size=MiB) == MiB
+        assert choose_part_size(MAX_PARTS * 4 + 1, part_size=2) == 8
+
+    def test_invalid_part_size(self):
+        with pytest.raises(ValueError):
+            choose_part_size(10, part_size=0)
+
+
+class TestChunkedCloudTransfers:
+    def _write_source(self, tmpdir, size):
+        source_file = Path(tmpdir) / "source.bin"
+        source_file.write_bytes(os.urandom(size))
+        return source_file
+
+    @pytest.mark.parametrize("factory_class,scheme", [(AmazonStorageFactory, "s3"), (GoogleStorageFactory, "gs")])
+    def test_round_trip_in_parts(self, factory_class, scheme):
+        store = InMemoryObjectStore()
+        factory = factory_class(client_factory=store.client, part_size=64 * 1024, max_concurrency=4)
+        service = ServiceRunner(factory)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 64 * 1024 * 5 + 123)
+            dest_file = Path(tmpdir) / "downloaded" / "source.bin"
+
+            assert service.upload_file(str(source_file), f"{scheme}://bucket/data/source.bin")
+            assert service.download_file(f"{scheme}://bucket/data/source.bin", str(dest_file))
+
+            assert dest_file.read_bytes() == source_file.read_bytes()
+            assert store.keys("bucket") == ["data/source.bin"]
+            assert not Path(f"{dest_file}.partial").exists()
+
+    def test_small_file_uses_single_put(self):
+        store = InMemoryObjectStore()
+        uploader = S3Uploader(pool=ConnectionPool(store.client), part_size=1024)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 1000)
+            uploader.upload(str(source_file), "s3://bucket/small.bin")
+
+        assert store.request_count == 1
+        assert "-" not in store.client().head_object("bucket", "small.bin").etag
+
+    def test_multipart_etag(self):
+        store = InMemoryObjectStore()
+        uploader = S3Uploader(pool=ConnectionPool(store.client), part_size=1024)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 4096)
+            uploader.upload(str(source_file), "s3://bucket/large.bin")
+
+        assert store.client().head_object("bucket", "large.bin").etag.endswith("-4")
+
+    def test_gcs_compose_handles_more_than_32_components(self):
+        store = InMemoryObjectStore()
+        uploader = GCSUploader(pool=ConnectionPool(store.client), part_size=16, max_concurrency=8)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 16 * 70 + 5)
+            uploader.upload(str(source_file), "gs://bucket/composed.bin")
+
+            assert store.keys("bucket") == ["composed.bin"]
+            assert store.client().get_object("bucket", "composed.bin") == source_file.read_bytes()
+
+    def test_failed_part_aborts_multipart_upload(self):
+        store = InMemoryObjectStore()
+        uploader = S3Uploader(pool=ConnectionPool(lambda: FailingPartClient(store)), part_size=1024)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 8192)
+
+            with pytest.raises(StorageOperationError):
+                uploader.upload(str(source_file), "s3://bucket/large.bin")
+
+        assert store.pending_uploads() == 0
+        assert store.keys("bucket") == []
+
+    def test_download_missing_object(self):
+        factory = AmazonStorageFactory(client_factory=InMemoryObjectStore().client)
+        downloader = factory.create_downloader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                downloader.download("s3://bucket/missing.bin", str(Path(tmpdir) / "missing.bin"))
+
+    def test_ranged_download_in_parts(self):
+        store = InMemoryObjectStore()
+        client = store.client()
+        payload = os.urandom(10_000)
+        client.put_object("bucket", "blob.bin", payload)
+        factory = GoogleStorageFactory(client_factory=store.client, part_size=999)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest_file = Path(tmpdir) / "blob.bin"
+            factory.create_downloader().download("gs://bucket/blob.bin", str(dest_file))
+
+            assert dest_file.read_bytes() == payload
+        assert store.request_count == 1 + 1 + 11
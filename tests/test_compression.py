@@ -0,0 +1,125 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import AsyncServiceRunner
+from src.compression import CODEC_METADATA_KEY, available_codecs, is_compressible
+from src.exceptions import PermanentStorageError
+from src.factories import AmazonStorageFactory, CompressingStorageFactory, LocalDiskStorageFactory
+
+LOG_LINES = "".join(json.dumps({"level": "info", "message": f"request {i} served"}) + "\n" for i in range(5000))
+
+
+def _write(directory, name, content):
+    path = Path(directory) / name
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestCodecs:
+    def test_builtin_codecs_are_registered(self):
+        assert {"gzip", "zlib"} <= set(available_codecs())
+
+    def test_heuristic_skips_small_and_random_data(self):
+        assert is_compressible(LOG_LINES.encode())
+        assert not is_compressible(os.urandom(64 * 1024))
+        assert not is_compressible(b"tiny")
+
+
+class TestCompressingStorageFactory:
+    @pytest.mark.parametrize("codec", ["gzip", "zlib"])
+    def test_round_trip_through_object_store(self, codec):
+        store = InMemoryObjectStore()
+        factory = CompressingStorageFactory(AmazonStorageFactory(client_factory=store.client), codec=codec)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "app.log", LOG_LINES.encode())
+            assert factory.create_uploader().upload(source, "s3://bucket/app.log")
+
+            stored = store.client().get_object("bucket", "app.log")
+            assert len(stored) < len(LOG_LINES) // 5
+            assert store.client().head_object("bucket", "app.log").metadata[CODEC_METADATA_KEY] == codec
+
+            destination = os.path.join(tmpdir, "restored.log")
+            assert factory.create_downloader().download("s3://bucket/app.log", destination)
+            assert Path(destination).read_text() == LOG_LINES
+            with factory.create_downloader().open_read("s3://bucket/app.log") as readable:
+                assert readable.read().decode() == LOG_LINES
+
+    def test_incompressible_files_are_stored_raw(self):
+        factory = CompressingStorageFactory(LocalDiskStorageFactory())
+        payload = os.urandom(200 * 1024)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "blob.bin", payload)
+            stored = os.path.join(tmpdir, "stored", "blob.bin")
+            factory.create_uploader().upload(source, stored)
+            assert Path(stored).read_bytes() == payload
+
+            destination = os.path.join(tmpdir, "restored.bin")
+            factory.create_downloader().download(stored, destination)
+            assert Path(destination).read_bytes() == payload
+
+    def test_raw_objects_are_fetched_once(self):
+        store = InMemoryObjectStore()
+        payload = os.urandom(200 * 1024)
+        store.client().put_object("bucket", "blob.bin", payload)
+        downloader = CompressingStorageFactory(AmazonStorageFactory(client_factory=store.client)).create_downloader()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = os.path.join(tmpdir, "blob.bin")
+            before = store.request_count
+
+            result = downloader.download("s3://bucket/blob.bin", destination)
+
+            assert Path(destination).read_bytes() == payload
+            assert (result.bytes_transferred, result.strategy) == (len(payload), "stream")
+            assert store.request_count - before == 2
+
+    def test_upload_stream_leaves_caller_stream_open(self):
+        factory = CompressingStorageFactory(LocalDiskStorageFactory())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stored = os.path.join(tmpdir, "stream.log")
+            stream = io.BytesIO(LOG_LINES.encode())
+            factory.create_uploader().upload_stream(stream, stored)
+
+            assert not stream.closed
+            assert os.path.getsize(stored) < len(LOG_LINES) // 5
+            with factory.create_downloader().open_read(stored) as readable:
+                assert readable.read().decode() == LOG_LINES
+
+    def test_truncated_objects_are_rejected(self):
+        factory = CompressingStorageFactory(LocalDiskStorageFactory())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "app.log", LOG_LINES.encode())
+            stored = os.path.join(tmpdir, "stored.log")
+            factory.create_uploader().upload(source, stored)
+            Path(stored).write_bytes(Path(stored).read_bytes()[:-20])
+
+            destination = os.path.join(tmpdir, "restored.log")
+            with pytest.raises(PermanentStorageError):
+                factory.create_downloader().download(stored, destination)
+            assert not os.path.exists(destination)
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError):
+            CompressingStorageFactory(LocalDiskStorageFactory(), codec="brotli")
+
+    def test_async_round_trip_uses_the_codec(self):
+        store = InMemoryObjectStore()
+        factory = CompressingStorageFactory(AmazonStorageFactory(client_factory=store.client))
+        service = AsyncServiceRunner(factory)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "app.log", LOG_LINES.encode())
+            asyncio.run(service.upload_file(source, "s3://bucket/app.log"))
+            assert len(store.client().get_object("bucket", "app.log")) < len(LOG_LINES) // 5
+            assert store.client().head_object("bucket", "app.log").metadata[CODEC_METADATA_KEY] == "gzip"
+
+            destination = os.path.join(tmpdir, "restored.log")
+            asyncio.run(service.download_file("s3://bucket/app.log", destination))
+            assert Path(destination).read_text() == LOG_LINES
+
+    def test_inspector_is_not_provided(self):
+        with pytest.raises(NotImplementedError):
+            CompressingStorageFactory(LocalDiskStorageFactory()).create_inspector()
@@ -0,0 +1,117 @@
+import os
+import pytest
+import tempfile
+import threading
+from pathlib import Path
+from src.backends import ConnectionPool, InMemoryObjectStore
+from src.client import ServiceRunner
+from src.exceptions import StorageOperationError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool:
+    def test_reuses_released_connections(self):
+        pool = ConnectionPool(FakeConnection, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert pool.created == 1
+        assert pool.reused == 1
+
+    def test_blocks_when_exhausted(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, acquire_timeout=0.05)
+        held = pool.acquire()
+
+        with pytest.raises(StorageOperationError):
+            pool.acquire()
+
+        pool.release(held)
+        assert pool.acquire() is held
+
+    def test_waiter_is_woken_on_release(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, acquire_timeout=5)
+        held = pool.acquire()
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        pool.release(held)
+        waiter.join(timeout=5)
+
+        assert acquired == [held]
+
+    def test_idle_connections_are_evicted(self):
+        pool = ConnectionPool(FakeConnection, idle_timeout=0)
+        with pool.connection() as connection:
+            pass
+
+        assert pool.evict_idle() == 1
+        assert connection.closed
+        assert pool.idle == 0
+
+    def test_broken_connections_are_discarded(self):
+        pool = ConnectionPool(FakeConnection)
+
+        with pytest.raises(ConnectionError):
+            with pool.connection() as connection:
+                raise ConnectionError("reset by peer")
+
+        assert connection.closed
+        assert pool.size == 0
+
+    def test_close_shuts_down_connections(self):
+        pool = ConnectionPool(FakeConnection)
+        idle = pool.acquire()
+        busy = pool.acquire()
+        pool.release(idle)
+
+        pool.close()
+
+        assert idle.closed
+        assert not busy.closed
+        pool.release(busy)
+        assert busy.closed
+        with pytest.raises(StorageOperationError):
+            pool.acquire()
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(FakeConnection, max_size=0)
+
+
+class TestFactoryOwnedPools:
+    @pytest.mark.parametrize("factory_class,scheme", [(AmazonStorageFactory, "s3"), (GoogleStorageFactory, "gs")])
+    def test_products_share_the_factory_pool(self, factory_class, scheme):
+        store = InMemoryObjectStore()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(4096))
+
+            with factory_class(client_factory=store.client, part_size=512, max_connections=3) as factory:
+                services = [ServiceRunner(factory) for _ in range(4)]
+                for index, service in enumerate(services):
+                    service.upload_file(str(source_file), f"{scheme}://bucket/{index}.bin")
+                    service.download_file(f"{scheme}://bucket/{index}.bin", str(Path(tmpdir) / f"{index}.bin"))
+
+                assert store.clients_created <= 3
+                assert factory.create_uploader()._pool is factory.create_downloader()._pool
+
+            with pytest.raises(StorageOperationError):
+                services[0].upload_file(str(source_file), f"{scheme}://bucket/closed.bin")
+
+    def test_factory_without_client_factory_closes_cleanly(self):
+        with AmazonStorageFactory() as factory:
+            assert factory.create_uploader()._pool is None
@@ -0,0 +1,105 @@
+import os
+import pytest
+import shutil
+import tempfile
+from pathlib import Path
+from src.products.local import copy_engine
+from src.products.local.copy_engine import copy_file
+from src.products.local.disk_uploader import DiskUploader
+from src.exceptions import StorageOperationError
+
+
+class TestCopyEngine:
+    def _write_source(self, tmpdir, size):
+        source_file = Path(tmpdir) / "source.bin"
+        source_file.write_bytes(os.urandom(size))
+        return source_file
+
+    def test_auto_reports_strategy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 3 * 1024 * 1024 + 17)
+            dest_file = Path(tmpdir) / "dest.bin"
+
+            result = copy_file(str(source_file), str(dest_file))
+
+            assert result.strategy in copy_engine.STRATEGIES
+            assert result.bytes_copied == source_file.stat().st_size
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+    @pytest.mark.parametrize("strategy", [copy_engine.COPY_FILE_RANGE, copy_engine.SENDFILE, copy_engine.BUFFERED])
+    def test_explicit_strategy(self, strategy):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 256 * 1024 + 3)
+            dest_file = Path(tmpdir) / "dest.bin"
+
+            try:
+                result = copy_file(str(source_file), str(dest_file), strategy, buffer_size=4096)
+            except OSError:
+                pytest.skip(f"{strategy} is not supported on this platform")
+
+            assert result.strategy == strategy
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+    def test_explicit_reflink_copies_or_raises(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 4096)
+            dest_file = Path(tmpdir) / "dest.bin"
+
+            try:
+                result = copy_file(str(source_file), str(dest_file), copy_engine.REFLINK)
+            except OSError:
+                return
+            assert result.strategy == copy_engine.REFLINK
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 0)
+            dest_file = Path(tmpdir) / "dest.bin"
+
+            result = copy_file(str(source_file), str(dest_file))
+
+            assert result.bytes_copied == 0
+            assert dest_file.read_bytes() == b""
+
+    def test_preserves_modification_time(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 1024)
+            os.utime(source_file, (1_000_000, 1_000_000))
+            dest_file = Path(tmpdir) / "dest.bin"
+
+            copy_file(str(source_file), str(dest_file))
+
+            assert dest_file.stat().st_mtime == source_file.stat().st_mtime
+
+    def test_same_file_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 1024)
+            content = source_file.read_bytes()
+
+            with pytest.raises(shutil.SameFileError):
+                copy_file(str(source_file), str(source_file))
+            assert source_file.read_bytes() == content
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            copy_file("a", "b", "teleport")
+        with pytest.raises(ValueError):
+            DiskUploader(copy_strategy="teleport")
+
+    def test_disk_uploader_uses_selected_strategy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 64 * 1024)
+            dest_file = Path(tmpdir) / "uploaded" / "dest.bin"
+
+            uploader = DiskUploader(copy_strategy=copy_engine.BUFFERED, buffer_size=1024)
+
+            assert uploader.upload(str(source_file), str(dest_file))
+            assert dest_file.read_bytes() == source_file.read_bytes()
+
+    def test_disk_uploader_wraps_same_file_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = self._write_source(tmpdir, 16)
+
+            with pytest.raises(StorageOperationError):
+                DiskUploader().upload(str(source_file), str(source_file))
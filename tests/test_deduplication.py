@@ -0,0 +1,123 @@
+import os
+import tempfile
+from pathlib import Path
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.transfer.content_hash import CONTENT_HASH_METADATA_KEY, HashCache, hash_file
+
+
+class TestHashCache:
+    def test_unchanged_files_are_not_rehashed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(3 * 1024 * 1024 + 5))
+            cache = HashCache(chunk_size=64 * 1024)
+
+            first = cache.digest(str(source_file))
+            second = cache.digest(str(source_file))
+
+            assert first == second == hash_file(str(source_file))
+            assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_modified_files_are_rehashed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(b"first")
+            cache = HashCache()
+            first = cache.digest(str(source_file))
+
+            source_file.write_bytes(b"second")
+            os.utime(source_file, ns=(0, source_file.stat().st_mtime_ns + 1_000_000_000))
+
+            assert cache.digest(str(source_file)) != first
+            assert cache.misses == 2
+
+    def test_lru_bound(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HashCache(max_entries=2)
+            for i in range(3):
+                path = Path(tmpdir) / f"{i}.txt"
+                path.write_text(str(i))
+                cache.digest(str(path))
+
+            assert len(cache) == 2
+
+
+class TestServiceRunnerDedup:
+    def test_local_reupload_is_skipped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(4096))
+            dest_file = Path(tmpdir) / "uploaded" / "source.bin"
+            service = ServiceRunner(LocalDiskStorageFactory(), dedup=True, hash_cache=HashCache())
+
+            results = service.upload_many([(str(source_file), str(dest_file))])
+            assert not results[0].skipped
+            assert results[0].bytes_transferred == 4096
+
+            results = service.upload_many([(str(source_file), str(dest_file))])
+            assert results[0].skipped
+            assert results[0].bytes_saved == 4096
+            assert results[0].bytes_transferred == 0
+            assert service.bytes_saved == 4096
+
+    def test_changed_content_is_transferred(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("aaaa")
+            dest_file = Path(tmpdir) / "uploaded" / "source.txt"
+            service = ServiceRunner(LocalDiskStorageFactory(), dedup=True, hash_cache=HashCache())
+            service.upload_file(str(source_file), str(dest_file))
+
+            source_file.write_text("bbbb")
+            results = service.upload_many([(str(source_file), str(dest_file))])
+
+            assert not results[0].skipped
+            assert dest_file.read_text() == "bbbb"
+
+    def test_cloud_upload_records_hash_and_skips_repeat(self):
+        store = InMemoryObjectStore()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client), dedup=True,
+                                hash_cache=HashCache())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(2048))
+
+            service.upload_file(str(source_file), "s3://bucket/source.bin")
+            stored = store.client().head_object("bucket", "source.bin")
+            assert stored.metadata[CONTENT_HASH_METADATA_KEY] == hash_file(str(source_file))
+
+            requests_before = store.request_count
+            results = service.upload_many([(str(source_file), "s3://bucket/source.bin")])
+
+            assert results[0].skipped
+            assert results[0].bytes_saved == 2048
+            assert store.request_count == requests_before + 1
+
+    def test_download_skips_identical_local_copy(self):
+        store = InMemoryObjectStore()
+        payload = os.urandom(1000)
+        store.client().put_object("bucket", "blob.bin", payload)
+        service = ServiceRunner(GoogleStorageFactory(client_factory=store.client), dedup=True,
+                                hash_cache=HashCache())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest_file = Path(tmpdir) / "blob.bin"
+            first = service.download_many([("gs://bucket/blob.bin", str(dest_file))])
+            second = service.download_many([("gs://bucket/blob.bin", str(dest_file))])
+
+            assert not first[0].skipped
+            assert second[0].skipped
+            assert second[0].bytes_saved == 1000
+
+    def test_mock_provider_never_skips(self):
+        service = ServiceRunner(AmazonStorageFactory(), dedup=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("content")
+            results = service.upload_many([(str(source_file), "s3://bucket/source.txt")] * 2)
+
+        assert not any(result.skipped for result in results)
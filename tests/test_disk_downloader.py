@@ -16,7 +16,7 @@ class TestDiskDownloader:
             
             result = downloader.download(str(source_file), str(dest_file))
             
-            assert result is True
+            assert result
             assert dest_file.exists()
             assert dest_file.read_text() == "test content"
 
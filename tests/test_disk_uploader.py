@@ -16,7 +16,7 @@ class TestDiskUploader:
             
             result = uploader.upload(str(source_file), str(dest_file))
             
-            assert result is True
+            assert result
             assert dest_file.exists()
             assert dest_file.read_text() == "test content"
 
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from src.backends import InMemoryObjectStore, InMemoryObjectStoreClient
+from src.factories import AmazonStorageFactory, CachingStorageFactory, GoogleStorageFactory
+
+
+class CountingClient(InMemoryObjectStoreClient):
+    gets = 0
+    lock = threading.Lock()
+
+    def get_object(self, bucket, key, start=0, end=None):
+        with CountingClient.lock:
+            CountingClient.gets += 1
+        time.sleep(0.01)
+        return super().get_object(bucket, key, start, end)
+
+
+def _factory(store, cache_dir, **options):
+    CountingClient.gets = 0
+    return CachingStorageFactory(AmazonStorageFactory(client_factory=lambda: CountingClient(store)), cache_dir,
+                                 **options)
+
+
+class TestDownloadCache:
+    def test_second_download_is_served_from_cache(self):
+        store = InMemoryObjectStore()
+        payload = os.urandom(4096)
+        store.client().put_object("bucket", "hot.bin", payload)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = _factory(store, os.path.join(tmpdir, "cache"))
+            downloader = factory.create_downloader()
+
+            downloader.download("s3://bucket/hot.bin", os.path.join(tmpdir, "a.bin"))
+            downloader.download("s3://bucket/hot.bin", os.path.join(tmpdir, "b.bin"))
+
+            assert Path(tmpdir, "b.bin").read_bytes() == payload
+            assert CountingClient.gets == 1
+            cache = factory.cache
+            assert (cache.hits, cache.misses, cache.bytes_hit, cache.bytes_missed) == (1, 1, 4096, 4096)
+            factory.close()
+
+    def test_new_version_is_refetched(self):
+        store = InMemoryObjectStore()
+        store.client().put_object("bucket", "hot.txt", b"first")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = _factory(store, os.path.join(tmpdir, "cache"))
+            downloader = factory.create_downloader()
+            downloader.download("s3://bucket/hot.txt", os.path.join(tmpdir, "out.txt"))
+
+            store.client().put_object("bucket", "hot.txt", b"second")
+            downloader.download("s3://bucket/hot.txt", os.path.join(tmpdir, "out.txt"))
+
+            assert Path(tmpdir, "out.txt").read_text() == "second"
+            assert factory.cache.misses == 2
+            factory.close()
+
+    def test_lru_eviction_respects_size_bound(self):
+        store = InMemoryObjectStore()
+        for name in "abc":
+            store.client().put_object("bucket", f"{name}.bin", os.urandom(1000))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = _factory(store, os.path.join(tmpdir, "cache"), max_bytes=2500)
+            downloader = factory.create_downloader()
+            for name in "aba":
+                downloader.download(f"s3://bucket/{name}.bin", os.path.join(tmpdir, f"{name}.bin"))
+            downloader.download("s3://bucket/c.bin", os.path.join(tmpdir, "c.bin"))
+
+            assert factory.cache.evictions == 1
+            assert factory.cache.total_bytes == 2000
+            downloader.download("s3://bucket/a.bin", os.path.join(tmpdir, "a2.bin"))
+            downloader.download("s3://bucket/b.bin", os.path.join(tmpdir, "b2.bin"))
+            assert (factory.cache.hits, factory.cache.misses) == (2, 4)
+            factory.close()
+
+    def test_index_survives_restart(self):
+        store = InMemoryObjectStore()
+        store.client().put_object("bucket", "hot.bin", b"payload")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, "cache")
+            with _factory(store, cache_dir) as factory:
+                factory.create_downloader().download("s3://bucket/hot.bin", os.path.join(tmpdir, "a.bin"))
+
+            with _factory(store, cache_dir) as factory:
+                factory.create_downloader().download("s3://bucket/hot.bin", os.path.join(tmpdir, "b.bin"))
+
+                assert factory.cache.hits == 1
+                assert factory.cache.total_bytes == 7
+                assert CountingClient.gets == 0
+
+    def test_concurrent_misses_are_coalesced(self):
+        store = InMemoryObjectStore()
+        store.client().put_object("bucket", "hot.bin", os.urandom(2048))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = _factory(store, os.path.join(tmpdir, "cache"))
+            downloader = factory.create_downloader()
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(
+                    lambda i: downloader.download("s3://bucket/hot.bin", os.path.join(tmpdir, f"{i}.bin")),
+                    range(8)
+                ))
+
+            assert CountingClient.gets == 1
+            assert (factory.cache.hits, factory.cache.misses) == (7, 1)
+            factory.close()
+
+    def test_hardlink_mode_shares_the_cached_inode(self):
+        store = InMemoryObjectStore()
+        store.client().put_object("bucket", "hot.bin", b"payload")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = _factory(store, os.path.join(tmpdir, "cache"), hardlink=True)
+            destination = os.path.join(tmpdir, "out.bin")
+            factory.create_downloader().download("s3://bucket/hot.bin", destination)
+
+            assert os.stat(destination).st_nlink == 2
+            with factory.create_downloader().open_read("s3://bucket/hot.bin") as reader:
+                assert reader.read() == b"payload"
+            factory.close()
+
+    def test_mock_provider_bypasses_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            factory = CachingStorageFactory(GoogleStorageFactory(), os.path.join(tmpdir, "cache"))
+
+            assert factory.create_downloader().download("gs://bucket/file.txt", os.path.join(tmpdir, "out.txt"))
+            assert len(factory.cache) == 0
+            factory.close()
@@ -1,9 +1,23 @@
+from collections import namedtuple
+import io
+import tempfile
+from pathlib import Path
 import pytest
-from src.factories import AmazonStorageFactory, LocalDiskStorageFactory
+import src.factories.registry as registry_module
+from src.backends import InMemoryObjectStore
+from src.client import AsyncServiceRunner, ServiceRunner
+from src.exceptions import PermanentStorageError
+from src.interfaces import IFileDownloader, IFileUploader, IStorageFactory
+from src.factories import (AmazonStorageFactory, FactoryRegistry, GoogleStorageFactory, LocalDiskStorageFactory,
+                           create_factory, factory_class_for_scheme, get_factory_class)
 from src.products.amazon.s3_uploader import S3Uploader
 from src.products.amazon.s3_downloader import S3Downloader
 from src.products.local.disk_uploader import DiskUploader
 from src.products.local.disk_downloader import DiskDownloader
+from src.products.amazon.async_s3_uploader import AsyncS3Uploader
+from src.products.amazon.async_s3_downloader import AsyncS3Downloader
+from src.products.local.async_disk_uploader import AsyncDiskUploader
+from src.products.local.async_disk_downloader import AsyncDiskDownloader
 
 
 class TestAmazonStorageFactory:
@@ -19,6 +33,13 @@ class TestAmazonStorageFactory:
         
         assert isinstance(downloader, S3Downloader)
 
+    def test_create_async_products(self):
+        factory = AmazonStorageFactory(region="eu-west-1")
+
+        assert isinstance(factory.create_async_uploader(), AsyncS3Uploader)
+        assert isinstance(factory.create_async_downloader(), AsyncS3Downloader)
+        assert factory.create_async_uploader()._region == "eu-west-1"
+
     def test_create_uploader_with_credentials(self):
         factory = AmazonStorageFactory(
             aws_access_key="test_key",
@@ -32,6 +53,13 @@ class TestAmazonStorageFactory:
         assert uploader._aws_secret_key == "test_secret"
         assert uploader._region == "us-west-2"
 
+    def test_pooled_products_do_not_hold_credentials(self):
+        factory = AmazonStorageFactory(aws_access_key="test_key", aws_secret_key="test_secret",
+                                       client_factory=InMemoryObjectStore().client)
+
+        for product in (factory.create_uploader(), factory.create_async_downloader(), factory.create_inspector()):
+            assert (product._aws_access_key, product._aws_secret_key) == (None, None)
+
 
 class TestLocalDiskStorageFactory:
     def test_create_uploader(self):
@@ -46,3 +74,103 @@ class TestLocalDiskStorageFactory:
         
         assert isinstance(downloader, DiskDownloader)
 
+    def test_create_async_products(self):
+        factory = LocalDiskStorageFactory()
+
+        assert isinstance(factory.create_async_uploader(), AsyncDiskUploader)
+        assert isinstance(factory.create_async_downloader(), AsyncDiskDownloader)
+
+
+class UploadOnlyUploader(IFileUploader):
+    def upload(self, file_path, destination, metadata=None):
+        return DiskUploader().upload(file_path, destination, metadata)
+
+
+class DownloadOnlyDownloader(IFileDownloader):
+    def download(self, source, destination):
+        return DiskDownloader().download(source, destination)
+
+
+class MinimalStorageFactory(IStorageFactory):
+    def create_uploader(self):
+        return DiskUploader()
+
+    def create_downloader(self):
+        return DiskDownloader()
+
+
+class TestMinimalStorageFactory:
+    def test_optional_products_default_to_not_implemented(self):
+        factory = MinimalStorageFactory()
+
+        for create in (factory.create_async_uploader, factory.create_async_downloader, factory.create_inspector):
+            with pytest.raises(NotImplementedError):
+                create()
+        with pytest.raises(NotImplementedError):
+            AsyncServiceRunner(factory)
+
+    def test_optional_product_methods_default_to_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            UploadOnlyUploader().upload_stream(io.BytesIO(b"data"), "out.txt")
+        with pytest.raises(NotImplementedError):
+            UploadOnlyUploader().delete("out.txt")
+        with pytest.raises(NotImplementedError):
+            DownloadOnlyDownloader().open_read("in.txt")
+
+    def test_service_runner_works_without_an_inspector(self):
+        service = ServiceRunner(MinimalStorageFactory())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "a.txt"
+            source_file.write_text("a")
+
+            assert service.upload_file(str(source_file), f"{tmpdir}/out/a.txt")
+            with pytest.raises(PermanentStorageError, match="inspector"):
+                service.sync(tmpdir, f"{tmpdir}/mirror")
+        with pytest.raises(ValueError):
+            ServiceRunner(MinimalStorageFactory(), dedup=True)
+
+
+EntryPoint = namedtuple("EntryPoint", "name value")
+
+
+class PluginStorageFactory(LocalDiskStorageFactory):
+    schemes = ("azure",)
+
+
+class TestFactoryRegistry:
+    def test_builtin_providers_by_name_and_scheme(self):
+        assert get_factory_class("local") is LocalDiskStorageFactory
+        assert factory_class_for_scheme("S3") is AmazonStorageFactory
+        assert factory_class_for_scheme("gs") is GoogleStorageFactory
+        assert isinstance(create_factory("file"), LocalDiskStorageFactory)
+        assert isinstance(create_factory("s3", region="eu-west-1"), AmazonStorageFactory)
+        with pytest.raises(ValueError):
+            get_factory_class("ftp")
+
+    def test_registration_conflicts(self):
+        registry = FactoryRegistry()
+        registry.register("disk", LocalDiskStorageFactory, schemes=("file",))
+        with pytest.raises(ValueError):
+            registry.register("disk", LocalDiskStorageFactory)
+        with pytest.raises(ValueError):
+            registry.register("other", AmazonStorageFactory, schemes=("file",))
+        registry.register("other", AmazonStorageFactory, schemes=("file",), replace=True)
+        assert registry.for_scheme("file") is AmazonStorageFactory
+
+    def test_entry_point_plugins_are_discovered_on_a_miss(self, monkeypatch):
+        calls = []
+
+        def entry_points(group):
+            calls.append(group)
+            return [EntryPoint("azure", f"{__name__}:PluginStorageFactory")]
+
+        monkeypatch.setattr(registry_module, "_entry_points", entry_points)
+        registry = FactoryRegistry("test.factories")
+        registry.register("local", LocalDiskStorageFactory, schemes=("file",))
+        assert registry.for_scheme("file") is LocalDiskStorageFactory
+        assert calls == []
+
+        assert registry.for_scheme("azure") is PluginStorageFactory
+        assert isinstance(registry.create("azure"), PluginStorageFactory)
+        assert registry.names() == ["azure", "local"]
+        assert calls == ["test.factories"]
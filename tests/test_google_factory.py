@@ -1,7 +1,10 @@
 import pytest
+from src.backends import InMemoryObjectStore
 from src.factories import GoogleStorageFactory
 from src.products.google.gcs_uploader import GCSUploader
 from src.products.google.gcs_downloader import GCSDownloader
+from src.products.google.async_gcs_uploader import AsyncGCSUploader
+from src.products.google.async_gcs_downloader import AsyncGCSDownloader
 
 
 class TestGoogleStorageFactory:
@@ -17,6 +20,13 @@ class TestGoogleStorageFactory:
         
         assert isinstance(downloader, GCSDownloader)
 
+    def test_create_async_products(self):
+        factory = GoogleStorageFactory(project_id="test-project")
+
+        assert isinstance(factory.create_async_uploader(), AsyncGCSUploader)
+        assert isinstance(factory.create_async_downloader(), AsyncGCSDownloader)
+        assert factory.create_async_downloader()._project_id == "test-project"
+
     def test_create_uploader_with_credentials(self):
         factory = GoogleStorageFactory(
             project_id="test-project",
@@ -28,3 +38,10 @@ class TestGoogleStorageFactory:
         assert uploader._project_id == "test-project"
         assert uploader._credentials_path == "/path/to/credentials.json"
 
+    def test_pooled_products_do_not_hold_credentials(self):
+        factory = GoogleStorageFactory(project_id="test-project", credentials_path="/path/to/credentials.json",
+                                       client_factory=InMemoryObjectStore().client)
+
+        for product in (factory.create_uploader(), factory.create_async_downloader(), factory.create_inspector()):
+            assert (product._project_id, product._credentials_path) == (None, None)
+
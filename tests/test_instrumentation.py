@@ -0,0 +1,100 @@
+import asyncio
+import os
+import tempfile
+import pytest
+from pathlib import Path
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.exceptions import FileNotFoundError
+from src.factories import AmazonStorageFactory, CompressingStorageFactory, LocalDiskStorageFactory
+from src.instrumentation import InMemoryMetricsSink, active_sinks, clear_sinks, record_retry, register_sink
+
+
+@pytest.fixture
+def sink():
+    registered = register_sink(InMemoryMetricsSink())
+    yield registered
+    clear_sinks()
+
+
+class TestInstrumentation:
+    def test_products_record_counters_histograms_and_spans(self, sink):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.bin"
+            source_file.write_bytes(os.urandom(5000))
+            uploader = LocalDiskStorageFactory().create_uploader()
+
+            uploader.upload(str(source_file), str(Path(tmpdir) / "copy.bin"))
+
+            labels = {"provider": "local", "operation": "upload"}
+            assert sink.counter("storage_operations_total", outcome="success", **labels) == 1
+            assert sink.counter("storage_bytes_total", **labels) == 5000
+            assert sink.histogram("storage_operation_duration_seconds", **labels).count == 1
+            assert sink.histogram("storage_transfer_size_bytes", **labels).sum == 5000
+            span = sink.spans[-1]
+            assert (span.provider, span.operation, span.target) == ("local", "upload", str(Path(tmpdir) / "copy.bin"))
+            assert span.end_ns >= span.start_ns and span.error is None
+
+    def test_errors_are_counted_by_type(self, sink):
+        with pytest.raises(FileNotFoundError):
+            LocalDiskStorageFactory().create_downloader().download("/nonexistent/source.txt", "/tmp/out.txt")
+
+        assert sink.counter("storage_operation_errors_total", provider="local", operation="download",
+                            error="FileNotFoundError") == 1
+        assert sink.counter("storage_operations_total", outcome="error") == 1
+        assert isinstance(sink.spans[-1].error, FileNotFoundError)
+
+    def test_service_runner_and_cloud_spans(self, sink):
+        store = InMemoryObjectStore()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("payload")
+            service.upload_many([(str(source_file), "s3://bucket/a.txt"), (str(source_file), "s3://bucket/b.txt")])
+
+        assert sink.counter("storage_operations_total", provider="s3", operation="upload") == 2
+        assert sink.counter("storage_operations_total", provider="service_runner", operation="upload_many") == 1
+
+    def test_bytes_come_from_the_transfer_result(self, sink):
+        store = InMemoryObjectStore()
+        uploader = CompressingStorageFactory(AmazonStorageFactory(client_factory=store.client)).create_uploader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_bytes(b"a" * 100_000)
+            result = uploader.upload(str(source_file), "s3://bucket/a.txt")
+
+        assert 0 < result.bytes_transferred < 100_000
+        assert sink.counter("storage_bytes_total", provider="compression", operation="upload") == \
+            result.bytes_transferred
+
+    def test_async_products_are_instrumented(self, sink):
+        with tempfile.NamedTemporaryFile() as source_file:
+            uploader = AmazonStorageFactory().create_async_uploader()
+            asyncio.run(uploader.upload(source_file.name, "s3://bucket/file.txt"))
+
+        assert sink.counter("storage_operations_total", provider="s3", operation="upload") == 1
+
+    def test_prometheus_text_exposition(self, sink):
+        record_retry("s3", "upload")
+        sink.observe("storage_operation_duration_seconds", 0.02, {"provider": "s3", "operation": "upload"})
+
+        text = sink.prometheus_text()
+
+        assert '# TYPE storage_operation_retries_total counter' in text
+        assert 'storage_operation_retries_total{operation="upload",provider="s3"} 1' in text
+        assert 'storage_operation_duration_seconds_bucket{operation="upload",provider="s3",le="0.01"} 0' in text
+        assert 'storage_operation_duration_seconds_bucket{operation="upload",provider="s3",le="0.025"} 1' in text
+        assert 'storage_operation_duration_seconds_bucket{operation="upload",provider="s3",le="+Inf"} 1' in text
+        assert 'storage_operation_duration_seconds_count{operation="upload",provider="s3"} 1' in text
+
+    def test_no_sink_means_no_recording(self):
+        assert active_sinks() == ()
+        sink = InMemoryMetricsSink()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("payload")
+            LocalDiskStorageFactory().create_uploader().upload(str(source_file), str(Path(tmpdir) / "copy.txt"))
+
+        assert sink.prometheus_text() == ""
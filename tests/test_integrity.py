@@ -0,0 +1,121 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.backends.in_memory_object_store import InMemoryObjectStoreClient
+from src.exceptions import IntegrityError, TransientStorageError
+from src.factories import (
+    AmazonStorageFactory,
+    GoogleStorageFactory,
+    LocalDiskStorageFactory,
+    VerifyingStorageFactory
+)
+import src.integrity.checksums as checksums_module
+from src.integrity import Checksums, crc32c
+
+
+class _CorruptingClient(InMemoryObjectStoreClient):
+    def get_object(self, bucket, key, start=0, end=None):
+        data = super().get_object(bucket, key, start, end)
+        return data[:-1] + bytes([data[-1] ^ 0xFF]) if data else data
+
+
+def _write(directory, name, content):
+    path = Path(directory) / name
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestChecksums:
+    def test_crc32c_known_vector(self):
+        assert crc32c(b"123456789") == 0xE3069283
+        assert crc32c(b"56789", crc32c(b"1234")) == 0xE3069283
+
+    def test_pure_python_crc32c_warns_once(self, monkeypatch):
+        warnings = []
+
+        class _Logger:
+            def warning(self, message, *args):
+                warnings.append(message)
+
+        monkeypatch.setattr(checksums_module, "google_crc32c", None)
+        monkeypatch.setattr(checksums_module, "_crc32c_fallback_warned", False)
+        monkeypatch.setattr(checksums_module, "get_logger", lambda name: _Logger())
+        Checksums(("sha256",))
+        Checksums(("crc32c",))
+        Checksums(("md5", "crc32c"))
+
+        assert len(warnings) == 1 and "google-crc32c" in warnings[0]
+
+    def test_multipart_etag_matches_store(self):
+        store = InMemoryObjectStore()
+        client = store.client()
+        upload = client.create_multipart_upload("bucket", "key")
+        parts = [(1, client.upload_part("bucket", "key", upload, 1, b"a" * 10)),
+                 (2, client.upload_part("bucket", "key", upload, 2, b"b" * 3))]
+        etag = client.complete_multipart_upload("bucket", "key", upload, parts)
+
+        checksums = Checksums(part_size=10)
+        checksums.update(b"a" * 7)
+        checksums.update(b"a" * 3 + b"b" * 3)
+        assert checksums.multipart_etag() == etag
+
+
+class TestVerifyingStorageFactory:
+    @pytest.mark.parametrize("part_size", [None, 1024])
+    def test_upload_and_download_are_verified_against_etag(self, part_size):
+        store = InMemoryObjectStore()
+        factory = VerifyingStorageFactory(AmazonStorageFactory(client_factory=store.client, part_size=part_size),
+                                          algorithms=("sha256", "crc32c"))
+        payload = os.urandom(5000)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "data.bin", payload)
+            result = factory.create_uploader().upload_verified(source, "s3://bucket/data.bin")
+
+            assert result.verified
+            assert result.size == len(payload)
+            assert result.checksums["sha256"] == hashlib.sha256(payload).hexdigest()
+            assert result.checksums["crc32c"] == f"{crc32c(payload):08x}"
+            assert result.provider_checksum == store.client().head_object("bucket", "data.bin").etag
+
+            destination = os.path.join(tmpdir, "restored.bin")
+            downloaded = factory.create_downloader().download_verified("s3://bucket/data.bin", destination)
+            assert downloaded.verified
+            assert Path(destination).read_bytes() == payload
+
+    def test_compose_uploads_are_verified(self):
+        store = InMemoryObjectStore()
+        factory = VerifyingStorageFactory(GoogleStorageFactory(client_factory=store.client, part_size=1024))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "data.bin", os.urandom(4000))
+            assert factory.create_uploader().upload_verified(source, "gs://bucket/data.bin").verified
+
+    def test_corruption_raises_integrity_error(self):
+        store = InMemoryObjectStore()
+        factory = VerifyingStorageFactory(AmazonStorageFactory(client_factory=lambda: _CorruptingClient(store)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "data.bin", b"important bytes")
+            factory.create_uploader().upload(source, "s3://bucket/data.bin")
+
+            destination = os.path.join(tmpdir, "restored.bin")
+            with pytest.raises(IntegrityError) as raised:
+                factory.create_downloader().download("s3://bucket/data.bin", destination)
+            assert isinstance(raised.value, TransientStorageError)
+            assert raised.value.expected == hashlib.md5(b"important bytes").hexdigest()
+            assert not os.path.exists(destination)
+
+    def test_local_disk_reports_checksums_without_provider_verification(self):
+        factory = VerifyingStorageFactory(LocalDiskStorageFactory(), algorithms=("sha256",))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "a.txt", b"hello")
+            result = factory.create_uploader().upload_verified(source, os.path.join(tmpdir, "copy.txt"))
+
+            assert not result.verified
+            assert result.checksums["sha256"] == hashlib.sha256(b"hello").hexdigest()
+            assert Path(tmpdir, "copy.txt").read_bytes() == b"hello"
+
+    def test_unsupported_algorithm_is_rejected(self):
+        with pytest.raises(ValueError):
+            VerifyingStorageFactory(LocalDiskStorageFactory(), algorithms=("sha1",))
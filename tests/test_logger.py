@@ -0,0 +1,101 @@
+import io
+import json
+import logging
+import queue
+import pytest
+from src.utils.logger import configure_logging, get_logger, shutdown_logging
+
+
+@pytest.fixture
+def stream():
+    output = io.StringIO()
+    yield output
+    configure_logging()
+
+
+class TestLogger:
+    def test_synchronous_mode_formats_lazily(self, stream):
+        configure_logging(stream=stream, asynchronous=False)
+        logger = get_logger("LoggerTestSync")
+
+        logger.info("Uploaded %s bytes to %s", 42, "s3://bucket/key")
+        logger.debug("Not emitted %s", object())
+
+        assert stream.getvalue().endswith("LoggerTestSync - INFO - Uploaded 42 bytes to s3://bucket/key\n")
+        assert "Not emitted" not in stream.getvalue()
+
+    def test_asynchronous_mode_flushes_on_shutdown(self, stream):
+        configure_logging(stream=stream)
+        logger = get_logger("LoggerTestAsync")
+
+        for i in range(100):
+            logger.info("message %d", i)
+        shutdown_logging()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 100
+        assert lines[-1].endswith("message 99")
+
+    def test_repeated_warnings_are_rate_limited(self, stream):
+        configure_logging(stream=stream, asynchronous=False, warning_interval=3600)
+        logger = get_logger("LoggerTestRateLimit")
+
+        for _ in range(50):
+            logger.warning("S3Uploader is a mock implementation.")
+        logger.warning("A different warning for %s", "x")
+        logger.error("Errors are never limited")
+        logger.error("Errors are never limited")
+
+        output = stream.getvalue()
+        assert output.count("mock implementation") == 1
+        assert "A different warning for x" in output
+        assert output.count("Errors are never limited") == 2
+
+    def test_json_formatter(self, stream):
+        configure_logging(stream=stream, asynchronous=False, json_format=True)
+        logger = get_logger("LoggerTestJson")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed to upload %s", "a.txt")
+
+        record = json.loads(stream.getvalue())
+        assert record["logger"] == "LoggerTestJson"
+        assert record["level"] == "ERROR"
+        assert record["message"] == "Failed to upload a.txt"
+        assert "ValueError: boom" in record["exception"]
+
+    def test_reconfigure_applies_to_existing_loggers(self, stream):
+        logger = get_logger("LoggerTestReconfigure")
+
+        configure_logging(level=logging.WARNING, stream=stream, asynchronous=False)
+        logger.info("hidden")
+        logger.warning("shown")
+
+        assert logger.level == logging.WARNING
+        assert "hidden" not in stream.getvalue()
+        assert "shown" in stream.getvalue()
+
+    def test_full_queue_drops_chatter_but_keeps_errors(self, stream):
+        configure_logging(stream=stream, queue_size=1)
+        logger = get_logger("LoggerTestDrop")
+        handler = logger.handlers[0]
+        handler.queue = queue.Queue(1)
+        handler.queue.put_nowait(None)
+
+        for i in range(10):
+            logger.info("message %d", i)
+        logger.error("disk full")
+
+        assert handler.dropped == 10
+        assert stream.getvalue().endswith("LoggerTestDrop - ERROR - disk full\n")
+
+    def test_records_after_shutdown_are_written_directly(self, stream):
+        configure_logging(stream=stream)
+        logger = get_logger("LoggerTestAfterShutdown")
+        shutdown_logging()
+
+        logger.info("late message")
+
+        assert stream.getvalue().endswith("late message\n")
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.exceptions import FileNotFoundError, PermanentStorageError
+from src.factories import AmazonStorageFactory, LocalDiskStorageFactory
+from src.packing import PackIndex, PackIndexBuilder, open_pack, split_member_uri
+from src.products.local.disk_downloader import DiskDownloader
+
+
+def _small_files(directory, count):
+    paths = []
+    for i in range(count):
+        path = Path(directory) / f"file-{i}.txt"
+        path.write_bytes(f"contents of file {i}\n".encode() * (i % 7 + 1))
+        paths.append(str(path))
+    return paths
+
+
+class TestPackIndex:
+    def test_round_trip_and_lookup(self):
+        builder = PackIndexBuilder()
+        for i in range(1000):
+            builder.add(f"dir/{i}.json", i)
+        index = PackIndex.from_bytes(builder.build().to_bytes())
+
+        assert len(index) == 1000
+        assert index.lookup("dir/10.json") == (sum(range(10)), 10)
+        assert "dir/999.json" in index
+        assert index.lookup("dir/1000.json") is None
+        assert list(index.names())[:2] == ["dir/0.json", "dir/1.json"]
+
+    def test_duplicate_members_are_rejected(self):
+        builder = PackIndexBuilder()
+        builder.add("a", 1)
+        builder.add("a", 2)
+        with pytest.raises(ValueError):
+            builder.build()
+
+
+class TestPackedTransfers:
+    def test_upload_packed_uses_one_object_per_pack(self):
+        store = InMemoryObjectStore()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = _small_files(tmpdir, 200)
+            results = service.upload_packed([(path, os.path.basename(path)) for path in files], "s3://bucket/packs",
+                                            max_members=100)
+
+            assert all(result.success for result in results)
+            assert len(store.keys("bucket")) == 2
+            assert sum(result.bytes_transferred for result in results) == sum(os.path.getsize(p) for p in files)
+
+            out = os.path.join(tmpdir, "out")
+            pairs = [(result.destination, os.path.join(out, split_member_uri(result.destination)[1]))
+                     for result in results[::17]]
+            downloads = service.download_packed(pairs)
+
+            assert all(result.success for result in downloads)
+            for source, destination in pairs:
+                original = os.path.join(tmpdir, split_member_uri(source)[1])
+                assert Path(destination).read_bytes() == Path(original).read_bytes()
+
+    def test_local_packs_are_memory_mapped(self):
+        service = ServiceRunner(LocalDiskStorageFactory())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = _small_files(tmpdir, 10)
+            results = service.upload_packed([(path, f"logs/{i}") for i, path in enumerate(files)],
+                                            os.path.join(tmpdir, "packs"))
+            pack, _ = split_member_uri(results[0].destination)
+
+            with open_pack(DiskDownloader(), pack) as reader:
+                assert reader.memory_mapped
+                assert reader.read("logs/3") == Path(files[3]).read_bytes()
+                with pytest.raises(FileNotFoundError):
+                    reader.read("logs/99")
+
+    def test_missing_sources_and_corrupt_packs_are_reported(self):
+        service = ServiceRunner(LocalDiskStorageFactory())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = service.upload_packed([(os.path.join(tmpdir, "missing"), "missing")], tmpdir)
+            assert not results[0].success
+            assert isinstance(results[0].error, FileNotFoundError)
+
+            bogus = os.path.join(tmpdir, "bogus.pack")
+            Path(bogus).write_bytes(b"not a pack at all, just some bytes")
+            downloads = service.download_packed([(f"{bogus}#member", os.path.join(tmpdir, "out"))])
+            assert isinstance(downloads[0].error, PermanentStorageError)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.exceptions import FileNotFoundError, InvalidPathError
+from src.factories import (
+    AmazonStorageFactory,
+    GoogleStorageFactory,
+    LocalDiskStorageFactory,
+    SchemeRoutingStorageFactory
+)
+from src.utils import StorageURI, parse_uri, require_file, split_bucket_key
+
+
+class TestStorageURI:
+    def test_parse_cloud_and_local_uris(self):
+        assert parse_uri("s3://bucket/a/b.txt") == StorageURI("s3", "bucket", "a/b.txt")
+        assert parse_uri("gs://bucket") == StorageURI("gs", "bucket", "")
+        local = parse_uri("file:///tmp/data.csv")
+        assert local.is_local and str(local) == "/tmp/data.csv"
+        assert parse_uri("relative/path.txt").is_local
+        with pytest.raises(InvalidPathError):
+            parse_uri("://bucket/key")
+
+    def test_parsing_is_cached_and_immutable(self):
+        uri = "s3://cached-bucket/key"
+        assert parse_uri(uri) is parse_uri(uri)
+        with pytest.raises(AttributeError):
+            parse_uri(uri).key = "other"
+
+    def test_split_bucket_key_validates_scheme_and_key(self):
+        assert split_bucket_key("gs://bucket/key", "gs") == ("bucket", "key")
+        with pytest.raises(InvalidPathError):
+            split_bucket_key("gs://bucket/key", "s3")
+        with pytest.raises(InvalidPathError):
+            split_bucket_key("s3://bucket/", "s3")
+
+    def test_require_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.txt"
+            path.write_text("abc")
+            assert require_file(str(path)).st_size == 3
+            with pytest.raises(InvalidPathError):
+                require_file(tmpdir)
+            with pytest.raises(FileNotFoundError):
+                require_file(str(path / "nested"))
+
+
+class TestSchemeRouting:
+    def test_one_runner_dispatches_by_scheme(self):
+        s3, gcs = InMemoryObjectStore(), InMemoryObjectStore()
+        factory = SchemeRoutingStorageFactory({
+            "s3": AmazonStorageFactory(client_factory=s3.client),
+            "gs": GoogleStorageFactory(client_factory=gcs.client),
+            "file": LocalDiskStorageFactory(),
+        })
+        service = ServiceRunner(factory)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "report.csv"
+            source.write_text("a,b,c")
+            local_copy = os.path.join(tmpdir, "copy", "report.csv")
+
+            results = service.upload_many([(str(source), "s3://bucket/report.csv"),
+                                           (str(source), "gs://bucket/report.csv"),
+                                           (str(source), f"file://{local_copy}")])
+
+            assert all(result.success for result in results)
+            assert s3.client().get_object("bucket", "report.csv") == b"a,b,c"
+            assert gcs.client().get_object("bucket", "report.csv") == b"a,b,c"
+            assert Path(local_copy).read_text() == "a,b,c"
+            assert factory.create_inspector().stat("gs://bucket/report.csv").size == 5
+
+    def test_unknown_scheme_is_rejected(self):
+        service = ServiceRunner(SchemeRoutingStorageFactory({"file": LocalDiskStorageFactory()}))
+        with pytest.raises(InvalidPathError):
+            service.download_file("s3://bucket/key", "out.txt")
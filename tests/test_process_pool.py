@@ -0,0 +1,107 @@
+import hashlib
+import io
+import pickle
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.exceptions import FileNotFoundError, IntegrityError, ThrottledError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.transfer.concurrency import AdaptiveConcurrencyLimiter
+from src.transfer.content_hash import HashCache
+
+
+class TestPicklableFactories:
+    def test_env_credentials_are_resolved_in_each_process(self, monkeypatch):
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "parent-key")
+        monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "parent-project")
+        amazon = AmazonStorageFactory(client_factory=io.BytesIO, region="eu-west-1")
+        payload = pickle.dumps(amazon)
+        assert b"parent-key" not in payload
+
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "worker-key")
+        restored = pickle.loads(payload)
+        assert restored._aws_access_key == "worker-key"
+        assert restored._region == "eu-west-1"
+        assert restored._pool is not amazon._pool and restored._pool.size == 0
+        assert pickle.loads(pickle.dumps(GoogleStorageFactory()))._project_id == "parent-project"
+
+    def test_storage_errors_keep_their_details(self):
+        throttled = pickle.loads(pickle.dumps(ThrottledError("slow down", 2.5)))
+        assert (str(throttled), throttled.retry_after) == ("slow down", 2.5)
+        mismatch = pickle.loads(pickle.dumps(IntegrityError("bad", "a", "b")))
+        assert (mismatch.expected, mismatch.actual) == ("a", "b")
+
+
+class TestProcessTransferPool:
+    @pytest.fixture
+    def service(self):
+        runner = ServiceRunner(LocalDiskStorageFactory(), max_workers=2, dedup=True, processes=2,
+                               process_chunk_size=3)
+        yield runner
+        runner.close()
+
+    def test_batches_are_spread_over_worker_processes(self, service):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = []
+            for index in range(10):
+                source_file = Path(tmpdir) / "in" / f"{index}.txt"
+                source_file.parent.mkdir(exist_ok=True)
+                source_file.write_text(f"file {index}")
+                pairs.append((str(source_file), f"{tmpdir}/out/{index}.txt"))
+            pairs.append((f"{tmpdir}/missing.txt", f"{tmpdir}/out/missing.txt"))
+
+            results = service.upload_many(pairs)
+
+            assert [result.source for result in results] == [source for source, _ in pairs]
+            assert all(result.success for result in results[:-1])
+            assert isinstance(results[-1].error, FileNotFoundError)
+            assert (Path(tmpdir) / "out" / "9.txt").read_text() == "file 9"
+
+            again = service.upload_many(pairs[:4])
+            assert all(result.skipped for result in again)
+            assert service.bytes_saved == sum(result.bytes_saved for result in again) > 0
+
+    def test_in_flight_chunks_are_capped_at_the_process_count(self, service):
+        pool = service.process_pool
+        submit = pool._executor.submit
+        submitted = []
+        in_flight = []
+
+        def counting_submit(*args):
+            in_flight.append(sum(not future.done() for future in submitted))
+            future = submit(*args)
+            submitted.append(future)
+            return future
+
+        pool._executor.submit = counting_submit
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = ((f"{tmpdir}/missing-{index}.txt", f"{tmpdir}/out/{index}.txt") for index in range(20))
+            results = service.upload_many(pairs, max_workers=1)
+
+        assert len(results) == 20 and not any(result.success for result in results)
+        assert len(in_flight) == 7
+        assert max(in_flight) < pool.processes
+
+    def test_per_process_state_is_rejected(self):
+        with pytest.raises(ValueError):
+            ServiceRunner(LocalDiskStorageFactory(), processes=2, hash_cache=HashCache())
+        with pytest.raises(ValueError):
+            ServiceRunner(LocalDiskStorageFactory(), processes=2, limiter=AdaptiveConcurrencyLimiter())
+
+    def test_parallel_etag_matches_the_object_store(self, service):
+        store = InMemoryObjectStore()
+        factory = AmazonStorageFactory(client_factory=store.client, part_size=64 * 1024)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "large.bin"
+            source_file.write_bytes(bytes(range(256)) * 1500)
+            small_file = Path(tmpdir) / "small.bin"
+            small_file.write_bytes(b"small")
+            ServiceRunner(factory).upload_file(str(source_file), "s3://bucket/large.bin")
+
+            etag = service.process_pool.etag(str(source_file), part_size=64 * 1024)
+
+            assert etag == store.client().head_object("bucket", "large.bin").etag
+            assert etag.endswith("-6")
+            assert service.process_pool.etag(str(small_file)) == hashlib.md5(b"small").hexdigest()
@@ -0,0 +1,133 @@
+import asyncio
+import io
+import tempfile
+import time
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.factories import AmazonStorageFactory, LocalDiskStorageFactory, RateLimitedStorageFactory
+from src.instrumentation import InMemoryMetricsSink, clear_sinks, register_sink
+from src.throttling import RATE_LIMIT_WAIT_METRIC, RateLimiter, TokenBucket, global_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def sink():
+    registered = register_sink(InMemoryMetricsSink())
+    yield registered
+    clear_sinks()
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(100, burst=10, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire(10) == 0.0
+        assert bucket.acquire(5) == pytest.approx(0.05)
+        assert bucket.acquire(50) == pytest.approx(0.5)
+        clock.now += 10
+        assert bucket.acquire(10) == 0.0
+        assert bucket.waited == pytest.approx(0.55)
+
+    def test_reservations_queue_behind_each_other(self):
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=1, clock=clock, sleep=clock.sleep)
+        delays = [bucket.reserve() for _ in range(4)]
+        assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+    def test_rate_is_adjustable_at_runtime(self):
+        clock = FakeClock()
+        bucket = TokenBucket(None, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire(1_000_000) == 0.0
+        bucket.set_rate(1000, burst=100)
+        assert bucket.acquire(100) == 0.0
+        assert bucket.acquire(100) == pytest.approx(0.1)
+        bucket.set_rate(None)
+        assert bucket.acquire(1_000_000) == 0.0
+        with pytest.raises(ValueError):
+            bucket.set_rate(0)
+
+
+class TestRateLimitedStorage:
+    def test_bytes_limit_shapes_uploads_and_downloads(self, sink):
+        limiter = RateLimiter(bytes_per_second=400_000, burst_bytes=20_000, name="disk")
+        service = ServiceRunner(RateLimitedStorageFactory(LocalDiskStorageFactory(), limiter))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "data.bin"
+            source_file.write_bytes(b"r" * 60_000)
+            started = time.monotonic()
+            result = service.upload_file(str(source_file), f"{tmpdir}/out/data.bin")
+            service.download_file(f"{tmpdir}/out/data.bin", f"{tmpdir}/back/data.bin")
+            elapsed = time.monotonic() - started
+
+            assert result.bytes_transferred == 60_000
+            assert (Path(tmpdir) / "back" / "data.bin").read_bytes() == source_file.read_bytes()
+        assert elapsed >= 0.2
+        assert limiter.bytes_wait_seconds >= 0.2
+        assert sink.counter(RATE_LIMIT_WAIT_METRIC, limiter="disk", kind="bytes") == pytest.approx(
+            limiter.bytes_wait_seconds)
+
+    def test_ops_limit_applies_per_provider_and_globally(self):
+        store = InMemoryObjectStore()
+        provider = RateLimiter(ops_per_second=100, burst_ops=1, name="s3")
+        shared = RateLimiter(name="shared")
+        factory = RateLimitedStorageFactory(AmazonStorageFactory(client_factory=store.client), provider, shared)
+        uploader = factory.create_uploader()
+        for index in range(4):
+            uploader.upload_stream(io.BytesIO(b"x"), f"s3://bucket/{index}.bin")
+        assert provider.ops_wait_seconds >= 0.02
+        assert shared.wait_seconds == 0.0
+        assert factory.limiters == (provider, shared)
+        assert global_rate_limiter() is global_rate_limiter()
+
+    def test_async_products_reserve_capacity(self):
+        limiter = RateLimiter(bytes_per_second=1_000_000, burst_bytes=1000)
+        factory = RateLimitedStorageFactory(LocalDiskStorageFactory(), limiter)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "data.bin"
+            source_file.write_bytes(b"a" * 21_000)
+            uploader = factory.create_async_uploader()
+            result = asyncio.run(uploader.upload(str(source_file), f"{tmpdir}/out.bin"))
+            assert result.bytes_transferred == 21_000
+        assert limiter.bytes_wait_seconds == pytest.approx(0.02, abs=0.005)
+
+    def test_async_byte_limits_shape_each_chunk(self):
+        limiter = RateLimiter(bytes_per_second=200_000, burst_bytes=5_000)
+        factory = RateLimitedStorageFactory(LocalDiskStorageFactory(), limiter)
+        ticks = []
+
+        async def ticker(done):
+            while not done.is_set():
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def transfer(tmpdir):
+            done = asyncio.Event()
+            ticking = asyncio.ensure_future(ticker(done))
+            uploaded = await factory.create_async_uploader().upload(f"{tmpdir}/data.bin", f"{tmpdir}/out.bin")
+            downloaded = await factory.create_async_downloader().download(f"{tmpdir}/out.bin", f"{tmpdir}/back.bin")
+            done.set()
+            await ticking
+            return uploaded, downloaded
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "data.bin").write_bytes(b"c" * 25_000)
+            uploaded, downloaded = asyncio.run(transfer(tmpdir))
+            assert Path(tmpdir, "back.bin").read_bytes() == b"c" * 25_000
+
+        assert (uploaded.bytes_transferred, downloaded.strategy) == (25_000, "throttled")
+        assert limiter.bytes_wait_seconds >= 0.2
+        assert len(ticks) >= 10
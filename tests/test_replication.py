@@ -0,0 +1,124 @@
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.backends.in_memory_object_store import InMemoryObjectStoreClient
+from src.client import ReplicatingServiceRunner
+from src.exceptions import FileNotFoundError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.transfer import tee as tee_module
+from src.transfer.tee import tee_file
+
+
+class _UnavailableClient(InMemoryObjectStoreClient):
+    def put_object(self, bucket, key, data, metadata=None):
+        raise ConnectionError("replica unavailable")
+
+    def create_multipart_upload(self, bucket, key, metadata=None):
+        raise ConnectionError("replica unavailable")
+
+
+def _write(directory, name, content):
+    path = Path(directory) / name
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestTee:
+    def test_source_is_read_once_for_every_consumer(self, monkeypatch):
+        opened = []
+
+        def counting_open(*args, **kwargs):
+            opened.append(args[0])
+            return open(*args, **kwargs)
+
+        monkeypatch.setattr(tee_module, "open", counting_open, raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            payload = os.urandom(10000)
+            source = _write(tmpdir, "data.bin", payload)
+            size, outcomes = tee_file(source, [lambda readable: readable.read()] * 3, chunk_size=1024, depth=1)
+
+        assert size == len(payload)
+        assert opened == [source]
+        assert [outcome.result for outcome in outcomes] == [payload] * 3
+
+    def test_failed_consumer_does_not_stall_the_others(self):
+        def failing(readable):
+            readable.read(10)
+            raise ValueError("boom")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "data.bin", os.urandom(50000))
+            _, outcomes = tee_file(source, [failing, lambda readable: len(readable.read())], chunk_size=512, depth=1)
+
+        assert isinstance(outcomes[0].error, ValueError)
+        assert outcomes[1].result == 50000
+
+
+class TestReplicatingServiceRunner:
+    def test_replicates_to_every_provider(self):
+        s3, gcs = InMemoryObjectStore(), InMemoryObjectStore()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "report.csv", b"a,b,c")
+            runner = ReplicatingServiceRunner([
+                AmazonStorageFactory(client_factory=s3.client),
+                GoogleStorageFactory(client_factory=gcs.client),
+                LocalDiskStorageFactory(),
+            ])
+            local_copy = os.path.join(tmpdir, "replica", "report.csv")
+            result = runner.upload_file(source, ["s3://bucket/report.csv", "gs://bucket/report.csv", local_copy])
+
+            assert result
+            assert result.succeeded == 3
+            assert [replica.bytes_transferred for replica in result.replicas] == [5, 5, 5]
+            assert s3.client().get_object("bucket", "report.csv") == b"a,b,c"
+            assert gcs.client().get_object("bucket", "report.csv") == b"a,b,c"
+            assert Path(local_copy).read_bytes() == b"a,b,c"
+
+    @pytest.mark.parametrize("policy, expected", [("all", False), ("quorum", True), ("best_effort", True)])
+    def test_write_policy_decides_success(self, policy, expected):
+        healthy, broken = InMemoryObjectStore(), InMemoryObjectStore()
+        factories = [
+            AmazonStorageFactory(client_factory=healthy.client),
+            AmazonStorageFactory(client_factory=healthy.client),
+            AmazonStorageFactory(client_factory=lambda: _UnavailableClient(broken)),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "report.csv", b"a,b,c")
+            result = ReplicatingServiceRunner(factories, policy=policy).upload_file(
+                source, ["s3://one/report.csv", "s3://two/report.csv", "s3://three/report.csv"])
+
+        assert result.success is expected
+        assert [replica.destination for replica in result.failed] == ["s3://three/report.csv"]
+        assert result.repairs_queued == 0
+
+    def test_failed_replicas_are_repaired_in_the_background(self):
+        store, attempts = InMemoryObjectStore(), []
+
+        def flaky():
+            attempts.append(1)
+            return _UnavailableClient(store) if len(attempts) == 1 else store.client()
+
+        factories = [AmazonStorageFactory(client_factory=store.client), AmazonStorageFactory(client_factory=flaky)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = _write(tmpdir, "report.csv", b"a,b,c")
+            runner = ReplicatingServiceRunner(factories, policy="best_effort",
+                                              repair_dir=os.path.join(tmpdir, "repairs"))
+            result = runner.upload_file(source, ["s3://primary/report.csv", "s3://mirror/report.csv"])
+
+            assert result.success
+            assert result.repairs_queued == 1
+            assert runner.flush(timeout=10)
+            assert runner.repairs_pending == 0
+            assert store.client().get_object("mirror", "report.csv") == b"a,b,c"
+            runner.close()
+
+    def test_validates_destinations_and_source(self):
+        runner = ReplicatingServiceRunner([LocalDiskStorageFactory(), LocalDiskStorageFactory()])
+        with pytest.raises(ValueError):
+            runner.upload_file("missing.txt", ["/tmp/a"])
+        with pytest.raises(FileNotFoundError):
+            runner.upload_file("missing.txt", ["/tmp/a", "/tmp/b"])
+        with pytest.raises(ValueError):
+            ReplicatingServiceRunner([LocalDiskStorageFactory()], policy="majority")
@@ -0,0 +1,236 @@
+import os
+import tempfile
+import threading
+import time
+import pytest
+from pathlib import Path
+from src.backends import InMemoryObjectStore, InMemoryObjectStoreClient
+from src.client import ServiceRunner
+from src.exceptions import (
+    FileNotFoundError,
+    IntegrityError,
+    InvalidPathError,
+    PermanentStorageError,
+    StorageOperationError,
+    ThrottledError,
+    TransientStorageError,
+    classify_error
+)
+from src.factories import AmazonStorageFactory, LocalDiskStorageFactory
+from src.products.local import DiskUploader
+from src.transfer import NO_RETRY, AdaptiveConcurrencyLimiter, RetryPolicy
+
+
+def _policy(**overrides):
+    sleeps = []
+    options = dict(max_attempts=4, base_delay=0.01, sleep=sleeps.append)
+    options.update(overrides)
+    return RetryPolicy(**options), sleeps
+
+
+def _failing(*errors):
+    remaining = list(errors)
+
+    def operation():
+        if remaining:
+            raise remaining.pop(0)
+        return "done"
+    return operation
+
+
+class TestRetryPolicy:
+    def test_transient_errors_are_retried(self):
+        policy, sleeps = _policy()
+
+        assert policy.run(_failing(TransientStorageError("reset"), ConnectionError("reset"))) == "done"
+        assert len(sleeps) == 2
+        assert all(0 <= delay <= 0.02 for delay in sleeps)
+
+    def test_permanent_errors_are_not_retried(self):
+        policy, sleeps = _policy()
+
+        with pytest.raises(FileNotFoundError):
+            policy.run(_failing(FileNotFoundError("missing")))
+        with pytest.raises(StorageOperationError):
+            policy.run(_failing(StorageOperationError("unknown")))
+        assert sleeps == []
+
+    def test_gives_up_after_max_attempts(self):
+        policy, sleeps = _policy(max_attempts=3)
+
+        with pytest.raises(TransientStorageError):
+            policy.run(_failing(*[TransientStorageError("reset")] * 5))
+        assert len(sleeps) == 2
+
+    def test_deadline_stops_retries(self):
+        now = [0.0]
+        policy, sleeps = _policy(base_delay=0.5, deadline=5.0, clock=lambda: now[0])
+
+        with pytest.raises(TransientStorageError):
+            policy.run(_slow_failure(now))
+        assert len(sleeps) == 1
+        assert now[0] == 8.0
+
+    def test_retry_after_is_a_lower_bound(self):
+        policy, sleeps = _policy()
+
+        policy.run(_failing(ThrottledError("slow down", retry_after=1.5)))
+
+        assert sleeps == [1.5]
+
+    def test_classification(self):
+        assert isinstance(classify_error(ConnectionError("reset"), "Upload failed"), TransientStorageError)
+        assert classify_error(ThrottledError(retry_after=2), "Upload failed").retry_after == 2
+        assert isinstance(classify_error(FileNotFoundError("x"), "Upload failed"), PermanentStorageError)
+        for error in (FileNotFoundError("x"), IntegrityError("bad", "a", "b"), InvalidPathError("y")):
+            classified = classify_error(error, "Upload failed")
+            assert classified is not error
+            assert (type(classified), str(classified), vars(classified)) == (type(error), str(error), vars(error))
+        try:
+            raise classify_error(error, "Upload failed") from error
+        except StorageOperationError as raised:
+            assert raised.__cause__ is error and raised.__cause__ is not raised
+        assert type(classify_error(ValueError("x"), "Upload failed")) is StorageOperationError
+
+
+def _slow_failure(now):
+    def operation():
+        now[0] += 4.0
+        raise TransientStorageError("reset")
+    return operation
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_throttle_halves_once_per_epoch(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=16, maximum=32)
+        tokens = [limiter.acquire() for _ in range(4)]
+
+        for token in tokens:
+            limiter.record_throttle(token)
+
+        assert limiter.limit == 8
+        assert limiter.throttles == 4
+
+    def test_success_grows_additively(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=6)
+
+        for _ in range(40):
+            limiter.release(limiter.acquire())
+
+        assert limiter.limit == 6
+
+    def test_limit_never_drops_below_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=2)
+
+        for _ in range(5):
+            token = limiter.acquire()
+            limiter.record_throttle(token)
+            limiter.release(token, success=False)
+
+        assert limiter.limit == 2
+
+
+class FlakyClient(InMemoryObjectStoreClient):
+    failures = 0
+
+    def put_object(self, bucket, key, data, metadata=None):
+        if FlakyClient.failures:
+            FlakyClient.failures -= 1
+            raise ConnectionError("connection reset by peer")
+        return super().put_object(bucket, key, data, metadata)
+
+
+class ThrottlingUploader(DiskUploader):
+    def __init__(self, capacity):
+        super().__init__()
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+
+    def upload(self, file_path, destination, metadata=None):
+        with self._lock:
+            self._active += 1
+            active = self._active
+        try:
+            if active > self._capacity:
+                raise ThrottledError("too many requests")
+            with self._lock:
+                self.peak = max(self.peak, active)
+            time.sleep(0.005)
+            return super().upload(file_path, destination, metadata)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+class TestServiceRunnerRetries:
+    def test_transient_backend_errors_are_retried(self):
+        store = InMemoryObjectStore()
+        FlakyClient.failures = 2
+        policy, sleeps = _policy()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=lambda: FlakyClient(store)), retry_policy=policy)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("payload")
+            results = service.upload_many([(str(source_file), "s3://bucket/source.txt")])
+
+        assert results[0].success
+        assert results[0].attempts == 3
+        assert store.keys("bucket") == ["source.txt"]
+
+    def test_no_retry_policy_fails_fast(self):
+        store = InMemoryObjectStore()
+        FlakyClient.failures = 1
+        service = ServiceRunner(AmazonStorageFactory(client_factory=lambda: FlakyClient(store)), retry_policy=NO_RETRY)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "source.txt"
+            source_file.write_text("payload")
+            with pytest.raises(TransientStorageError):
+                service.upload_file(str(source_file), "s3://bucket/source.txt")
+
+    def test_limiter_backs_off_under_throttling(self):
+        uploader = ThrottlingUploader(capacity=3)
+
+        class ThrottledFactory(LocalDiskStorageFactory):
+            def create_uploader(self):
+                return uploader
+
+        limiter = AdaptiveConcurrencyLimiter(initial=12, maximum=16)
+        policy = RetryPolicy(max_attempts=50, base_delay=0.001, max_delay=0.01)
+        service = ServiceRunner(ThrottledFactory(), retry_policy=policy, limiter=limiter)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = []
+            for i in range(40):
+                source_file = Path(tmpdir) / f"{i}.bin"
+                source_file.write_bytes(os.urandom(64))
+                pairs.append((str(source_file), str(Path(tmpdir) / "out" / f"{i}.bin")))
+
+            results = service.upload_many(pairs)
+
+        assert all(results)
+        assert limiter.throttles > 0
+        assert limiter.limit < 12
+        assert uploader.peak <= 3
+
+    def test_limiter_does_not_raise_the_worker_count(self):
+        uploader = ThrottlingUploader(capacity=100)
+
+        class CountingFactory(LocalDiskStorageFactory):
+            def create_uploader(self):
+                return uploader
+
+        service = ServiceRunner(CountingFactory(), max_workers=2, limiter=AdaptiveConcurrencyLimiter(initial=16))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = []
+            for i in range(12):
+                source_file = Path(tmpdir) / f"{i}.bin"
+                source_file.write_bytes(b"x")
+                pairs.append((str(source_file), str(Path(tmpdir) / "out" / f"{i}.bin")))
+
+            assert all(service.upload_many(pairs))
+        assert uploader.peak <= 2
@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.exceptions import FileNotFoundError, InvalidPathError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, RoutingStorageFactory
+from src.interfaces import IFileDownloader
+from src.routing import LatencyTracker, Replica, RoutingDownloader
+
+
+class _FakeDownloader(IFileDownloader):
+    def __init__(self, data=b"payload", delay=0.0, error=None):
+        self.data = data
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    def download(self, source, destination):
+        raise NotImplementedError
+
+    def open_read(self, source, buffer_size=None):
+        self.calls.append(source)
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return io.BytesIO(self.data)
+
+
+def _downloader(tracker=None, **replicas):
+    return RoutingDownloader([Replica(name, f"{name}://bucket/", downloader) for name, downloader in replicas.items()],
+                             tracker, default_hedge_delay=0.05)
+
+
+class TestLatencyTracker:
+    def test_ewma_and_percentile(self):
+        tracker = LatencyTracker(alpha=0.5)
+        for latency in (0.1, 0.3, 0.1, 0.1, 0.1, 0.9):
+            tracker.record("s3", latency)
+
+        assert tracker.stats("s3").latency == pytest.approx(0.50625)
+        assert tracker.hedge_delay("s3") == 0.9
+        assert tracker.hedge_delay("gcs") is None
+
+    def test_errors_raise_the_score(self):
+        tracker = LatencyTracker()
+        tracker.record("s3", 0.1)
+        tracker.record("gcs", 0.1)
+        tracker.record("gcs", 0.1, success=False)
+
+        assert tracker.score("gcs") > tracker.score("s3")
+        assert tracker.score("unseen") == 0.0
+
+
+class TestRoutingDownloader:
+    def test_hedges_to_second_replica_when_primary_is_slow(self):
+        slow, fast = _FakeDownloader(b"slow", delay=1.0), _FakeDownloader(b"fast")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = os.path.join(tmpdir, "out.bin")
+            started = time.perf_counter()
+            assert _downloader(s3=slow, gs=fast).download("s3://bucket/a.bin", destination)
+
+            assert time.perf_counter() - started < 0.5
+            assert Path(destination).read_bytes() == b"fast"
+            assert fast.calls == ["gs://bucket/a.bin"]
+            time.sleep(1.1)
+            assert os.listdir(tmpdir) == ["out.bin"]
+
+    def test_fails_over_when_primary_errors(self):
+        missing = _FakeDownloader(error=FileNotFoundError("missing"))
+        backup = _FakeDownloader(b"backup")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = os.path.join(tmpdir, "out.bin")
+            assert _downloader(s3=missing, gs=backup).download("s3://bucket/a.bin", destination)
+            assert Path(destination).read_bytes() == b"backup"
+
+    def test_routes_to_the_fastest_replica(self):
+        tracker = LatencyTracker()
+        for _ in range(5):
+            tracker.record("s3", 0.5)
+            tracker.record("gs", 0.01)
+        s3, gs = _FakeDownloader(b"s3"), _FakeDownloader(b"gs")
+
+        with _downloader(tracker, s3=s3, gs=gs).open_read("s3://bucket/a.bin") as readable:
+            assert readable.read() == b"gs"
+        assert s3.calls == []
+
+    def test_raises_first_error_when_every_replica_fails(self):
+        downloader = _downloader(s3=_FakeDownloader(error=FileNotFoundError("s3 missing")),
+                                 gs=_FakeDownloader(error=ConnectionError("gcs down")))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                downloader.download("s3://bucket/a.bin", os.path.join(tmpdir, "out.bin"))
+            assert os.listdir(tmpdir) == []
+        with pytest.raises(InvalidPathError):
+            downloader.download("file:///elsewhere/a.bin", "out.bin")
+
+
+class TestRoutingStorageFactory:
+    def test_downloads_from_any_replica(self):
+        s3, gcs = InMemoryObjectStore(), InMemoryObjectStore()
+        gcs.client().put_object("mirror", "data/a.txt", b"hello")
+        factory = RoutingStorageFactory([
+            (AmazonStorageFactory(client_factory=s3.client), "s3://primary/data/"),
+            (GoogleStorageFactory(client_factory=gcs.client), "gs://mirror/data/"),
+        ])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = os.path.join(tmpdir, "a.txt")
+            assert factory.create_downloader().download("s3://primary/data/a.txt", destination)
+            assert Path(destination).read_bytes() == b"hello"
+        assert factory.tracker.stats("s3://primary/data/").errors == 1
+        factory.close()
@@ -18,7 +18,7 @@ class TestServiceRunner:
             
             result = service.upload_file(str(source_file), str(dest_file))
             
-            assert result is True
+            assert result
             assert dest_file.exists()
 
     def test_download_file_with_local_factory(self):
@@ -32,7 +32,7 @@ class TestServiceRunner:
             
             result = service.download_file(str(source_file), str(dest_file))
             
-            assert result is True
+            assert result
             assert dest_file.exists()
 
     def test_upload_file_with_amazon_factory(self):
@@ -44,7 +44,7 @@ class TestServiceRunner:
             source_file.write_text("test content")
             
             result = service.upload_file(str(source_file), "s3://bucket/test.txt")
-            assert result is True
+            assert result
 
     def test_service_runner_raises_exception_on_invalid_file(self):
         factory = LocalDiskStorageFactory()
@@ -53,3 +53,56 @@ class TestServiceRunner:
         with pytest.raises(FileNotFoundError):
             service.upload_file("/nonexistent/file.txt", "/tmp/dest.txt")
 
+
+
+class TestServiceRunnerBatch:
+    def test_upload_many_with_local_factory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pairs = []
+            for i in range(20):
+                source_file = Path(tmpdir) / f"file_{i}.txt"
+                source_file.write_text("x" * i)
+                pairs.append((str(source_file), str(Path(tmpdir) / "uploaded" / f"file_{i}.txt")))
+
+            service = ServiceRunner(LocalDiskStorageFactory(), max_workers=4, max_in_flight=6)
+            results = service.upload_many(pairs)
+
+            assert len(results) == 20
+            assert all(result.success for result in results)
+            assert [result.source for result in results] == [source for source, _ in pairs]
+            assert [result.bytes_transferred for result in results] == list(range(20))
+            assert all(Path(destination).exists() for _, destination in pairs)
+
+    def test_download_many_reports_per_item_failures(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "test.txt"
+            source_file.write_text("test content")
+
+            pairs = [
+                (str(source_file), str(Path(tmpdir) / "downloaded" / "a.txt")),
+                ("/nonexistent/file.txt", str(Path(tmpdir) / "downloaded" / "b.txt")),
+                (str(source_file), str(Path(tmpdir) / "downloaded" / "c.txt")),
+            ]
+            service = ServiceRunner(LocalDiskStorageFactory())
+            results = service.download_many(pairs, max_workers=2)
+
+            assert [bool(result) for result in results] == [True, False, True]
+            assert isinstance(results[1].error, FileNotFoundError)
+            assert results[0].bytes_transferred == len("test content")
+            assert results[1].bytes_transferred == 0
+
+    def test_upload_many_accepts_generator(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "test.txt"
+            source_file.write_text("test content")
+
+            service = ServiceRunner(AmazonStorageFactory(), max_workers=2)
+            pairs = ((str(source_file), f"s3://bucket/{i}.txt") for i in range(10))
+            results = service.upload_many(pairs)
+
+            assert len(results) == 10
+            assert all(result.success for result in results)
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            ServiceRunner(LocalDiskStorageFactory(), max_workers=0)
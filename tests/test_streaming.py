@@ -0,0 +1,118 @@
+import io
+import os
+import tempfile
+import pytest
+from pathlib import Path
+from src.backends import ConnectionPool, InMemoryObjectStore
+from src.exceptions import StorageOperationError
+from src.factories import AmazonStorageFactory, GoogleStorageFactory, LocalDiskStorageFactory
+from src.transfer import ChunkedTransfer, MultipartAssembler
+from src.utils.streams import ChunkReader, read_exactly
+
+
+def _chunks(payload: bytes, size: int):
+    for offset in range(0, len(payload), size):
+        yield payload[offset:offset + size]
+
+
+class TestStreamHelpers:
+    def test_chunk_reader_spans_chunk_boundaries(self):
+        reader = io.BufferedReader(ChunkReader([b"ab", b"", b"cdef", b"g"]), 3)
+
+        assert reader.read(5) == b"abcde"
+        assert reader.read() == b"fg"
+
+    def test_read_exactly_loops_over_short_reads(self):
+        assert read_exactly(ChunkReader([b"a", b"bc", b"d"]), 3) == b"abc"
+        assert read_exactly(ChunkReader([b"a"]), 3) == b"a"
+
+
+class TestLocalStreaming:
+    def test_stream_round_trip(self):
+        payload = os.urandom(300 * 1024)
+        factory = LocalDiskStorageFactory()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / "out" / "dump.bin"
+            assert factory.create_uploader().upload_stream(io.BytesIO(payload), str(destination))
+
+            assert destination.read_bytes() == payload
+            assert not Path(f"{destination}.partial").exists()
+            chunks = list(factory.create_downloader().iter_chunks(str(destination), 64 * 1024))
+            assert b"".join(chunks) == payload
+            assert max(len(chunk) for chunk in chunks) == 64 * 1024
+
+    def test_failed_stream_leaves_no_file(self):
+        def broken():
+            yield b"partial"
+            raise IOError("producer died")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = Path(tmpdir) / "dump.bin"
+            with pytest.raises(StorageOperationError):
+                LocalDiskStorageFactory().create_uploader().upload_chunks(broken(), str(destination))
+
+            assert list(Path(tmpdir).iterdir()) == []
+
+
+class TestCloudStreaming:
+    @pytest.mark.parametrize("factory_class, scheme", [(AmazonStorageFactory, "s3"), (GoogleStorageFactory, "gs")])
+    def test_chunk_upload_and_streaming_read(self, factory_class, scheme):
+        store = InMemoryObjectStore()
+        factory = factory_class(client_factory=store.client, part_size=64 * 1024, max_concurrency=2)
+        payload = os.urandom(200 * 1024 + 17)
+
+        assert factory.create_uploader().upload_chunks(_chunks(payload, 10_000), f"{scheme}://bucket/dump.bin")
+        assert store.keys("bucket") == ["dump.bin"]
+
+        with factory.create_downloader().open_read(f"{scheme}://bucket/dump.bin", 32 * 1024) as reader:
+            assert reader.read(100) == payload[:100]
+            reader.seek(150 * 1024)
+            assert reader.read() == payload[150 * 1024:]
+
+    def test_small_stream_is_a_single_put(self):
+        store = InMemoryObjectStore()
+        factory = AmazonStorageFactory(client_factory=store.client, part_size=64 * 1024)
+
+        factory.create_uploader().upload_stream(io.BytesIO(b"tiny"), "s3://bucket/tiny.txt")
+
+        assert store.client().get_object("bucket", "tiny.txt") == b"tiny"
+        assert store.request_count == 2
+
+    def test_memory_is_bounded_by_parts_in_flight(self):
+        store = InMemoryObjectStore()
+        pool = ConnectionPool(store.client)
+        part_size, concurrency = 16 * 1024, 2
+        consumed = []
+
+        def produce():
+            for i in range(20):
+                consumed.append(i)
+                yield os.urandom(part_size)
+
+        class Recorder(MultipartAssembler):
+            peak = 0
+
+            def upload_part(self, client, bucket, key, session, part, data):
+                Recorder.peak = max(Recorder.peak, len(consumed) - part.number)
+                return super().upload_part(client, bucket, key, session, part, data)
+
+        transfer = ChunkedTransfer(Recorder(), part_size, concurrency)
+        size = transfer.upload_stream(pool, ChunkReader(produce()), "bucket", "big.bin")
+
+        assert size == 20 * part_size
+        assert Recorder.peak <= concurrency + 1
+
+    def test_failed_stream_aborts_multipart_upload(self):
+        store = InMemoryObjectStore()
+        factory = AmazonStorageFactory(client_factory=store.client, part_size=16 * 1024)
+
+        def broken():
+            yield os.urandom(40 * 1024)
+            raise IOError("producer died")
+
+        with pytest.raises(StorageOperationError):
+            factory.create_uploader().upload_chunks(broken(), "s3://bucket/broken.bin")
+
+        assert store.pending_uploads() == 0
+        assert store.keys("bucket") == []
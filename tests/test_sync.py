@@ -0,0 +1,148 @@
+import os
+import tempfile
+from pathlib import Path
+from src.backends import InMemoryObjectStore
+from src.client import ServiceRunner
+from src.factories import AmazonStorageFactory, LocalDiskStorageFactory
+from src.products.amazon.s3_inspector import S3Inspector
+
+
+def _make_tree(root: Path) -> None:
+    (root / "nested" / "deeper").mkdir(parents=True)
+    (root / "a.txt").write_text("alpha")
+    (root / "nested" / "b.txt").write_text("bravo")
+    (root / "nested" / "deeper" / "c.bin").write_bytes(os.urandom(2048))
+
+
+class TestLocalSync:
+    def test_copies_whole_tree(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source, target = Path(tmpdir) / "source", Path(tmpdir) / "target"
+            _make_tree(source)
+            service = ServiceRunner(LocalDiskStorageFactory())
+
+            report = service.sync(str(source), str(target))
+
+            assert len(report.transfers) == 3
+            assert not report.failed
+            assert report.bytes_transferred == 5 + 5 + 2048
+            assert (target / "nested" / "deeper" / "c.bin").read_bytes() == \
+                (source / "nested" / "deeper" / "c.bin").read_bytes()
+
+    def test_second_run_only_transfers_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source, target = Path(tmpdir) / "source", Path(tmpdir) / "target"
+            _make_tree(source)
+            service = ServiceRunner(LocalDiskStorageFactory())
+            service.sync(str(source), str(target))
+
+            (source / "nested" / "b.txt").write_text("bravo, changed")
+            report = service.sync(str(source), str(target))
+
+            assert report.transfers == [(str(source / "nested" / "b.txt"), str(target / "nested" / "b.txt"))]
+            assert report.unchanged == 2
+            assert (target / "nested" / "b.txt").read_text() == "bravo, changed"
+
+    def test_delete_removes_extraneous_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source, target = Path(tmpdir) / "source", Path(tmpdir) / "target"
+            _make_tree(source)
+            service = ServiceRunner(LocalDiskStorageFactory())
+            service.sync(str(source), str(target))
+            (target / "stale.txt").write_text("stale")
+
+            kept = service.sync(str(source), str(target))
+            assert kept.deleted == []
+            assert (target / "stale.txt").exists()
+
+            report = service.sync(str(source), str(target), delete=True)
+            assert report.deleted == [str(target / "stale.txt")]
+            assert not (target / "stale.txt").exists()
+
+    def test_dry_run_reports_without_touching_target(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source, target = Path(tmpdir) / "source", Path(tmpdir) / "target"
+            _make_tree(source)
+            target.mkdir()
+            (target / "stale.txt").write_text("stale")
+            service = ServiceRunner(LocalDiskStorageFactory())
+
+            report = service.sync(str(source), str(target), delete=True, dry_run=True)
+
+            assert report.dry_run
+            assert len(report.transfers) == 3
+            assert report.results == []
+            assert report.deleted == [str(target / "stale.txt")]
+            assert sorted(p.name for p in target.iterdir()) == ["stale.txt"]
+
+
+class TestCloudSync:
+    def test_upload_then_download_prefix(self):
+        store = InMemoryObjectStore()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source, restored = Path(tmpdir) / "source", Path(tmpdir) / "restored"
+            _make_tree(source)
+
+            uploaded = service.sync(str(source), "s3://bucket/backup")
+            assert not uploaded.failed
+            assert store.keys("bucket") == ["backup/a.txt", "backup/nested/b.txt", "backup/nested/deeper/c.bin"]
+
+            again = service.sync(str(source), "s3://bucket/backup/")
+            assert again.transfers == []
+            assert again.unchanged == 3
+
+            downloaded = service.sync("s3://bucket/backup", str(restored))
+            assert len(downloaded.transfers) == 3
+            assert (restored / "nested" / "b.txt").read_text() == "bravo"
+
+            again = service.sync("s3://bucket/backup", str(restored))
+            assert again.transfers == []
+
+    def test_same_size_edit_without_remote_hash_is_transferred(self):
+        store = InMemoryObjectStore()
+        client = store.client()
+        upload_id = client.create_multipart_upload("bucket", "backup/a.txt")
+        etag = client.upload_part("bucket", "backup/a.txt", upload_id, 1, b"alpha")
+        client.complete_multipart_upload("bucket", "backup/a.txt", upload_id, [(1, etag)])
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "source"
+            source.mkdir()
+            (source / "a.txt").write_text("ALPHA")
+
+            report = service.sync(str(source), "s3://bucket/backup")
+
+            assert report.transfers == [(str(source / "a.txt"), "s3://bucket/backup/a.txt")]
+            assert client.get_object("bucket", "backup/a.txt") == b"ALPHA"
+
+    def test_delete_removes_extraneous_objects(self):
+        store = InMemoryObjectStore()
+        store.client().put_object("bucket", "backup/orphan.txt", b"orphan")
+        store.client().put_object("bucket", "backup-other/keep.txt", b"keep")
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "source"
+            _make_tree(source)
+
+            report = service.sync(str(source), "s3://bucket/backup", delete=True)
+
+            assert report.deleted == ["s3://bucket/backup/orphan.txt"]
+            assert "backup/orphan.txt" not in store.keys("bucket")
+            assert "backup-other/keep.txt" in store.keys("bucket")
+
+    def test_listing_follows_pagination(self):
+        store = InMemoryObjectStore()
+        for i in range(7):
+            store.client().put_object("bucket", f"logs/{i:02d}.log", b"x")
+        factory = AmazonStorageFactory(client_factory=store.client)
+        inspector = factory.create_inspector()
+        inspector.PAGE_SIZE = 3
+
+        listed = [entry.path for entry in inspector.list_files("s3://bucket/logs")]
+
+        assert isinstance(inspector, S3Inspector)
+        assert listed == [f"s3://bucket/logs/{i:02d}.log" for i in range(7)]
@@ -0,0 +1,78 @@
+import tempfile
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import BatchItemResult, ServiceRunner, TransferAggregator, summarize
+from src.factories import AmazonStorageFactory, LocalDiskStorageFactory
+from src.interfaces import TransferResult
+
+
+class TestTransferResult:
+    def test_result_is_truthy_immutable_and_compact(self):
+        result = TransferResult("a.txt", "b.txt", 2000, started_ns=10, duration_ns=2_000_000)
+        assert result
+        assert result.duration == 0.002
+        assert result.throughput == 1_000_000
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.bytes_transferred = 0
+        assert result == TransferResult("a.txt", "b.txt", 2000, started_ns=10, duration_ns=2_000_000)
+
+    def test_providers_and_runner_return_results(self):
+        store = InMemoryObjectStore()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "data.bin"
+            source_file.write_bytes(b"x" * 4096)
+
+            local = ServiceRunner(LocalDiskStorageFactory()).upload_file(str(source_file), f"{tmpdir}/out/data.bin")
+            assert local.bytes_transferred == 4096
+            assert local.strategy and local.duration_ns > 0
+
+            service = ServiceRunner(AmazonStorageFactory(client_factory=store.client))
+            uploaded = service.upload_file(str(source_file), "s3://bucket/data.bin")
+            downloaded = service.download_file("s3://bucket/data.bin", f"{tmpdir}/back/data.bin")
+            assert uploaded.bytes_transferred == downloaded.bytes_transferred == 4096
+            assert uploaded.destination == "s3://bucket/data.bin"
+
+            mocked = ServiceRunner(AmazonStorageFactory()).upload_file(str(source_file), "s3://bucket/data.bin")
+            assert mocked.strategy == "mock"
+
+    def test_dedup_skip_is_reported(self):
+        store = InMemoryObjectStore()
+        service = ServiceRunner(AmazonStorageFactory(client_factory=store.client), dedup=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_file = Path(tmpdir) / "data.bin"
+            source_file.write_bytes(b"same")
+            assert not service.upload_file(str(source_file), "s3://bucket/data.bin").skipped
+            skipped = service.upload_file(str(source_file), "s3://bucket/data.bin")
+            assert skipped and skipped.skipped
+
+
+class TestTransferSummary:
+    def test_summarize_rolls_up_throughput_and_latency(self):
+        millis = 1_000_000
+        results = [TransferResult(f"s{i}", f"d{i}", 1000, started_ns=(i + 1) * millis, duration_ns=(i + 1) * millis)
+                   for i in range(100)]
+        summary = summarize(results)
+        assert summary.count == summary.succeeded == 100
+        assert summary.bytes_transferred == 100_000
+        assert summary.latency_p50 == 0.050
+        assert summary.latency_p95 == 0.095
+        assert summary.latency_p99 == 0.099
+        assert summary.latency_max == 0.100
+        assert summary.elapsed == pytest.approx(0.199)
+        assert summary.throughput == pytest.approx(100_000 / 0.199)
+
+    def test_batch_results_failures_and_skips(self):
+        aggregator = TransferAggregator()
+        aggregator.extend([
+            BatchItemResult("a", "b", True, bytes_transferred=500, duration=0.5),
+            BatchItemResult("c", "d", False, error=RuntimeError("boom"), duration=1.0),
+            BatchItemResult("e", "f", True, duration=0.01, skipped=True, bytes_saved=10),
+        ])
+        summary = aggregator.summary()
+        assert len(aggregator) == 3
+        assert (summary.failed, summary.skipped, summary.bytes_transferred) == (1, 1, 500)
+        assert summary.elapsed == summary.busy == 0.5
+        assert summary.throughput == 1000
+        assert summarize([], elapsed=1.0).throughput == 0.0
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+import pytest
+from src.backends import InMemoryObjectStore
+from src.client import BatchItemResult, ServiceRunner, WriteBehindQueue
+from src.exceptions import PermanentStorageError
+from src.factories import AmazonStorageFactory
+from src.instrumentation import InMemoryMetricsSink, clear_sinks, register_sink
+
+
+def _write(directory, name, content):
+    path = Path(directory) / name
+    path.write_text(content)
+    return str(path)
+
+
+class TestWriteBehind:
+    def test_upload_file_spools_and_flush_delivers(self):
+        store = InMemoryObjectStore()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_dir = os.path.join(tmpdir, "spool")
+            service = ServiceRunner(AmazonStorageFactory(client_factory=store.client), spool_dir=spool_dir)
+            source = _write(tmpdir, "report.csv", "a,b,c")
+
+            assert service.upload_file(source, "s3://bucket/report.csv")
+            Path(source).write_text("changed after spooling")
+            assert service.flush(timeout=10)
+
+            assert store.client().get_object("bucket", "report.csv") == b"a,b,c"
+            assert service.spool.delivered == 1
+            assert service.spool.depth == 0
+            assert sorted(os.listdir(spool_dir)) == ["failed"]
+            service.close()
+
+    def test_pending_items_are_recovered_after_a_crash(self):
+        release = threading.Event()
+        delivered = []
+
+        def stalled(pairs):
+            release.wait(10)
+            return [BatchItemResult(source, destination, True) for source, destination in pairs]
+
+        def deliver(pairs):
+            delivered.extend(destination for _, destination in pairs)
+            return [BatchItemResult(source, destination, True) for source, destination in pairs]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_dir, crashed_dir = os.path.join(tmpdir, "spool"), os.path.join(tmpdir, "crashed")
+            queue = WriteBehindQueue(spool_dir, stalled, fsync=False)
+            for i in range(3):
+                queue.enqueue(_write(tmpdir, f"{i}.txt", str(i)), f"s3://bucket/{i}.txt")
+            shutil.copytree(spool_dir, crashed_dir)
+            Path(crashed_dir, "orphan.data").write_text("no record")
+            release.set()
+            queue.close()
+
+            recovered = WriteBehindQueue(crashed_dir, deliver, fsync=False)
+            assert recovered.recovered == 3
+            assert recovered.flush(timeout=10)
+            recovered.close()
+
+            assert delivered == [f"s3://bucket/{i}.txt" for i in range(3)]
+            assert sorted(os.listdir(crashed_dir)) == ["failed"]
+
+    def test_failed_items_are_quarantined_and_can_be_retried(self):
+        attempts = []
+
+        def deliver(pairs):
+            attempts.append(len(pairs))
+            success = len(attempts) > 1
+            return [BatchItemResult(source, destination, success,
+                                    error=None if success else PermanentStorageError("denied"))
+                    for source, destination in pairs]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_dir = os.path.join(tmpdir, "spool")
+            queue = WriteBehindQueue(spool_dir, deliver, fsync=False)
+            queue.enqueue(_write(tmpdir, "a.txt", "a"), "s3://bucket/a.txt")
+            queue.flush(timeout=10)
+
+            assert queue.failed == 1
+            assert len(os.listdir(os.path.join(spool_dir, "failed"))) == 2
+            assert queue.retry_failed() == 1
+            assert queue.flush(timeout=10)
+            assert queue.delivered == 1
+            assert os.listdir(os.path.join(spool_dir, "failed")) == []
+            queue.close()
+
+    def test_items_without_a_result_are_quarantined(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_dir = os.path.join(tmpdir, "spool")
+            queue = WriteBehindQueue(spool_dir, lambda pairs: [], fsync=False)
+            queue.enqueue(_write(tmpdir, "a.txt", "a"), "s3://bucket/a.txt")
+            queue.enqueue(_write(tmpdir, "b.txt", "b"), "s3://bucket/b.txt")
+            assert queue.flush(timeout=10)
+
+            assert (queue.delivered, queue.failed) == (0, 2)
+            assert sorted(os.listdir(spool_dir)) == ["failed"]
+            assert len(os.listdir(os.path.join(spool_dir, "failed"))) == 4
+            queue.close()
+
+    def test_enqueue_after_close_leaves_nothing_spooled(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_dir = os.path.join(tmpdir, "spool")
+            queue = WriteBehindQueue(spool_dir, lambda pairs: [], fsync=False)
+            write_record = queue._write_record
+
+            def close_while_spooling(item):
+                write_record(item)
+                queue.close(drain=False)
+
+            queue._write_record = close_while_spooling
+            with pytest.raises(RuntimeError):
+                queue.enqueue(_write(tmpdir, "a.txt", "a"), "s3://bucket/a.txt")
+            assert sorted(os.listdir(spool_dir)) == ["failed"]
+
+            with pytest.raises(RuntimeError):
+                queue.enqueue(_write(tmpdir, "b.txt", "b"), "s3://bucket/b.txt")
+            assert sorted(os.listdir(spool_dir)) == ["failed"]
+            reopened = WriteBehindQueue(spool_dir, lambda pairs: [], fsync=False)
+            assert reopened.recovered == 0
+            reopened.close()
+
+    def test_hardlink_spooling_and_depth_metrics(self):
+        sink = register_sink(InMemoryMetricsSink())
+        release = threading.Event()
+
+        def deliver(pairs):
+            release.wait(10)
+            return [BatchItemResult(source, destination, True) for source, destination in pairs]
+
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                source = _write(tmpdir, "a.txt", "a")
+                queue = WriteBehindQueue(os.path.join(tmpdir, "spool"), deliver, hardlink=True, fsync=False)
+                queue.enqueue(source, "s3://bucket/a.txt")
+                queue.enqueue(source, "s3://bucket/b.txt")
+
+                assert os.stat(source).st_nlink == 3
+                assert queue.depth == 2
+                assert sink.gauge_value("storage_spool_depth") == 2
+                release.set()
+                queue.close()
+
+                assert sink.gauge_value("storage_spool_depth") == 0
+                assert sink.counter("storage_spool_items_total", outcome="delivered") == 2
+                assert sink.histogram("storage_spool_wait_seconds").count == 2
+        finally:
+            clear_sinks()